@@ -6,6 +6,7 @@ if "bpy" in locals():
                 manual,
                 preferences,
                 properties,
+                handlers,
                 ]:
         importlib.reload(mod)
     print("Add-on Reloaded: Bool Tool")
@@ -18,6 +19,7 @@ else:
         manual,
         preferences,
         properties,
+        handlers,
     )
 
 
@@ -30,6 +32,7 @@ modules = (
     manual,
     preferences,
     properties,
+    handlers,
 )
 
 def register():
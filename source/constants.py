@@ -3,6 +3,14 @@ import os
 
 # Paths
 ICONS_PATH = os.path.join(os.path.dirname(__file__), "ui", "icons")
+ASSETS_PATH = os.path.join(os.path.dirname(__file__), "assets.blend")
+
+# Node group assets used by cutter effects, and .blend files they're loaded from.
+# NOTE: Relative paths are in Blender's bundled (Essentials) asset library.
+NODE_GROUP_ASSETS = {
+    "cutter_array": ASSETS_PATH,
+    "Smooth by Angle": os.path.join("nodes", "geometry_nodes_essentials.blend"),
+}
 
 # Object types that can have evaluated mesh, and can be converted to Mesh.
 CONVERTABLE_TYPES = (
@@ -13,3 +21,66 @@ CONVERTABLE_TYPES = (
     # 'GREASEPENCIL'   # Doesn't work in Blender 5.2
     'EMPTY',
 )
+
+# Modifiers that multiply the amount of geometry (making Boolean modifiers that come after them slower).
+MULTIPLYING_MODIFIERS = (
+    'SUBSURF',
+    'MULTIRES',
+    'BEVEL',
+)
+
+# Name of the Geometry Nodes modifier that displays the stored result instead of evaluating the modifier stack.
+RESULT_MODIFIER = "boolean_result"
+
+# Reasons for which modifiers are suspended while stored result is displayed instead of them.
+RESULT_REASONS = (
+    'CACHE',
+    'CHECKPOINT',
+    'FREEZE',
+)
+
+# Operations of Boolean modifiers that can be culled in the viewport (they only change the canvas inside cutter bounds).
+# NOTE: Intersect modifiers are never culled, because they change the whole canvas, not just the part near the cutter.
+CULLED_OPERATIONS = (
+    'DIFFERENCE',
+    'UNION',
+)
+
+# Minimum number of faces of canvases that are replaced by proxies during the modal with interactive fidelity.
+INTERACTIVE_FIDELITY_FACES = 50000
+
+# Suffix of the name of the viewport-only copy of the Boolean modifier, which uses the cheaper solver.
+# NOTE: Modifier itself keeps the configured solver, and is only disabled in the viewport (for the 'FIDELITY' reason).
+VIEWPORT_MODIFIER_SUFFIX = ".viewport"
+
+# Name of the Decimate modifier that replaces heavy cutters with their low-poly proxy in the viewport.
+PROXY_MODIFIER = "boolean_proxy"
+
+# Modifiers whose result changes over time on its own (simulations, caches, procedural animation).
+TIME_DEPENDENT_MODIFIERS = (
+    'BUILD',
+    'CLOTH',
+    'DYNAMIC_PAINT',
+    'EXPLODE',
+    'FLUID',
+    'MESH_CACHE',
+    'MESH_SEQUENCE_CACHE',
+    'OCEAN',
+    'PARTICLE_INSTANCE',
+    'PARTICLE_SYSTEM',
+    'SOFT_BODY',
+    'WAVE',
+)
+
+# Properties that define the transform of the object, animating them moves the object.
+TRANSFORM_PROPERTIES = (
+    'location',
+    'rotation_euler',
+    'rotation_quaternion',
+    'rotation_axis_angle',
+    'scale',
+    'delta_location',
+    'delta_rotation_euler',
+    'delta_rotation_quaternion',
+    'delta_scale',
+)
@@ -0,0 +1,236 @@
+import bpy
+
+from ..constants import (
+    RESULT_MODIFIER,
+    TIME_DEPENDENT_MODIFIERS,
+    TRANSFORM_PROPERTIES,
+)
+from .modifier import (
+    is_modifier_enabled,
+)
+
+
+#### ------------------------------ /list/ ------------------------------ ####
+
+def list_animated_paths(id_data) -> list:
+    """
+    Returns the list of data paths of the ID that are animated by its action or drivers.
+    NOTE: NLA strips can animate anything, so for IDs with NLA tracks the list contains "*".
+    """
+
+    anim = getattr(id_data, "animation_data", None)
+    if anim is None:
+        return []
+
+    paths = [driver.data_path for driver in anim.drivers]
+    if len(anim.nla_tracks) > 0:
+        paths.append("*")
+
+    action = anim.action
+    if action is None:
+        return paths
+
+    # Layered actions (Blender 4.4+) store F-Curves per slot.
+    if getattr(action, "layers", None):
+        for layer in action.layers:
+            for strip in layer.strips:
+                for channelbag in strip.channelbags:
+                    if channelbag.slot == anim.action_slot:
+                        paths.extend(fcurve.data_path for fcurve in channelbag.fcurves)
+    else:
+        paths.extend(fcurve.data_path for fcurve in action.fcurves)
+
+    return paths
+
+
+def list_modifier_objects(mod) -> list:
+    """Returns the list of objects that modifier uses (cutters, mirror objects, deformers, etc.)."""
+
+    objects = []
+    for prop in mod.bl_rna.properties:
+        if prop.type != 'POINTER':
+            continue
+
+        value = getattr(mod, prop.identifier, None)
+        if isinstance(value, bpy.types.Object):
+            objects.append(value)
+        elif isinstance(value, bpy.types.Collection):
+            objects.extend(value.all_objects)
+
+    return objects
+
+
+
+#### ------------------------------ /poll/ ------------------------------ ####
+
+def is_transform_animated(obj) -> bool:
+    """Checks whether the transform of the object (relative to its parent) can change over time."""
+
+    for path in list_animated_paths(obj):
+        if path == "*" or path in TRANSFORM_PROPERTIES:
+            return True
+
+    # Constraints, rigid bodies and parenting to bones or vertices can move the object without animating it.
+    if any(con.enabled for con in obj.constraints):
+        return True
+    if obj.rigid_body is not None:
+        return True
+    if obj.parent is not None and obj.parent_type != 'OBJECT':
+        return True
+
+    return False
+
+
+def is_geometry_animated(obj) -> bool:
+    """Checks whether the geometry of the object (before it's transformed) can change over time."""
+
+    # Animated modifier properties, animated pose (i.e. armatures that deform canvases), or animated data (i.e. shape keys).
+    for path in list_animated_paths(obj):
+        if path == "*" or path.startswith(("modifiers[", "pose.")):
+            return True
+    if obj.data and list_animated_paths(obj.data):
+        return True
+    if obj.type == 'MESH' and obj.data.shape_keys and list_animated_paths(obj.data.shape_keys):
+        return True
+
+    for mod in obj.modifiers:
+        if not is_modifier_enabled(obj, mod):
+            continue
+        if mod.type in TIME_DEPENDENT_MODIFIERS:
+            return True
+
+        # Textures (i.e. of the Displace modifier) can be animated, or be image sequences and movies.
+        if getattr(mod, "texture", None) is not None:
+            return True
+
+        # Objects used by Geometry Nodes aren't listed as modifier properties, so they can't be checked.
+        if mod.type == 'NODES' and mod.node_group:
+            if _is_node_group_animated(mod.node_group, set()):
+                return True
+            if _is_node_group_reading_objects(mod.node_group, set(), is_modifier=True):
+                return True
+
+    # Bones can be moved by constraints without animating them.
+    if obj.pose and any(con.enabled for bone in obj.pose.bones for con in bone.constraints):
+        return True
+
+    return False
+
+
+def is_relative_transform_static(obj, other) -> bool:
+    """
+    Checks whether the transform of the `other` object relative to the `obj` stays the same over time.
+    That's the case when nothing between them and their nearest common parent is animated,
+    i.e. when cutters are parented to the canvas, and canvas is animated.
+    """
+
+    chain = _list_parent_chain(obj)
+    other_chain = _list_parent_chain(other)
+
+    common = None
+    for parent in chain:
+        if parent in other_chain:
+            common = parent
+            break
+
+    for ob in _chain_until(chain, common) + _chain_until(other_chain, common):
+        if is_transform_animated(ob):
+            return False
+
+    return True
+
+
+def is_static_stack(canvas) -> bool:
+    """
+    Checks whether the result of the canvas modifier stack (in its local space) stays the same on every frame,
+    i.e. when geometry of the canvas and the cutters, and their transforms relative to the canvas, aren't animated.
+    """
+
+    return _is_static_object(canvas, set())
+
+
+def _is_static_object(obj, visited: set) -> bool:
+    """Checks whether the evaluated geometry of the object (in its local space) stays the same on every frame."""
+
+    if obj in visited:
+        return True
+    visited.add(obj)
+
+    if is_geometry_animated(obj):
+        return False
+
+    for mod in obj.modifiers:
+        if mod.name == RESULT_MODIFIER or not is_modifier_enabled(obj, mod):
+            continue
+
+        for other in list_modifier_objects(mod):
+            if not is_relative_transform_static(obj, other):
+                return False
+            if not _is_static_object(other, visited):
+                return False
+
+    return True
+
+
+def _is_node_group_animated(node_group, visited: set) -> bool:
+    """Checks whether the Geometry Nodes node group (or any nested one) depends on the scene time."""
+
+    if node_group in visited:
+        return False
+    visited.add(node_group)
+
+    for node in node_group.nodes:
+        if node.bl_idname in ('GeometryNodeInputSceneTime', 'GeometryNodeSimulationInput'):
+            return True
+        if node.type == 'GROUP' and node.node_tree:
+            if _is_node_group_animated(node.node_tree, visited):
+                return True
+
+    return False
+
+
+def _is_node_group_reading_objects(node_group, visited: set, is_modifier=False) -> bool:
+    """
+    Checks whether the Geometry Nodes node group (or any nested one) reads the geometry or transforms of other objects,
+    i.e. through Object or Collection inputs of the modifier, or through Object Info and Collection Info nodes.
+    """
+
+    if node_group in visited:
+        return False
+    visited.add(node_group)
+
+    if is_modifier:
+        for item in node_group.interface.items_tree:
+            if item.item_type != 'SOCKET' or item.in_out != 'INPUT':
+                continue
+            if item.socket_type in ('NodeSocketObject', 'NodeSocketCollection'):
+                return True
+
+    for node in node_group.nodes:
+        if node.bl_idname in ('GeometryNodeObjectInfo', 'GeometryNodeCollectionInfo'):
+            return True
+        if node.type == 'GROUP' and node.node_tree:
+            if _is_node_group_reading_objects(node.node_tree, visited):
+                return True
+
+    return False
+
+
+def _list_parent_chain(obj) -> list:
+    """Returns the list of the object and all its parents (from the object up)."""
+
+    chain = []
+    while obj is not None and obj not in chain:
+        chain.append(obj)
+        obj = obj.parent
+
+    return chain
+
+
+def _chain_until(chain: list, parent) -> list:
+    """Returns the part of the parent chain that comes before the given parent (or the whole chain)."""
+
+    if parent is None:
+        return chain
+
+    return chain[:chain.index(parent)]
@@ -0,0 +1,86 @@
+import bpy
+import os
+
+from ..constants import (
+    NODE_GROUP_ASSETS,
+)
+
+
+# Assets that couldn't be loaded in this session (so that missing files aren't searched for again).
+_missing_assets = set()
+
+
+#### ------------------------------ /path/ ------------------------------ ####
+
+def get_asset_path(asset: str) -> str:
+    """Returns the absolute path of the .blend file which the node group asset is loaded from."""
+
+    path = NODE_GROUP_ASSETS[asset]
+    if os.path.isabs(path):
+        return path
+
+    # NOTE: `system_resource` only resolves existing directories (it returns an empty string for files).
+    folder = bpy.utils.system_resource('DATAFILES', path="assets")
+    if not folder:
+        return ""
+
+    return os.path.join(folder, path)
+
+
+
+#### ------------------------------ FUNCTIONS ------------------------------ ####
+
+def get_node_group(asset: str):
+    """
+    Returns the node group asset, reusing the one that already exists in the file,
+    and loading it from its .blend file only the first time it's needed (or after the new file is opened).
+    Returns None if the asset can't be loaded.
+    """
+
+    node_group = bpy.data.node_groups.get(asset)
+    if node_group is not None:
+        return node_group
+
+    if asset in _missing_assets:
+        return None
+
+    node_group = load_node_group(get_asset_path(asset), asset)
+    if node_group is None:
+        _missing_assets.add(asset)
+
+    return node_group
+
+
+def load_node_group(path: str, asset: str):
+    """Loads the node group from the .blend file (linked and packed in Blender 5.0+, otherwise appended)."""
+
+    if not path or not os.path.isfile(path):
+        print("Node group asset file not found:", path)
+        return None
+
+    try:
+        if bpy.app.version >= (5, 0, 0):
+            with bpy.data.libraries.load(path, link=True, pack=True) as (data_from, data_to):
+                if asset in data_from.node_groups:
+                    data_to.node_groups = [asset]
+        else:
+            with bpy.data.libraries.load(path) as (data_from, data_to):
+                if asset in data_from.node_groups:
+                    data_to.node_groups = [asset]
+
+        node_group = data_to.node_groups[0] if data_to.node_groups else None
+        return node_group
+
+    except Exception as e:
+        print("Node group asset could not be loaded:", e)
+        return None
+
+
+def preload_assets():
+    """Loads all node group assets used by cutter effects, so that Carver tools don't have to (also used as a timer)."""
+
+    _missing_assets.clear()
+    for asset in NODE_GROUP_ASSETS:
+        get_node_group(asset)
+
+    return None
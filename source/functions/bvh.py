@@ -0,0 +1,167 @@
+import bpy
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+
+# Object types that have evaluated geometry that rays can hit.
+RAYCAST_TYPES = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}
+
+# Maximum number of surfaces that a single ray passes through when looking for its exit point.
+MAX_RAY_HITS = 256
+
+# Distance (in object space) that the ray is moved past each surface it hits, so that it doesn't hit it again.
+RAY_EPSILON = 1e-5
+
+# BVH trees of the evaluated geometry of objects (in object space), by `session_uid` of the objects.
+# Trees are forgotten when geometry of their objects is updated (see `handlers.py`).
+_bvh_trees = {}
+
+
+#### ------------------------------ /cache/ ------------------------------ ####
+
+def get_bvh_tree(obj, depsgraph):
+    """Returns the cached BVH tree of the evaluated object geometry, and builds it if it's not cached yet."""
+
+    key = obj.session_uid
+    if key in _bvh_trees:
+        return _bvh_trees[key]
+
+    try:
+        tree = BVHTree.FromObject(obj, depsgraph)
+    except (ValueError, RuntimeError):
+        # Objects that don't evaluate to a mesh are remembered so that building isn't retried.
+        tree = None
+
+    _bvh_trees[key] = tree
+    return tree
+
+
+def forget_bvh_trees(objects=None):
+    """Removes cached BVH trees of given objects (or of all objects) so that they're rebuilt on the next raycast."""
+
+    if objects is None:
+        _bvh_trees.clear()
+        return
+
+    for obj in objects:
+        _bvh_trees.pop(obj.session_uid, None)
+
+
+
+#### ------------------------------ /raycast/ ------------------------------ ####
+
+def get_local_bounds(obj) -> tuple:
+    """Returns minimum & maximum corners of the bounding box of the object (in object space)."""
+
+    corners = obj.bound_box
+    low = Vector([min(corner[axis] for corner in corners) for axis in range(3)])
+    high = Vector([max(corner[axis] for corner in corners) for axis in range(3)])
+
+    return low, high
+
+
+def ray_hits_bounds(bounds, origin: Vector, direction: Vector) -> bool:
+    """Checks whether the ray intersects the bounding box given by its minimum & maximum corners (slab method)."""
+
+    low, high = bounds
+    near, far = 0.0, float("inf")
+    for axis in range(3):
+        if abs(direction[axis]) < 1e-12:
+            if origin[axis] < low[axis] or origin[axis] > high[axis]:
+                return False
+            continue
+
+        t1 = (low[axis] - origin[axis]) / direction[axis]
+        t2 = (high[axis] - origin[axis]) / direction[axis]
+        near = max(near, min(t1, t2))
+        far = min(far, max(t1, t2))
+        if near > far:
+            return False
+
+    return True
+
+
+def raycast_objects(objects, depsgraph, origin: Vector, direction: Vector) -> tuple:
+    """
+    Casts a ray against the evaluated geometry of visible objects from the list, without changing the scene.
+    Ray is traced in the object space of each object whose bounding box it intersects, using cached BVH trees.
+    Returns the same values as `Scene.ray_cast` (location & normal of the closest hit are in world space).
+    """
+
+    closest = (False, Vector(), Vector(), -1, None, None)
+    closest_distance = float("inf")
+
+    for obj in objects:
+        if obj.type not in RAYCAST_TYPES:
+            continue
+        if not obj.visible_get():
+            continue
+
+        matrix = obj.matrix_world
+        matrix_inv = matrix.inverted_safe()
+        local_origin = matrix_inv @ origin
+        local_direction = (matrix_inv.to_3x3() @ direction).normalized()
+
+        if not ray_hits_bounds(get_local_bounds(obj), local_origin, local_direction):
+            continue
+
+        tree = get_bvh_tree(obj, depsgraph)
+        if tree is None:
+            continue
+
+        location, normal, index, __ = tree.ray_cast(local_origin, local_direction)
+        if location is None:
+            continue
+
+        # Compare distances in world space, because objects can be scaled differently.
+        location = matrix @ location
+        distance = (location - origin).length
+        if distance < closest_distance:
+            closest_distance = distance
+            normal = (matrix_inv.transposed().to_3x3() @ normal).normalized()
+            closest = (True, location, normal, index, obj, matrix.copy())
+
+    return closest
+
+
+def find_exit_distance(objects, depsgraph, origins: list, direction: Vector):
+    """
+    Casts rays from all origins along the `direction` through the evaluated geometry of objects (all of their surfaces),
+    and returns the largest distance (in world space) at which any of the rays leaves the geometry.
+    Returns None if none of the rays hits any of the objects.
+    """
+
+    direction = direction.normalized()
+    furthest = None
+
+    for obj in objects:
+        if obj.type not in RAYCAST_TYPES:
+            continue
+
+        tree = get_bvh_tree(obj, depsgraph)
+        if tree is None:
+            continue
+
+        # Inverse matrix & bounds are calculated once per object, not once per ray.
+        matrix = obj.matrix_world
+        matrix_inv = matrix.inverted_safe()
+        local_direction = (matrix_inv.to_3x3() @ direction).normalized()
+        bounds = get_local_bounds(obj)
+
+        for origin in origins:
+            local_origin = matrix_inv @ origin
+            if not ray_hits_bounds(bounds, local_origin, local_direction):
+                continue
+
+            for __ in range(MAX_RAY_HITS):
+                location, __, __, __ = tree.ray_cast(local_origin, local_direction)
+                if location is None:
+                    break
+
+                distance = (matrix @ location - origin).dot(direction)
+                if furthest is None or distance > furthest:
+                    furthest = distance
+
+                local_origin = location + local_direction * RAY_EPSILON
+
+    return furthest
@@ -0,0 +1,975 @@
+import bpy
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+from collections import OrderedDict
+from contextlib import ExitStack
+from .. import __package__ as base_package
+
+from ..constants import (
+    PROXY_MODIFIER,
+    RESULT_MODIFIER,
+    RESULT_REASONS,
+)
+from .mesh import (
+    ATTRIBUTE_TYPES,
+)
+from .modifier import (
+    is_boolean_modifier,
+    is_modifier_enabled,
+    get_viewport_modifier,
+    add_result_modifier,
+    remove_result_modifier,
+    hide_modifiers,
+)
+
+
+# Modifier properties that don't affect the result.
+IGNORED_PROPERTIES = {
+    "rna_type",
+    "name",
+    "is_active",
+    "use_pin_to_last",
+    "use_apply_on_spline",
+}
+
+# Attributes that `MeshArrays` stores as topology & selection arrays, instead of as generic attributes.
+SEPARATE_ATTRIBUTES = {
+    "position",
+    ".edge_verts",
+    ".corner_vert",
+    ".corner_edge",
+    ".select_vert",
+    ".select_edge",
+    ".select_poly",
+}
+
+
+#### ------------------------------ CLASSES ------------------------------ ####
+
+class MeshArrays:
+    """Geometry of the mesh stored in NumPy arrays, so that it can be written into another mesh without evaluating it."""
+
+    def __init__(self, mesh, keep_selection=False):
+        self.positions = _read(mesh.vertices, "co", 3, np.float32)
+        self.edges = _read(mesh.edges, "vertices", 2, np.int32)
+        self.corner_verts = _read(mesh.loops, "vertex_index", 1, np.int32)
+        self.corner_edges = _read(mesh.loops, "edge_index", 1, np.int32)
+        self.face_offsets = _read(mesh.polygons, "loop_start", 1, np.int32)
+
+        # Generic attributes (UV maps, material indices, sharp edges & faces, custom normals, etc.).
+        self.attributes = []
+        for attr in _list_stored_attributes(mesh):
+            if attr.data_type not in ATTRIBUTE_TYPES:
+                raise ValueError(f"Attribute {attr.name} of {attr.data_type} type can't be stored")
+
+            key, size, dtype = ATTRIBUTE_TYPES[attr.data_type]
+            self.attributes.append((attr.name, attr.domain, attr.data_type, _read(attr.data, key, size, dtype)))
+
+        self.materials = [mat.name_full if mat else "" for mat in mesh.materials]
+
+        # Selection of vertices, edges & faces (only needed when geometry is written into the edited object).
+        self.selection = None
+        if keep_selection:
+            self.selection = (_read(mesh.vertices, "select", 1, bool),
+                              _read(mesh.edges, "select", 1, bool),
+                              _read(mesh.polygons, "select", 1, bool))
+
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken up by the arrays (in bytes)."""
+
+        arrays = [self.positions, self.edges, self.corner_verts, self.corner_edges, self.face_offsets]
+        arrays += [values for __, __, __, values in self.attributes]
+        arrays += list(self.selection or ())
+        return sum(array.nbytes for array in arrays)
+
+
+    def to_mesh(self, mesh):
+        """Writes stored geometry into an empty mesh."""
+
+        mesh.vertices.add(len(self.positions) // 3)
+        mesh.edges.add(len(self.edges) // 2)
+        mesh.loops.add(len(self.corner_verts))
+        mesh.polygons.add(len(self.face_offsets))
+
+        mesh.vertices.foreach_set("co", self.positions)
+        mesh.edges.foreach_set("vertices", self.edges)
+        mesh.loops.foreach_set("vertex_index", self.corner_verts)
+        mesh.loops.foreach_set("edge_index", self.corner_edges)
+        mesh.polygons.foreach_set("loop_start", self.face_offsets)
+
+        for name, domain, data_type, values in self.attributes:
+            attr = mesh.attributes.get(name)
+            if attr is None:
+                attr = mesh.attributes.new(name, data_type, domain)
+            attr.data.foreach_set(ATTRIBUTE_TYPES[data_type][0], values)
+
+        for name in self.materials:
+            mesh.materials.append(bpy.data.materials.get(name))
+
+        if self.selection is not None:
+            mesh.vertices.foreach_set("select", self.selection[0])
+            mesh.edges.foreach_set("select", self.selection[1])
+            mesh.polygons.foreach_set("select", self.selection[2])
+
+        mesh.update()
+
+
+    def save(self, folder: str):
+        """Writes arrays into the folder as `.npy` files (and their description as JSON)."""
+
+        os.makedirs(folder, exist_ok=True)
+        for name in ("positions", "edges", "corner_verts", "corner_edges", "face_offsets"):
+            np.save(os.path.join(folder, name + ".npy"), getattr(self, name))
+
+        attributes = []
+        for i, (name, domain, data_type, values) in enumerate(self.attributes):
+            np.save(os.path.join(folder, f"attribute_{i}.npy"), values)
+            attributes.append((name, domain, data_type))
+
+        with open(os.path.join(folder, "meta.json"), "w") as file:
+            json.dump({"attributes": attributes, "materials": self.materials}, file)
+
+
+    @classmethod
+    def load(cls, folder: str):
+        """Reads arrays written by `save` (memory-mapped, so they're only read from disk when used)."""
+
+        with open(os.path.join(folder, "meta.json")) as file:
+            meta = json.load(file)
+
+        arrays = cls.__new__(cls)
+        for name in ("positions", "edges", "corner_verts", "corner_edges", "face_offsets"):
+            setattr(arrays, name, np.load(os.path.join(folder, name + ".npy"), mmap_mode='c'))
+
+        arrays.attributes = []
+        for i, (name, domain, data_type) in enumerate(meta["attributes"]):
+            values = np.load(os.path.join(folder, f"attribute_{i}.npy"), mmap_mode='c')
+            arrays.attributes.append((name, domain, data_type, values))
+        arrays.materials = meta["materials"]
+        arrays.selection = None
+
+        return arrays
+
+
+class ResultCache:
+    """Least recently used cache of modifier stack results, limited by the amount of memory they take up."""
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+
+    def get(self, key: str):
+        """Returns the stored result for the key (or None), and marks it as the most recently used."""
+
+        arrays = self.entries.get(key)
+        if arrays is None:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return arrays
+
+
+    def add(self, key: str, arrays: MeshArrays, limit: int):
+        """Stores the result and evicts the least recently used ones that exceed the memory limit (in bytes)."""
+
+        if arrays.nbytes > limit:
+            return
+
+        if key in self.entries:
+            self.size -= self.entries.pop(key).nbytes
+
+        self.entries[key] = arrays
+        self.size += arrays.nbytes
+        self.trim(limit)
+
+
+    def trim(self, limit: int):
+        """Evicts the least recently used results until they fit in the memory limit (in bytes)."""
+
+        while self.size > limit and self.entries:
+            __, arrays = self.entries.popitem(last=False)
+            self.size -= arrays.nbytes
+
+
+    def peek(self, key: str):
+        """Returns the stored result for the key (or None), without affecting the order or the counters."""
+
+        return self.entries.get(key)
+
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+
+result_cache = ResultCache()
+
+# Fingerprints of meshes (by `session_uid`), forgotten when their geometry changes (see `handlers.py`).
+_mesh_fingerprints = {}
+
+# Names of canvases that display results or store checkpoints (None when they have to be searched for again).
+_cached_canvases = None
+
+
+
+#### ------------------------------ /fingerprint/ ------------------------------ ####
+
+def fingerprint_canvas(canvas) -> str:
+    """
+    Returns the fingerprint of everything that affects the result of the canvas modifier stack:
+    geometry of the canvas, settings of its (enabled) modifiers, geometry of the cutters and their
+    transforms relative to the canvas (moving the canvas together with its cutters doesn't change it).
+    """
+
+    stack = fingerprint_stack(canvas)
+    if stack:
+        return stack[-1][1]
+
+    return ""
+
+
+def fingerprint_stack(canvas) -> list[tuple]:
+    """
+    Returns the list of enabled modifiers of the canvas paired with fingerprints of the stack up to (and including) them.
+    Fingerprints are chained, so changing a modifier (or its cutter) only changes fingerprints from that modifier onward.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(canvas.type.encode())
+    _fingerprint_mesh(canvas.data, digest)
+    key = digest.hexdigest()
+
+    stack = []
+    for mod in canvas.modifiers:
+        if not is_modifier_enabled(canvas, mod):
+            continue
+
+        digest = hashlib.blake2b(key.encode(), digest_size=16)
+        digest.update(mod.type.encode())
+        _fingerprint_struct(canvas, mod, digest, {canvas})
+        key = digest.hexdigest()
+        stack.append((mod, key))
+
+    return stack
+
+
+def fingerprint_applied(canvas, modifiers: list) -> str:
+    """
+    Returns the fingerprint of the mesh that applying given modifiers produces, or an empty string
+    if it can't be fingerprinted (when enabled modifiers aren't the uninterrupted block at the top of the stack).
+    """
+
+    # Viewport-only copies (of Boolean modifiers) follow their modifiers in the stack.
+    enabled = []
+    for mod in modifiers:
+        copy = get_viewport_modifier(mod)
+        if copy.show_viewport:
+            enabled.append(mod.name)
+            if copy != mod:
+                enabled.append(copy.name)
+    if not enabled:
+        return ""
+
+    stack = fingerprint_stack(canvas)
+    if [mod.name for mod, __ in stack[:len(enabled)]] != enabled:
+        return ""
+
+    return stack[len(enabled) - 1][1]
+
+
+def _fingerprint_object(obj, digest, visited: set):
+    """Updates the digest with the data and enabled modifiers of the object (and objects they use)."""
+
+    if obj in visited:
+        return
+    visited.add(obj)
+
+    digest.update(obj.type.encode())
+    if obj.type == 'MESH':
+        _fingerprint_mesh(obj.data, digest)
+        if obj.data.shape_keys:
+            digest.update(repr([(key.value, key.mute) for key in obj.data.shape_keys.key_blocks]).encode())
+    elif obj.data:
+        digest.update(obj.data.name_full.encode())
+
+    for mod in obj.modifiers:
+        if not is_modifier_enabled(obj, mod):
+            continue
+
+        digest.update(mod.type.encode())
+        _fingerprint_struct(obj, mod, digest, visited)
+
+
+def _fingerprint_mesh(mesh, digest):
+    """Updates the digest with the positions and topology of the mesh (which are only read again after they change)."""
+
+    fingerprint = _mesh_fingerprints.get(mesh.session_uid)
+    if fingerprint is None:
+        mesh_digest = hashlib.blake2b(digest_size=16)
+        mesh_digest.update(_read(mesh.vertices, "co", 3, np.float32).tobytes())
+        mesh_digest.update(_read(mesh.loops, "vertex_index", 1, np.int32).tobytes())
+        mesh_digest.update(_read(mesh.polygons, "loop_start", 1, np.int32).tobytes())
+        fingerprint = mesh_digest.digest()
+        _mesh_fingerprints[mesh.session_uid] = fingerprint
+
+    digest.update(fingerprint)
+    digest.update(repr([mat.name_full if mat else "" for mat in mesh.materials]).encode())
+
+
+def forget_mesh_fingerprints(meshes=None):
+    """Forgets fingerprints of given meshes (or of all meshes) so that they're read again when fingerprinted next."""
+
+    if meshes is None:
+        _mesh_fingerprints.clear()
+        return
+
+    for mesh in meshes:
+        _mesh_fingerprints.pop(mesh.session_uid, None)
+
+
+def _fingerprint_struct(owner, struct, digest, visited: set):
+    """Updates the digest with the values of all editable properties of the struct (i.e. modifier)."""
+
+    for prop in struct.bl_rna.properties:
+        identifier = prop.identifier
+        if prop.is_readonly or prop.type == 'COLLECTION':
+            continue
+        if identifier in IGNORED_PROPERTIES or identifier.startswith(("show_", "open_")):
+            continue
+
+        value = getattr(struct, identifier, None)
+        if prop.type == 'POINTER':
+            _fingerprint_value(owner, value, digest, visited)
+        elif prop.type == 'ENUM' and prop.is_enum_flag:
+            digest.update(repr(sorted(value)).encode())
+        elif getattr(prop, "array_length", 0) > 0:
+            digest.update(repr(tuple(value)).encode())
+        else:
+            digest.update(repr(value).encode())
+
+    # Geometry Nodes modifier inputs are stored as custom properties.
+    if getattr(struct, "type", None) == 'NODES':
+        try:
+            for key in struct.keys():
+                digest.update(key.encode())
+                _fingerprint_value(owner, struct[key], digest, visited)
+        except TypeError:
+            pass
+
+
+def _fingerprint_value(owner, value, digest, visited: set):
+    """Updates the digest with the pointer or custom property value."""
+
+    if isinstance(value, bpy.types.Object):
+        matrix = owner.matrix_world.inverted_safe() @ value.matrix_world
+        digest.update(np.round(np.array(matrix, dtype=np.float64), 6).tobytes())
+        _fingerprint_object(value, digest, visited)
+    elif isinstance(value, bpy.types.Collection):
+        for obj in value.all_objects:
+            _fingerprint_value(owner, obj, digest, visited)
+    elif isinstance(value, bpy.types.ID):
+        digest.update(value.name_full.encode())
+    elif hasattr(value, "to_list"):
+        digest.update(repr(value.to_list()).encode())
+    elif hasattr(value, "to_dict"):
+        digest.update(repr(value.to_dict()).encode())
+    else:
+        digest.update(repr(value).encode())
+
+
+def _list_stored_attributes(mesh) -> list:
+    """
+    Returns generic attributes of the mesh that are stored in `MeshArrays` (topology & selection are stored separately).
+    Internal attributes (i.e. hidden elements, UV selection) are stored too, so that the written mesh is the same.
+    """
+
+    return [attr for attr in mesh.attributes if attr.name not in SEPARATE_ATTRIBUTES]
+
+
+def _read(collection, attribute: str, size: int, dtype) -> np.ndarray:
+    """Reads the attribute of every item in the collection into a flat NumPy array."""
+
+    array = np.empty(len(collection) * size, dtype=dtype)
+    collection.foreach_get(attribute, array)
+
+    return array
+
+
+
+#### ------------------------------ /poll/ ------------------------------ ####
+
+def is_storable_mesh(mesh, obj=None) -> bool:
+    """
+    Checks whether `MeshArrays` can store everything that the mesh has (so that the written mesh is the same).
+    Deform weights, shape keys and skin vertices aren't stored, so meshes with them (or meshes of objects
+    with vertex groups, when the object is given) can't be either.
+    """
+
+    if obj is not None and len(obj.vertex_groups) > 0:
+        return False
+    if mesh.shape_keys is not None or len(mesh.skin_vertices) > 0:
+        return False
+
+    return all(attr.data_type in ATTRIBUTE_TYPES for attr in _list_stored_attributes(mesh))
+
+
+def can_cache_result(canvas) -> bool:
+    """Checks whether the result of the canvas modifier stack can be stored and displayed from the cache."""
+
+    if canvas.type != 'MESH' or canvas.mode == 'EDIT':
+        return False
+    if canvas.data.shape_keys:
+        return False
+
+    # Modifiers suspended for other reasons don't represent the result.
+    # (modifiers suspended for viewport fidelity are evaluated by their viewport-only copies).
+    for item in canvas.booleans.suspended_modifiers:
+        if item.reason not in RESULT_REASONS and item.reason != 'FIDELITY':
+            return False
+
+    return any(is_boolean_modifier(mod) for mod in canvas.modifiers)
+
+
+def _is_mesh_only(canvas_eval) -> bool:
+    """Checks if evaluated canvas consists only of the mesh (Geometry Nodes modifiers can output other geometry)."""
+
+    if not any(mod.type == 'NODES' and mod.show_viewport for mod in canvas_eval.modifiers):
+        return True
+
+    try:
+        geometry = canvas_eval.evaluated_geometry()
+        return (geometry.curves is None and geometry.pointcloud is None
+                and geometry.instances_pointcloud() is None)
+    except Exception:
+        return False
+
+
+
+#### ------------------------------ /operate/ ------------------------------ ####
+
+def store_canvas_result(context, canvas):
+    """Stores the current (evaluated) result of the canvas modifier stack in the result cache."""
+
+    prefs = context.preferences.addons[base_package].preferences
+    if not prefs.use_result_cache:
+        return
+    if not can_cache_result(canvas):
+        return
+
+    limit = prefs.cache_size * 2**20
+
+    # Displayed result is already cached, unless it was evicted since.
+    if canvas.booleans.result_key:
+        if canvas.booleans.result_key not in result_cache:
+            result_cache.add(canvas.booleans.result_key, MeshArrays(canvas.booleans.result.data), limit)
+        return
+
+    key = fingerprint_canvas(canvas)
+    if not key or key in result_cache:
+        return
+
+    arrays = _evaluate_result(context, canvas)
+    if arrays is not None:
+        result_cache.add(key, arrays, limit)
+
+
+def restore_canvas_result(context, canvas) -> bool:
+    """
+    Displays the cached result of the canvas instead of evaluating its modifiers (if its configuration is cached).
+    If only the checkpoint is cached, modifiers before it are replaced, and the ones after it are evaluated.
+    Returns False if the whole modifier stack has to be evaluated.
+    """
+
+    # Frozen canvases keep displaying their result until they're thawed.
+    if canvas.booleans.frozen:
+        return True
+
+    prefs = context.preferences.addons[base_package].preferences
+    use_disk = prefs.use_disk_cache and bpy.data.filepath
+    use_cache = prefs.use_result_cache or use_disk
+    use_checkpoints = canvas.booleans.use_checkpoints
+
+    if not (use_cache or use_checkpoints) or not can_cache_result(canvas):
+        if canvas.booleans.result_key:
+            remove_result_modifier(canvas)
+        return False
+
+    stack = fingerprint_stack(canvas)
+    if not stack:
+        if canvas.booleans.result_key:
+            remove_result_modifier(canvas)
+        return False
+
+    # Result of the whole stack.
+    if use_cache:
+        key = stack[-1][1]
+        if key == canvas.booleans.result_key:
+            return True
+
+        arrays = result_cache.get(key)
+        if arrays is None and use_disk:
+            arrays = load_disk_result(key)
+        if arrays is not None:
+            _display_result(canvas, arrays, key, [mod for mod, __ in stack], 'CACHE')
+            return True
+
+    # Result of the stack up to the nearest valid checkpoint.
+    if use_checkpoints:
+        for index in reversed(list_checkpoints(canvas, stack)):
+            key = stack[index][1]
+            if key == canvas.booleans.result_key:
+                return True
+
+            arrays = result_cache.peek(key)
+            if arrays is not None:
+                _display_result(canvas, arrays, key, [mod for mod, __ in stack[:index + 1]], 'CHECKPOINT')
+                return True
+
+    if canvas.booleans.result_key:
+        remove_result_modifier(canvas)
+    return False
+
+
+def store_canvas_checkpoints(context, canvas):
+    """
+    Evaluates and stores missing checkpoints of the canvas. Each one is evaluated from the previous one,
+    so that only Boolean modifiers between two checkpoints are evaluated for each of them.
+    """
+
+    prefs = context.preferences.addons[base_package].preferences
+    if not canvas.booleans.use_checkpoints or not can_cache_result(canvas):
+        return
+
+    limit = prefs.cache_size * 2**20
+    stack = fingerprint_stack(canvas)
+    checkpoints = list_checkpoints(canvas, stack)
+    if all(stack[index][1] in result_cache for index in checkpoints):
+        return
+
+    previous = None
+    for index in checkpoints:
+        key = stack[index][1]
+        if key in result_cache:
+            previous = index
+            continue
+
+        # Start from the previous checkpoint (or from the beginning of the stack).
+        if previous is not None:
+            previous_key = stack[previous][1]
+            _display_result(canvas, result_cache.peek(previous_key), previous_key,
+                            [mod for mod, __ in stack[:previous + 1]], 'CHECKPOINT')
+        elif canvas.booleans.result_key:
+            remove_result_modifier(canvas)
+
+        # Evaluate the stack up to the checkpoint.
+        following = [mod for mod, __ in stack[index + 1:] if mod.show_viewport]
+        for mod in following:
+            mod.show_viewport = False
+
+        try:
+            depsgraph = context.evaluated_depsgraph_get()
+            canvas_eval = canvas.evaluated_get(depsgraph)
+            mesh = canvas_eval.to_mesh()
+            if is_storable_mesh(mesh, canvas):
+                result_cache.add(key, MeshArrays(mesh), limit)
+            canvas_eval.to_mesh_clear()
+        finally:
+            for mod in following:
+                mod.show_viewport = True
+
+        # Previous checkpoint was evicted to make room for this one (cache is too small).
+        if key not in result_cache:
+            break
+        previous = index
+
+
+def list_checkpoints(canvas, stack: list) -> list:
+    """Returns indices (in the list returned by `fingerprint_stack`) of modifiers after which checkpoints are stored."""
+
+    interval = canvas.booleans.checkpoint_interval
+
+    checkpoints = []
+    count = 0
+    for i, (mod, __) in enumerate(stack):
+        if not is_boolean_modifier(mod):
+            continue
+
+        count += 1
+        if count % interval == 0:
+            checkpoints.append(i)
+
+    return checkpoints
+
+
+def restore_static_result(context, canvas) -> bool:
+    """
+    Displays the result of the canvas whose modifier stack doesn't change over time instead of evaluating it,
+    storing the current result first if it isn't cached. Returns False if the result couldn't be stored.
+    NOTE: Caller is responsible for checking that the modifier stack is static (`is_static_stack`).
+    """
+
+    prefs = context.preferences.addons[base_package].preferences
+    if canvas.booleans.frozen:
+        return True
+    if not can_cache_result(canvas):
+        return False
+
+    stack = fingerprint_stack(canvas)
+    if not stack:
+        return False
+
+    key = stack[-1][1]
+    if key == canvas.booleans.result_key:
+        return True
+
+    arrays = result_cache.peek(key)
+    if arrays is None:
+        arrays = _evaluate_result(context, canvas)
+        if arrays is None:
+            return False
+        if prefs.use_result_cache:
+            result_cache.add(key, arrays, prefs.cache_size * 2**20)
+
+    _display_result(canvas, arrays, key, [mod for mod, __ in stack], 'CACHE')
+    return True
+
+
+def freeze_canvas(context, canvas) -> bool:
+    """
+    Displays the result of the canvas modifier stack instead of evaluating it, until the canvas is thawed
+    (changes to the canvas and its cutters are ignored). Returns False if the result couldn't be stored.
+    """
+
+    if canvas.type != 'MESH' or canvas.data.shape_keys:
+        return False
+
+    # Result is evaluated from actual modifiers.
+    if canvas.booleans.result_key:
+        remove_result_modifier(canvas)
+
+    stack = fingerprint_stack(canvas)
+    if not stack:
+        return False
+
+    key = stack[-1][1]
+    arrays = result_cache.peek(key)
+    if arrays is None:
+        arrays = _evaluate_result(context, canvas)
+        if arrays is None:
+            return False
+
+    _display_result(canvas, arrays, key, [mod for mod, __ in stack], 'FREEZE')
+    canvas.booleans.frozen = True
+    return True
+
+
+def thaw_canvas(canvas):
+    """Evaluates the modifier stack of the frozen canvas again."""
+
+    remove_result_modifier(canvas)
+
+
+def show_result_in_render(canvas) -> list:
+    """
+    Makes the render use the displayed result of the canvas instead of the modifiers it replaced
+    (which are otherwise only hidden in the viewport). Returns names of modifiers that were hidden in render.
+    """
+
+    mod = canvas.modifiers.get(RESULT_MODIFIER)
+    if mod is None or not _has_same_render_settings(canvas):
+        return []
+
+    hidden = []
+    for item in canvas.booleans.suspended_modifiers:
+        if item.reason not in RESULT_REASONS:
+            continue
+
+        suspended = canvas.modifiers.get(item.name)
+        if suspended is not None and suspended.show_render:
+            suspended.show_render = False
+            hidden.append(suspended.name)
+
+    mod.show_render = True
+    return hidden
+
+
+def hide_result_in_render(canvas, modifiers: list):
+    """Reverts the changes made by `show_result_in_render`."""
+
+    mod = canvas.modifiers.get(RESULT_MODIFIER)
+    if mod is not None:
+        mod.show_render = False
+
+    for name in modifiers:
+        hidden = canvas.modifiers.get(name)
+        if hidden is not None:
+            hidden.show_render = True
+
+
+def _has_same_render_settings(canvas) -> bool:
+    """Checks whether modifiers of the canvas give the same result in the render as in the viewport."""
+
+    for mod in canvas.modifiers:
+        if mod.name == RESULT_MODIFIER:
+            continue
+        if is_modifier_enabled(canvas, mod) != mod.show_render:
+            return False
+        if mod.type in ('SUBSURF', 'MULTIRES') and mod.levels != mod.render_levels:
+            return False
+
+        # Viewport fidelity (low-poly cutter proxy, viewport-only copies with cheaper solvers are checked above).
+        if is_boolean_modifier(mod) and mod.show_render:
+            proxy = mod.object.modifiers.get(PROXY_MODIFIER)
+            if proxy is not None and proxy.show_viewport:
+                return False
+
+    return True
+
+
+def _evaluate_result(context, canvas):
+    """
+    Returns the evaluated result of the canvas modifier stack as `MeshArrays`
+    (or None if it isn't only a mesh, or if the mesh has attributes that can't be stored).
+    """
+
+    depsgraph = context.evaluated_depsgraph_get()
+    canvas_eval = canvas.evaluated_get(depsgraph)
+    if not _is_mesh_only(canvas_eval):
+        return None
+
+    mesh = canvas_eval.to_mesh()
+    arrays = MeshArrays(mesh) if is_storable_mesh(mesh, canvas) else None
+    canvas_eval.to_mesh_clear()
+
+    return arrays
+
+
+def _display_result(canvas, arrays: MeshArrays, key: str, modifiers: list, reason: str):
+    """Writes stored result into a new mesh and displays it instead of given modifiers."""
+
+    mesh = bpy.data.meshes.new(canvas.name + "_result")
+    arrays.to_mesh(mesh)
+
+    add_result_modifier(canvas, mesh, modifiers, reason)
+    canvas.booleans.result_key = key
+    track_cached_canvas(canvas)
+
+
+def list_result_dependencies(canvas) -> set:
+    """Returns the set of IDs whose changes can invalidate the displayed result of the canvas."""
+
+    dependencies = {canvas, canvas.data}
+    for mod in canvas.modifiers:
+        if mod.name == RESULT_MODIFIER:
+            continue
+
+        obj = getattr(mod, "object", None)
+        if obj is not None:
+            dependencies.update((obj, obj.data))
+
+        collection = getattr(mod, "collection", None)
+        if collection is not None:
+            for obj in collection.all_objects:
+                dependencies.update((obj, obj.data))
+
+    dependencies.discard(None)
+    return dependencies
+
+
+def track_cached_canvas(canvas):
+    """Adds the canvas to ones that are returned by `list_cached_canvases` (until it stops using the cache)."""
+
+    if _cached_canvases is not None:
+        _cached_canvases.add(canvas.name)
+
+
+def forget_cached_canvases():
+    """Makes `list_cached_canvases` search all objects again (needed when undo or opening the file replaces them)."""
+
+    global _cached_canvases
+    _cached_canvases = None
+
+
+def list_cached_canvases(scene) -> list:
+    """
+    Returns canvases in the scene that display results or store checkpoints. Only tracked canvases are checked,
+    all objects are searched only the first time (and when the tracked canvas is renamed or removed).
+    """
+
+    global _cached_canvases
+    objects = None
+    if _cached_canvases is not None:
+        objects = [bpy.data.objects.get(name) for name in _cached_canvases]
+    if objects is None or None in objects:
+        objects = bpy.data.objects
+
+    canvases = [obj for obj in objects if obj.booleans.result_key or obj.booleans.use_checkpoints]
+    _cached_canvases = {obj.name for obj in canvases}
+    return [obj for obj in canvases if obj.name in scene.objects]
+
+
+def release_canvas_results(include_frozen=False):
+    """Removes all displayed results (in all scenes), so that modifier stacks are evaluated again."""
+
+    for obj in bpy.data.objects:
+        if obj.booleans.frozen and not include_frozen:
+            continue
+        if obj.booleans.result_key:
+            remove_result_modifier(obj)
+
+
+
+#### ------------------------------ /disk/ ------------------------------ ####
+
+def get_disk_cache_folder() -> str:
+    """Returns the path of the disk cache folder next to the current .blend file (empty if file isn't saved)."""
+
+    if not bpy.data.filepath:
+        return ""
+
+    directory, filename = os.path.split(bpy.data.filepath)
+    return os.path.join(directory, os.path.splitext(filename)[0] + "_boolean_cache")
+
+
+def store_disk_results(context, canvases: list):
+    """Writes results of the canvases into the disk cache (if they're not there already), and evicts the oldest ones."""
+
+    prefs = context.preferences.addons[base_package].preferences
+    folder = get_disk_cache_folder()
+    if not prefs.use_disk_cache or not folder:
+        return
+
+    for canvas in canvases:
+        if not can_cache_result(canvas):
+            continue
+
+        key = fingerprint_canvas(canvas)
+        if not key or os.path.isdir(os.path.join(folder, key)):
+            continue
+
+        arrays = result_cache.peek(key) or _evaluate_result(context, canvas)
+        if arrays is None:
+            continue
+
+        # Write into temporary folder first, so that interrupted writes don't leave incomplete entries.
+        temp_folder = os.path.join(folder, key + ".tmp")
+        try:
+            arrays.save(temp_folder)
+            os.replace(temp_folder, os.path.join(folder, key))
+        except OSError as e:
+            print("Boolean result could not be written to disk cache:", e)
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+    trim_disk_cache(folder, prefs.disk_cache_size * 2**20)
+
+
+def load_disk_result(key: str):
+    """Returns the result stored in the disk cache for the key (or None), and marks it as the most recently used."""
+
+    folder = get_disk_cache_folder()
+    if not folder:
+        return None
+
+    entry = os.path.join(folder, key)
+    if not os.path.isdir(entry):
+        return None
+
+    try:
+        arrays = MeshArrays.load(entry)
+        os.utime(entry)
+        return arrays
+    except (OSError, ValueError, KeyError) as e:
+        print("Boolean result could not be read from disk cache:", e)
+        shutil.rmtree(entry, ignore_errors=True)
+        return None
+
+
+def restore_disk_results(context, canvases: list):
+    """Displays results stored in the disk cache instead of evaluating modifier stacks of the canvases."""
+
+    prefs = context.preferences.addons[base_package].preferences
+    if not prefs.use_disk_cache or not bpy.data.filepath:
+        return
+
+    # World matrices aren't stored in the file, so transforms are evaluated before canvases are fingerprinted.
+    # Modifiers of canvases are hidden meanwhile, so that they aren't evaluated (that's what the disk cache avoids).
+    with ExitStack() as stack:
+        for canvas in canvases:
+            stack.enter_context(hide_modifiers(canvas, excluding=[]))
+        context.view_layer.update()
+
+    for canvas in canvases:
+        if canvas.booleans.frozen or not can_cache_result(canvas):
+            continue
+
+        stack = fingerprint_stack(canvas)
+        if not stack:
+            continue
+
+        key = stack[-1][1]
+        if key == canvas.booleans.result_key:
+            continue
+
+        arrays = load_disk_result(key)
+        if arrays is None:
+            continue
+
+        if prefs.use_result_cache:
+            result_cache.add(key, arrays, prefs.cache_size * 2**20)
+        _display_result(canvas, arrays, key, [mod for mod, __ in stack], 'CACHE')
+
+
+def trim_disk_cache(folder: str, limit: int):
+    """Removes the least recently used entries from the disk cache folder until they fit in the size limit (in bytes)."""
+
+    if not os.path.isdir(folder):
+        return
+
+    entries = []
+    total = 0
+    for entry in os.scandir(folder):
+        if not entry.is_dir():
+            continue
+
+        size = sum(file.stat().st_size for file in os.scandir(entry.path) if file.is_file())
+        entries.append((entry.stat().st_mtime, size, entry.path))
+        total += size
+
+    for __, size, path in sorted(entries):
+        if total <= limit:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+
+
+def clear_disk_cache() -> int:
+    """Removes the disk cache folder of the current .blend file. Returns the number of removed bytes."""
+
+    folder = get_disk_cache_folder()
+    if not folder or not os.path.isdir(folder):
+        return 0
+
+    size = 0
+    for root, __, files in os.walk(folder):
+        size += sum(os.path.getsize(os.path.join(root, file)) for file in files)
+
+    shutil.rmtree(folder, ignore_errors=True)
+    return size
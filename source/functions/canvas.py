@@ -1,12 +1,28 @@
 import bpy
+from .. import __package__ as base_package
 
+from .cutter import (
+    list_cutter_users,
+)
+from .mesh import (
+    is_instanced_mesh,
+)
 from .modifier import (
     is_boolean_modifier,
+    is_viewport_modifier,
+    get_viewport_modifier,
+    enumerate_boolean_modifiers,
+    add_boolean_modifier,
+    apply_modifiers,
 )
 from .object import (
     is_linked,
     change_parent,
 )
+from .scene import (
+    ensure_collection,
+    ensure_archive_collection,
+)
 
 
 #### ------------------------------ /poll/ ------------------------------ ####
@@ -115,7 +131,40 @@ def filter_canvases(self, context, canvases: list) -> list:
 
 
 
-#### ------------------------------ /filter/ ------------------------------ ####
+def list_expired_modifiers(canvas, pinned=False) -> list:
+    """
+    Returns the list of the oldest Boolean modifiers on the canvas that exceed its auto-apply limit.
+    Only modifiers that can be applied into the base mesh without changing the result are listed,
+    i.e. ones from the uninterrupted block of enabled Boolean modifiers at the top of the stack.
+    """
+
+    excess = enumerate_boolean_modifiers(canvas) - canvas.booleans.auto_apply_limit
+    if excess <= 0:
+        return []
+
+    block = []
+    for mod in canvas.modifiers:
+        if is_viewport_modifier(mod):
+            continue
+        if not is_boolean_modifier(mod):
+            break
+        if not get_viewport_modifier(mod).show_viewport:
+            break
+        block.append(mod)
+
+    """
+    NOTE: When new modifiers are pinned the oldest ones are at the bottom of the block.
+    They can only be applied before newer ones (that are above them) if all operations
+    in the block are the same, because then their order doesn't affect the result.
+    """
+    if pinned and len(set(mod.operation for mod in block)) == 1:
+        block.reverse()
+
+    return block[:excess]
+
+
+
+#### ------------------------------ /operate/ ------------------------------ ####
 
 def create_slice(context, canvas, modifier=False):
     """Creates copy of canvas to be used as slice."""
@@ -142,3 +191,114 @@ def create_slice(context, canvas, modifier=False):
         slice.local_view_set(context.space_data, True)
 
     return slice
+
+
+def archive_boolean_modifiers(context, canvas, modifiers: list):
+    """
+    Applies Boolean modifiers into the canvas mesh and archives their cutters, so that the operation can be reverted.
+    Mesh of the canvas is stored only once (before the first archived modifier), so reverting restores all of them.
+    """
+
+    if canvas.booleans.archived_mesh is None:
+        canvas.booleans.archived_mesh = canvas.data.copy()
+
+    # Store modifier properties (and positions, so that modifiers are restored where they were).
+    archived = canvas.booleans.archived_cutters
+    batch = max(item.batch for item in archived) + 1 if len(archived) > 0 else 0
+
+    cutters = []
+    for mod in modifiers:
+        item = archived.add()
+        item.name = mod.name
+        item.index = canvas.modifiers.find(mod.name)
+        item.batch = batch
+        item.object = mod.object
+        item.operation = mod.operation
+        item.solver = mod.solver
+        item.material_mode = mod.material_mode
+        item.use_self = mod.use_self
+        item.use_hole_tolerant = mod.use_hole_tolerant
+        item.double_threshold = mod.double_threshold
+
+        if mod.object not in cutters:
+            cutters.append(mod.object)
+
+    apply_modifiers(context, canvas, modifiers, force_clean=True)
+
+    # Move cutters that aren't used by any other canvas in the archive collection.
+    archive_collection = ensure_archive_collection(context)
+    for cutter in cutters:
+        if len(list_cutter_users([cutter])) > 0:
+            continue
+
+        for coll in cutter.users_collection:
+            coll.objects.unlink(cutter)
+        archive_collection.objects.link(cutter)
+
+
+def restore_archived_modifiers(context, canvas):
+    """Restores the mesh of the canvas and re-creates Boolean modifiers that were automatically applied."""
+
+    prefs = context.preferences.addons[base_package].preferences
+    archive_collection = bpy.data.collections.get(prefs.collection_name + "_archive")
+
+    # Restore mesh.
+    applied_mesh = canvas.data
+    canvas.data = canvas.booleans.archived_mesh
+    canvas.booleans.archived_mesh = None
+    if applied_mesh.users == 0:
+        bpy.data.meshes.remove(applied_mesh)
+
+    # Re-create modifiers at positions they had when they were archived. Last archiving is restored first,
+    # so that each one sees the stack as it was then. Modifiers without recorded positions are put on top of the stack.
+    items = sorted(canvas.booleans.archived_cutters, key=lambda item: (-item.batch, item.index))
+    index = 0
+    for item in items:
+        cutter = item.object
+        if cutter is None:
+            continue
+
+        # Solver options are read from the archived item.
+        mod = add_boolean_modifier(item, context, canvas, cutter, item.operation, item.solver, name=item.name)
+
+        if item.index >= 0:
+            index = item.index
+        index = min(index, len(canvas.modifiers) - 1)
+        canvas.modifiers.move(canvas.modifiers.find(mod.name), index)
+        index += 1
+
+        # Viewport-only copy stays right after its modifier.
+        copy = get_viewport_modifier(mod)
+        if copy != mod:
+            canvas.modifiers.move(canvas.modifiers.find(copy.name), min(index, len(canvas.modifiers) - 1))
+            index += 1
+
+        # Move cutter out of the archive.
+        if archive_collection and archive_collection in cutter.users_collection:
+            archive_collection.objects.unlink(cutter)
+        if len(cutter.users_collection) == 0:
+            if prefs.use_collection:
+                ensure_collection(context).objects.link(cutter)
+            else:
+                for coll in canvas.users_collection:
+                    coll.objects.link(cutter)
+
+    canvas.booleans.archived_cutters.clear()
+    canvas.booleans.canvas = True
+
+    # Purge empty archive collection.
+    if archive_collection and not archive_collection.objects:
+        bpy.data.collections.remove(archive_collection)
+
+
+def enforce_boolean_limit(context, canvas, pinned=False):
+    """Applies & archives the oldest Boolean modifiers of the canvas if it uses rolling auto-apply."""
+
+    if not canvas.booleans.auto_apply:
+        return
+    if canvas.data.shape_keys or is_instanced_mesh(canvas.data):
+        return
+
+    modifiers = list_expired_modifiers(canvas, pinned=pinned)
+    if modifiers:
+        archive_boolean_modifiers(context, canvas, modifiers)
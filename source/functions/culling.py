@@ -0,0 +1,120 @@
+import bpy
+import numpy as np
+
+from ..constants import (
+    CULLED_OPERATIONS,
+)
+from .modifier import (
+    is_boolean_modifier,
+    get_viewport_modifier,
+    is_modifier_suspended,
+    suspend_modifiers,
+    resume_modifiers,
+)
+
+
+#### ------------------------------ /list/ ------------------------------ ####
+
+def list_view_regions(window_manager) -> list:
+    """Returns the list of main regions of all 3D Viewports (paired with their 3D region data) in all windows."""
+
+    views = []
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+
+            for region in area.regions:
+                if region.type == 'WINDOW' and region.width > 1 and region.height > 1:
+                    views.append((region, area.spaces.active.region_3d))
+
+    return views
+
+
+def list_visible_objects(objects: list, views: list, min_pixels: int) -> set:
+    """
+    Returns the set of objects whose bounding boxes are inside the view frustum of at least one 3D Viewport,
+    and project to at least `min_pixels` pixels (on their longest side) in it.
+    """
+
+    if not objects or not views:
+        return set(objects)
+
+    # World-space corners of bounding boxes (objects, 8 corners, XYZW).
+    corners = np.ones((len(objects), 8, 4), dtype=np.float32)
+    matrices = np.empty((len(objects), 4, 4), dtype=np.float32)
+    for i, obj in enumerate(objects):
+        corners[i, :, :3] = obj.bound_box
+        matrices[i] = obj.matrix_world
+    corners = np.einsum('nij,nkj->nki', matrices, corners)
+
+    visible = np.zeros(len(objects), dtype=bool)
+    for region, rv3d in views:
+        clip = corners @ np.array(rv3d.perspective_matrix, dtype=np.float32).T
+        x, y, z, w = clip[..., 0], clip[..., 1], clip[..., 2], clip[..., 3]
+
+        # Bounds are outside of the frustum when all corners are on the outer side of the same clipping plane.
+        outside = ((x < -w).all(axis=1) | (x > w).all(axis=1) |
+                   (y < -w).all(axis=1) | (y > w).all(axis=1) |
+                   (z < -w).all(axis=1) | (z > w).all(axis=1))
+
+        # Size on screen (bounds that cross the view plane can't be projected, and are always big enough).
+        behind = (w <= 1e-6).any(axis=1)
+        w = np.where(w > 1e-6, w, 1.0)
+        ndc_x, ndc_y = x / w, y / w
+        width = (ndc_x.max(axis=1) - ndc_x.min(axis=1)) * region.width / 2
+        height = (ndc_y.max(axis=1) - ndc_y.min(axis=1)) * region.height / 2
+        big_enough = behind | (np.maximum(width, height) >= min_pixels)
+
+        visible |= ~outside & big_enough
+
+    return {obj for obj, is_visible in zip(objects, visible) if is_visible}
+
+
+
+#### ------------------------------ FUNCTIONS ------------------------------ ####
+
+def cull_boolean_modifiers(canvases: list, views: list, min_pixels: int) -> bool:
+    """
+    Suspends Boolean modifiers of canvases whose cutters aren't visible in any 3D Viewport (or are too small to see),
+    and resumes culled modifiers whose cutters became visible. Returns True if any modifier was changed.
+    Only Difference and Union modifiers are culled, because Intersect removes everything outside of the cutter.
+    """
+
+    # Modifiers that evaluate Boolean modifiers in the viewport (their viewport-only copies, if they have them).
+    modifiers = {}
+    for canvas in canvases:
+        viewport_modifiers = [get_viewport_modifier(mod) for mod in canvas.modifiers if is_boolean_modifier(mod)]
+        modifiers[canvas] = [mod for mod in viewport_modifiers
+                             if mod.show_viewport or is_modifier_suspended(canvas, mod, reasons=('CULL',))]
+
+    cutters = list({mod.object for mods in modifiers.values() for mod in mods})
+    visible = list_visible_objects(cutters, views, min_pixels)
+
+    changed = False
+    for canvas, mods in modifiers.items():
+        culled = [mod for mod in mods if mod.show_viewport and mod.operation in CULLED_OPERATIONS and
+                  mod.object not in visible]
+        if culled:
+            suspend_modifiers(canvas, culled, 'CULL')
+            changed = True
+
+        # Operation of culled modifiers can be changed to Intersect while they're culled.
+        shown = [mod for mod in mods if not mod.show_viewport and
+                 (mod.object in visible or mod.operation not in CULLED_OPERATIONS)]
+        if shown:
+            records = canvas.booleans.suspended_modifiers
+            for mod in shown:
+                records.remove(records.find(mod.name))
+                mod.show_viewport = True
+            changed = True
+
+    return changed
+
+
+def uncull_boolean_modifiers(objects):
+    """Resumes all Boolean modifiers that were culled (i.e. when culling is disabled, or before they're applied)."""
+
+    for obj in objects:
+        if len(obj.booleans.suspended_modifiers) > 0:
+            resume_modifiers(obj, reasons=('CULL',))
@@ -1,7 +1,6 @@
 import bpy
 import gpu
 import math
-import mathutils
 from bpy_extras import view3d_utils
 from mathutils import Vector
 from gpu_extras.batch import batch_for_shader
@@ -48,53 +47,6 @@ def draw_shader(type, color, alpha, coords, size=1, indices=None):
     gpu.state.blend_set('NONE')
 
 
-def draw_bmesh_faces(faces, world_matrix) -> tuple[list, list]:
-    """
-    Gets world-space vertex pairs and indices from `bmesh` faces.
-    Returns the list of 3D vertices and the list of triangle indices to be used in GPU batch.
-    Adapted from "Blockout" extension by niewinny (https://github.com/niewinny/blockout).
-    """
-
-    if not faces:
-        return None, None
-
-    vertices = []
-    indices = []
-
-    vert_index_map = {}
-    vert_count = 0
-    for face in faces:
-        face_indices = []
-
-        # Collect unique vertices only (avoid storing verts that are shared by multiple faces).
-        # (NOTE: Iterating over face corners because unlike `face.verts` they're ordered).
-        for loop in face.loops:
-            vert = loop.vert
-
-            if vert not in vert_index_map:
-                co = world_matrix @ Vector(vert.co)
-                vertices.append(co)
-                vert_index_map[vert] = vert_count
-                face_indices.append(vert_count)
-                vert_count += 1
-            else:
-                face_indices.append(vert_index_map[vert])
-
-        # Triangulate face and map local indices to global vertex indices.
-        if len(face_indices) >= 3:
-            try:
-                face_verts_co = [vertices[idx] for idx in face_indices]
-                tris = mathutils.geometry.tessellate_polygon([face_verts_co])
-                for tri in tris:
-                    indices.append((face_indices[tri[0]], face_indices[tri[1]], face_indices[tri[2]]))
-            except:
-                # Fallback to simple fan triangulation if tessellation fails.
-                for i in range(1, len(face_indices) - 1):
-                    indices.append((face_indices[0], face_indices[i], face_indices[i + 1]))
-
-    return vertices, indices
-
-
 def draw_circle_billboard(context, origin: Vector, radius: float, segments: int) -> list:
     """
     Draws a view-facing circle in the world-space around the given origin Vector.
@@ -0,0 +1,224 @@
+import bpy
+import bmesh
+import base64
+import io
+import numpy as np
+from contextlib import contextmanager
+from .. import __package__ as base_package
+
+
+# Multipliers that combine components of the face key into a single hash.
+KEY_MULTIPLIERS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+                            0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB, 0xBF58476D1CE4E5B9,
+                            0x2545F4914F6CDD1D, 0x5851F42D4C957F2D], dtype=np.uint64)
+
+# Precision (in units) of vertex positions that faces are compared with.
+KEY_PRECISION = 1e-5
+
+
+#### ------------------------------ /faces/ ------------------------------ ####
+
+def read_faces(mesh) -> dict:
+    """
+    Reads faces of the mesh as positions of their corners (independent of vertex indices, which cuts reorder),
+    numbers of corners, material indices, flat shading, and UV coordinates of their corners (by UV map names).
+    """
+
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    corner_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", corner_verts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    smooth = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+
+    uv_maps = {}
+    for layer in mesh.uv_layers:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", uvs)
+        uv_maps[layer.name] = uvs.reshape(-1, 2)
+
+    return {
+        "corners": positions.reshape(-1, 3)[corner_verts],
+        "loop_totals": loop_totals,
+        "material_index": material_index,
+        "sharp_face": ~smooth,
+        "uv_maps": uv_maps,
+    }
+
+
+def select_faces(faces: dict, mask: np.ndarray) -> dict:
+    """Returns the subset of faces for which the mask is True."""
+
+    corner_mask = np.repeat(mask, faces["loop_totals"])
+
+    return {
+        "corners": faces["corners"][corner_mask],
+        "loop_totals": faces["loop_totals"][mask],
+        "material_index": faces["material_index"][mask],
+        "sharp_face": faces["sharp_face"][mask],
+        "uv_maps": {name: uvs[corner_mask] for name, uvs in faces["uv_maps"].items()},
+    }
+
+
+def face_keys(faces: dict) -> np.ndarray:
+    """
+    Returns the hash of each face built from the number of its corners, and the sum, minimum & maximum of their positions.
+    Faces that a cut didn't touch keep their exact positions, so they have the same keys before and after it.
+    """
+
+    loop_totals = faces["loop_totals"]
+    if len(loop_totals) == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    offsets = np.concatenate(([0], np.cumsum(loop_totals)[:-1]))
+    quantized = np.round(faces["corners"].astype(np.float64) / KEY_PRECISION).astype(np.int64)
+
+    key = np.column_stack((loop_totals.astype(np.int64),
+                           np.add.reduceat(quantized, offsets, axis=0),
+                           np.minimum.reduceat(quantized, offsets, axis=0),
+                           np.maximum.reduceat(quantized, offsets, axis=0)))
+
+    return (key.astype(np.uint64) * KEY_MULTIPLIERS).sum(axis=1, dtype=np.uint64)
+
+
+def encode_faces(faces: dict) -> str:
+    """Compresses faces into a string that can be stored in the string property."""
+
+    # UV maps are stored by their order, because their names can't be used as names of arrays.
+    uv_maps = {f"uv_{i}": uvs.astype(np.float32) for i, uvs in enumerate(faces["uv_maps"].values())}
+
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer,
+                        corners=faces["corners"].astype(np.float32),
+                        loop_totals=faces["loop_totals"].astype(np.int32),
+                        material_index=faces["material_index"].astype(np.int16),
+                        sharp_face=faces["sharp_face"].astype(bool),
+                        uv_names=np.array(list(faces["uv_maps"]), dtype=str),
+                        **uv_maps)
+
+    return base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def decode_faces(data: str) -> dict:
+    """Reads faces compressed by `encode_faces` (faces recorded before shading & UVs were stored are smooth and have no UVs)."""
+
+    with np.load(io.BytesIO(base64.b64decode(data))) as arrays:
+        faces = {name: arrays[name] for name in ("corners", "loop_totals", "material_index")}
+
+        count = len(faces["loop_totals"])
+        faces["sharp_face"] = arrays["sharp_face"] if "sharp_face" in arrays else np.zeros(count, dtype=bool)
+
+        names = arrays["uv_names"] if "uv_names" in arrays else []
+        faces["uv_maps"] = {str(name): arrays[f"uv_{i}"] for i, name in enumerate(names)}
+
+    return faces
+
+
+
+#### ------------------------------ FUNCTIONS ------------------------------ ####
+
+@contextmanager
+def record_cut(context, obj, name: str):
+    """
+    Records faces that the destructive cut made inside the context removed from the object, and faces it added,
+    as the entry in the cut history of the object. Vertices that only moved are represented by faces that use them.
+    """
+
+    prefs = context.preferences.addons[base_package].preferences
+    if not prefs.use_cut_history or obj.type != 'MESH' or obj.mode == 'EDIT':
+        yield
+        return
+
+    before = read_faces(obj.data)
+    yield
+    after = read_faces(obj.data)
+
+    before_keys = face_keys(before)
+    after_keys = face_keys(after)
+    removed = select_faces(before, ~np.isin(before_keys, after_keys))
+    added = select_faces(after, ~np.isin(after_keys, before_keys))
+    if len(removed["loop_totals"]) == 0 and len(added["loop_totals"]) == 0:
+        return
+
+    cut = obj.booleans.cuts.add()
+    cut.name = name
+    cut.removed = encode_faces(removed)
+    cut.added = encode_faces(added)
+    cut.faces = len(removed["loop_totals"]) + len(added["loop_totals"])
+
+    # Forget the oldest cuts.
+    while len(obj.booleans.cuts) > prefs.cut_history_size:
+        obj.booleans.cuts.remove(0)
+
+
+def revert_cut(obj, cut) -> int:
+    """Replaces faces that the cut added with ones it removed. Returns the number of faces that couldn't be found."""
+
+    return swap_faces(obj, remove=decode_faces(cut.added), add=decode_faces(cut.removed))
+
+
+def replay_cut(obj, cut) -> int:
+    """Replaces faces that the cut removed with ones it added. Returns the number of faces that couldn't be found."""
+
+    return swap_faces(obj, remove=decode_faces(cut.removed), add=decode_faces(cut.added))
+
+
+def swap_faces(obj, remove: dict, add: dict) -> int:
+    """
+    Removes faces that match the `remove` faces from the mesh of the object, and adds the `add` faces,
+    merging their vertices with the ones on the border of the removed region.
+    Returns the number of faces that should be removed, but weren't found (i.e. because later cuts changed them).
+    Mesh is left untouched if any of them is missing, because swapping only some of them would leave holes.
+    """
+
+    mesh = obj.data
+    current_keys = face_keys(read_faces(mesh))
+    remove_keys = face_keys(remove)
+    missing = int(np.count_nonzero(~np.isin(remove_keys, current_keys)))
+    if missing:
+        return missing
+
+    indices = np.flatnonzero(np.isin(current_keys, remove_keys))
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.faces.ensure_lookup_table()
+    uv_layers = {name: bm.loops.layers.uv.get(name) or bm.loops.layers.uv.new(name) for name in add["uv_maps"]}
+
+    # Remove faces (and edges & vertices that aren't used by other faces).
+    faces = [bm.faces[i] for i in indices]
+    border = {vert for face in faces for vert in face.verts}
+    bmesh.ops.delete(bm, geom=faces, context='FACES')
+    border = [vert for vert in border if vert.is_valid]
+
+    # Add faces.
+    new_verts = []
+    start = 0
+    for total, material_index, sharp in zip(add["loop_totals"], add["material_index"], add["sharp_face"]):
+        verts = [bm.verts.new(co) for co in add["corners"][start:start + total]]
+        new_verts.extend(verts)
+        corners = slice(start, start + total)
+        start += total
+
+        try:
+            face = bm.faces.new(verts)
+        except ValueError:
+            continue
+
+        face.material_index = int(material_index)
+        face.smooth = not sharp
+        for name, layer in uv_layers.items():
+            for loop, uv in zip(face.loops, add["uv_maps"][name][corners]):
+                loop[layer].uv = uv
+
+    bmesh.ops.remove_doubles(bm, verts=new_verts + border, dist=KEY_PRECISION)
+
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+    return missing
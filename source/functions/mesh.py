@@ -1,9 +1,30 @@
 import bpy
 import bmesh
 import math
+import numpy as np
+import mathutils
 from mathutils import Vector
 
 
+# Attribute data types that can be stored (name of their value, number of components, NumPy type).
+# NOTE: Meshes with attributes of other types (i.e. strings) aren't stored in caches, because their results would differ.
+ATTRIBUTE_TYPES = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int8),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT16_2D': ("value", 2, np.int16),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+
+
 #### ------------------------------ /poll/ ------------------------------ ####
 
 def is_instanced_mesh(data):
@@ -104,3 +125,199 @@ def ensure_attribute(bm, name, domain):
             attr = bm.verts.layers.float.new(name)
 
     return attr
+
+
+
+def get_evaluated_polygon(obj, depsgraph, index) -> tuple:
+    """
+    Returns local coordinates of corners (in order of face loops) and the normal of one polygon of the evaluated object.
+    Only the polygon is read, through the polygon to corner mapping that mesh already has,
+    instead of converting the whole mesh. Returns None if the object has no such polygon.
+    """
+
+    obj_eval = obj.evaluated_get(depsgraph)
+
+    # Evaluated data of mesh objects can be read directly, other types have to be converted.
+    converted = obj_eval.type != 'MESH'
+    mesh = obj_eval.to_mesh() if converted else obj_eval.data
+
+    try:
+        if mesh is None or not (0 <= index < len(mesh.polygons)):
+            return None
+
+        polygon = mesh.polygons[index]
+        vertices = mesh.vertices
+        coords = [vertices[i].co.copy() for i in polygon.vertices]
+        return coords, polygon.normal.copy()
+
+    finally:
+        if converted:
+            obj_eval.to_mesh_clear()
+
+
+
+def sample_flat_mesh(mesh, resolution: int=16) -> list:
+    """
+    Returns points (in object space) that cover the mesh lying in its XY plane (i.e. shape of the cutter):
+    its vertices, centers of its edges, and points of the regular grid that are inside of its faces.
+    """
+
+    points = [v.co.copy() for v in mesh.vertices]
+    points += [(mesh.vertices[a].co + mesh.vertices[b].co) / 2 for a, b in (e.vertices for e in mesh.edges)]
+    if len(points) == 0:
+        return points
+
+    mesh.calc_loop_triangles()
+    triangles = [[mesh.vertices[i].co.xy for i in tri.vertices] for tri in mesh.loop_triangles]
+
+    low = Vector((min(p.x for p in points), min(p.y for p in points)))
+    high = Vector((max(p.x for p in points), max(p.y for p in points)))
+    step = (high - low) / max(resolution - 1, 1)
+    for i in range(resolution):
+        for j in range(resolution):
+            point = Vector((low.x + step.x * i, low.y + step.y * j))
+            if any(mathutils.geometry.intersect_point_tri_2d(point, *tri) for tri in triangles):
+                points.append(point.to_3d())
+
+    return points
+
+
+def _read_positions_in_bounds(mesh, matrix, min_co, max_co) -> tuple[np.ndarray, np.ndarray]:
+    """Returns vertex positions transformed with the `matrix`, and the mask of ones inside of the 2D (XY) bounds."""
+
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+
+    matrix = np.array(matrix, dtype=np.float32)
+    local = positions.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    inside = ((local[:, 0] >= min_co[0]) & (local[:, 0] <= max_co[0]) &
+              (local[:, 1] >= min_co[1]) & (local[:, 1] <= max_co[1]))
+
+    return local, inside
+
+
+def get_vertices_in_bounds(mesh, matrix, min_co, max_co) -> np.ndarray:
+    """
+    Returns positions of vertices that are inside of the 2D (XY) bounds (as the array of shape (N, 3)).
+    Vertex positions are transformed into the space of the bounds with the `matrix`.
+    """
+
+    local, inside = _read_positions_in_bounds(mesh, matrix, min_co, max_co)
+    return local[inside]
+
+
+def get_faces_in_bounds(mesh, matrix, min_co, max_co) -> np.ndarray:
+    """
+    Returns the boolean mask of faces that have at least one corner inside of the 2D (XY) bounds.
+    Vertex positions are transformed into the space of the bounds with the `matrix`.
+    """
+
+    corner_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", corner_verts)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+
+    if len(loop_starts) == 0:
+        return np.zeros(0, dtype=bool)
+
+    __, inside = _read_positions_in_bounds(mesh, matrix, min_co, max_co)
+    return np.add.reduceat(inside[corner_verts].astype(np.int32), loop_starts) > 0
+
+
+def write_faces(mesh, face_mask: np.ndarray, target):
+    """
+    Replaces the geometry of the `target` mesh with faces of `mesh` that are selected in the `face_mask` (and vertices they use).
+    Point, face & face corner attributes are copied (UV maps, materials, shading, etc.), edge attributes are not,
+    because edges are calculated again. Materials are only added if the target doesn't have any yet.
+    """
+
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    corner_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", corner_verts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    # Remap corners to vertices that are used by the extracted faces.
+    corner_mask = np.repeat(face_mask, loop_totals)
+    corners = corner_verts[corner_mask]
+    used, remap = np.unique(corners, return_inverse=True)
+    totals = loop_totals[face_mask]
+    starts = np.zeros(len(totals), dtype=np.int32)
+    np.cumsum(totals[:-1], out=starts[1:])
+
+    target.clear_geometry()
+    target.vertices.add(len(used))
+    target.vertices.foreach_set("co", positions.reshape(-1, 3)[used].ravel())
+    target.loops.add(len(corners))
+    target.loops.foreach_set("vertex_index", remap.astype(np.int32))
+    target.polygons.add(len(totals))
+    target.polygons.foreach_set("loop_start", starts)
+
+    # Generic attributes.
+    masks = {'POINT': used, 'FACE': face_mask, 'CORNER': corner_mask}
+    for attr in mesh.attributes:
+        if attr.name.startswith(".") or attr.name == "position":
+            continue
+        if attr.domain not in masks or attr.data_type not in ATTRIBUTE_TYPES:
+            continue
+
+        key, size, dtype = ATTRIBUTE_TYPES[attr.data_type]
+        values = np.empty(len(attr.data) * size, dtype=dtype)
+        attr.data.foreach_get(key, values)
+
+        target_attr = target.attributes.get(attr.name)
+        if target_attr is None:
+            target_attr = target.attributes.new(attr.name, attr.data_type, attr.domain)
+        target_attr.data.foreach_set(key, values.reshape(-1, size)[masks[attr.domain]].ravel())
+
+    target.update(calc_edges=True)
+
+    if len(target.materials) == 0:
+        for material in mesh.materials:
+            target.materials.append(material)
+
+
+
+#### ------------------------------ /buffers/ ------------------------------ ####
+
+def write_vertex_positions(bm, mesh) -> bool:
+    """
+    Writes vertex coordinates of the `bmesh` into the mesh in bulk, without converting the topology.
+    Returns False (and writes nothing) if element counts of `bmesh` and mesh don't match.
+    NOTE: Caller is responsible for knowing that topology & attributes are otherwise unchanged.
+    """
+
+    if (len(bm.verts) != len(mesh.vertices) or
+        len(bm.edges) != len(mesh.edges) or
+        len(bm.faces) != len(mesh.polygons)):
+        return False
+
+    positions = np.fromiter((c for v in bm.verts for c in v.co), dtype=np.float32, count=len(bm.verts) * 3)
+    mesh.vertices.foreach_set("co", positions)
+    mesh.update_tag()
+
+    return True
+
+
+def get_triangle_buffers(mesh, world_matrix) -> tuple:
+    """
+    Returns world-space vertex positions (float32, N x 3) and triangle indices (int32, M x 3) of the mesh,
+    read from its loop triangles in bulk, to be used in GPU batch. Returns `(None, None)` if mesh has no faces.
+    NOTE: Doesn't use the GPU module, so that buffers can be built (and tested) in background mode.
+    """
+
+    mesh.calc_loop_triangles()
+    triangles = len(mesh.loop_triangles)
+    if triangles == 0:
+        return None, None
+
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    indices = np.empty(triangles * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", indices)
+
+    matrix = np.array(world_matrix, dtype=np.float32)
+    vertices = positions.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+    return np.ascontiguousarray(vertices, dtype=np.float32), indices.reshape(-1, 3)
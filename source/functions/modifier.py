@@ -3,6 +3,16 @@ import bmesh
 from contextlib import contextmanager
 from .. import __package__ as base_package
 
+from ..constants import (
+    MULTIPLYING_MODIFIERS,
+    PROXY_MODIFIER,
+    RESULT_MODIFIER,
+    RESULT_REASONS,
+    VIEWPORT_MODIFIER_SUFFIX,
+)
+from .asset import (
+    get_node_group,
+)
 from .mesh import (
     is_instanced_mesh,
 )
@@ -59,6 +69,38 @@ def get_modifiers_to_apply(context, obj, custom_list=None) -> list:
 
 
 
+def list_misplaced_booleans(obj) -> list:
+    """
+    Finds Boolean modifiers that come after modifiers which multiply the amount of geometry
+    (Subdivision Surface, Multiresolution, Bevel), making the solver work on much more geometry.
+    Returns the list of tuples with the Boolean modifier, list of multiplying modifiers
+    that come before it, and the estimated number of triangles it receives as the input.
+    """
+
+    mesh = obj.data
+    triangles = len(mesh.loops) - 2 * len(mesh.polygons)
+
+    misplaced = []
+    multipliers = []
+    for mod in obj.modifiers:
+        if not mod.show_viewport:
+            continue
+
+        if is_boolean_modifier(mod):
+            if multipliers:
+                misplaced.append((mod, list(multipliers), triangles))
+            if mod.object.type == 'MESH':
+                cutter_mesh = mod.object.data
+                triangles += len(cutter_mesh.loops) - 2 * len(cutter_mesh.polygons)
+
+        elif mod.type in MULTIPLYING_MODIFIERS:
+            multipliers.append(mod)
+            triangles = estimate_modifier_triangles(mod, triangles)
+
+    return misplaced
+
+
+
 #### ------------------------------ /poll/ ------------------------------ ####
 
 def is_boolean_modifier(mod, check_cutter=True) -> bool:
@@ -68,23 +110,67 @@ def is_boolean_modifier(mod, check_cutter=True) -> bool:
         return False
     if mod.type != 'BOOLEAN':
         return False
+    if is_viewport_modifier(mod):
+        return False
     if check_cutter and mod.object is None:
         return False
 
     return True
 
 
+def is_viewport_modifier(mod) -> bool:
+    """Checks if the modifier is the viewport-only copy of the Boolean modifier (made by viewport fidelity)."""
+
+    return mod.type == 'BOOLEAN' and mod.name.endswith(VIEWPORT_MODIFIER_SUFFIX)
+
+
+def is_modifier_suspended(obj, mod, reasons=None) -> bool:
+    """Checks if the modifier was temporarily disabled by the add-on (optionally, for one of the given reasons)."""
+
+    item = obj.booleans.suspended_modifiers.get(mod.name)
+    if item is None:
+        return False
+    if reasons is not None and item.reason not in reasons:
+        return False
+
+    return True
+
+
+def is_modifier_enabled(obj, mod) -> bool:
+    """Checks if the modifier is enabled in the viewport by the user (even if it's currently suspended by the add-on)."""
+
+    if mod.name == RESULT_MODIFIER:
+        return False
+
+    mod = get_viewport_modifier(mod)
+    return mod.show_viewport or is_modifier_suspended(obj, mod)
+
+
+
+#### ------------------------------ /get/ ------------------------------ ####
+
+def get_viewport_modifier(mod):
+    """Returns the modifier that evaluates the given one in the viewport (its viewport-only copy, if it has one)."""
+
+    if mod.type != 'BOOLEAN':
+        return mod
+
+    copy = mod.id_data.modifiers.get(mod.name + VIEWPORT_MODIFIER_SUFFIX)
+    return copy if copy is not None else mod
+
+
 
 #### ------------------------------ FUNCTIONS ------------------------------ ####
 
-def add_boolean_modifier(self, context, obj, cutter, mode, solver, pin=False, redo=True):
+def add_boolean_modifier(self, context, obj, cutter, mode, solver, pin=False, redo=True, name=None):
     """Adds the Boolean modifier with specified cutter and properties to a given object."""
 
     if bpy.app.version < (5, 0, 0) and solver == 'FLOAT':
         solver = 'FAST'
 
     prefs = context.preferences.addons[base_package].preferences
-    name = "boolean_" + cutter.name.replace("boolean_", "")
+    if name is None:
+        name = "boolean_" + cutter.name.replace("boolean_", "")
 
     modifier = obj.modifiers.new(name, 'BOOLEAN')
     modifier.operation = mode
@@ -104,10 +190,73 @@ def add_boolean_modifier(self, context, obj, cutter, mode, solver, pin=False, re
         index = obj.modifiers.find(modifier.name)
         obj.modifiers.move(index, 0)
 
+    # Use cheaper solver and low-poly cutter in the viewport (copy is made last, so that it inherits everything).
+    if prefs.use_viewport_fidelity:
+        set_viewport_fidelity(obj, modifier, prefs.viewport_solver, prefs.proxy_faces)
+
     return modifier
 
 
-def apply_modifiers(context, obj, modifiers: list, force_clean=False):
+def estimate_modifier_triangles(mod, triangles: int) -> int:
+    """
+    Roughly estimates the number of triangles that geometry-multiplying modifier outputs for given input.
+    NOTE: Estimation only needs to show the order of magnitude, it doesn't account for the mesh topology.
+    """
+
+    # Each level splits every face in four.
+    if mod.type in ('SUBSURF', 'MULTIRES'):
+        return triangles * (4 ** mod.levels)
+
+    # Each beveled edge is replaced by a strip of faces (estimating ~1.5 edges per triangle).
+    if mod.type == 'BEVEL':
+        if mod.affect == 'VERTICES':
+            return triangles + triangles * mod.segments
+        if mod.limit_method == 'NONE':
+            edges = triangles * 1.5
+        else:
+            edges = triangles * 0.5
+        return int(triangles + edges * mod.segments * 2)
+
+    return triangles
+
+
+def reorder_misplaced_booleans(obj) -> tuple[list, list]:
+    """
+    Moves Boolean modifiers directly above the geometry-multiplying modifiers that come right before them.
+    Boolean modifier is only moved past multiplying modifiers (and ones that are disabled), because any other modifier
+    (i.e. Mirror, Array, Solidify, or another Boolean) would change the geometry that it cuts. Modifiers can't be
+    moved above Multiresolution modifier either, because it requires original data.
+    Returns the list of moved modifiers, and the list of tuples with the modifier that couldn't be moved
+    and the modifier that stopped it.
+    """
+
+    moved = []
+    skipped = []
+    for mod, __, __ in list_misplaced_booleans(obj):
+        index = obj.modifiers.find(mod.name)
+
+        target = index
+        blocker = None
+        for i in range(index - 1, -1, -1):
+            other = obj.modifiers[i]
+            if not other.show_viewport and not other.show_render:
+                continue
+            if other.type not in MULTIPLYING_MODIFIERS or other.type == 'MULTIRES':
+                blocker = other
+                break
+            target = i
+
+        if target == index:
+            skipped.append((mod, blocker))
+            continue
+
+        obj.modifiers.move(index, target)
+        moved.append(mod)
+
+    return moved, skipped
+
+
+def apply_modifiers(context, obj, modifiers: list, force_clean=False, use_evaluated=False):
     """
     Apply modifiers on object.
     Instead of using `bpy.ops.object.modifier_apply`, by default this function uses
@@ -117,69 +266,93 @@ def apply_modifiers(context, obj, modifiers: list, force_clean=False):
 
     This method is up to 2x faster, although it's considered experimental
     and may fail in some cases, so a fallback to `bpy.ops.object.modifier_apply` is kept.
+
+    If `use_evaluated` is True the caller guarantees that nothing changed since the object
+    was last evaluated (e.g. for the live preview), and that result is committed as it is,
+    without forcing the depsgraph to evaluate it again. It's ignored when other modifiers
+    have to be hidden (or when modifiers use cheaper solvers or cutter proxies in the viewport),
+    because the last evaluation doesn't represent the result anymore.
     """
 
     prefs = context.preferences.addons[base_package].preferences
     _stored_active_obj = context.active_object
 
+    # Viewport-only copies are never applied, modifiers they're copies of are applied instead.
+    modifiers = [mod for mod in modifiers if not is_viewport_modifier(mod)]
+
+    # Replace the displayed result with actual modifiers (they are hidden while it's displayed).
+    if obj.booleans.result_key:
+        names = [mod.name for mod in modifiers]
+        remove_result_modifier(obj)
+        modifiers = [obj.modifiers[name] for name in names if name in obj.modifiers]
+
+    # Modifiers that were culled or hidden by solo in the viewport are always applied.
+    resume_modifiers(obj, reasons=('CULL',))
+    unsolo_modifier(obj)
+
     # Make object data unique if it's instanced.
     if is_instanced_mesh(obj.data):
         context.active_object.data = context.active_object.data.copy()
 
-    try:
-        # Don't use this method if it's not enabled by user in preferences, unless caller forces it.
-        if not prefs.fast_modifier_apply:
-            if not force_clean:
-                raise Exception()
-
-        context.view_layer.objects.active = obj
-        with hide_modifiers(obj, excluding=modifiers):
-            # Create a temporary mesh from evaluated object.
-            depsgraph = context.evaluated_depsgraph_get()
-            evaluated_obj = obj.evaluated_get(depsgraph)
-            temp_data = evaluated_obj.to_mesh(preserve_all_data_layers=True,
-                                              depsgraph=depsgraph)
-
-            # Create `bmesh` from temporary mesh and update edit mesh.
-            if context.mode == 'EDIT_MESH':
-                bm = bmesh.from_edit_mesh(obj.data)
-                bm.clear()
-                bm.from_mesh(temp_data)
-                bmesh.update_edit_mesh(obj.data)
-            else:
-                bm = bmesh.new()
-                bm.from_mesh(temp_data)
-                bm.to_mesh(obj.data)
-
-            bm.free()
-            evaluated_obj.to_mesh_clear()
-
-            # Remove modifiers.
-            for mod in modifiers:
-                obj.modifiers.remove(mod)
-
-            # Remove shape keys if there are any.
-            # (after above operations none of the shape keys have any effect).
-            if obj.data.shape_keys:
-                obj.shape_key_clear()
-
-    except Exception as e:
-        # print("Error applying modifiers with `bmesh` method:", e, "falling back to `bpy.ops` method")
-
-        context_override = {"active_object": obj, "mode": 'OBJECT'}
-        with context.temp_override(**context_override):
-            # Apply shape keys if there are any.
-            if obj.data.shape_keys:
-                bpy.ops.object.shape_key_remove(all=True, apply_mix=True)
-
-            # If all modifiers need to be applied convert to Mesh.
-            if modifiers == obj.modifiers.values():
-                print("Applying all modifiers by converting to Mesh")
-                convert_to_mesh(context, obj)
-                return
-
-            for mod in modifiers:
-                bpy.ops.object.modifier_apply(modifier=mod.name)
+    # Modifiers are applied with their render solvers and full-resolution cutters.
+    with full_fidelity(obj, modifiers) as fidelity_changed:
+        try:
+            # Don't use this method if it's not enabled by user in preferences, unless caller forces it.
+            if not prefs.fast_modifier_apply:
+                if not force_clean:
+                    raise Exception()
+
+            context.view_layer.objects.active = obj
+            with hide_modifiers(obj, excluding=modifiers) as hidden_modifiers:
+                # Create a temporary mesh from evaluated object.
+                if use_evaluated and len(hidden_modifiers) == 0 and not fidelity_changed:
+                    depsgraph = context.view_layer.depsgraph
+                else:
+                    depsgraph = context.evaluated_depsgraph_get()
+                evaluated_obj = obj.evaluated_get(depsgraph)
+                temp_data = evaluated_obj.to_mesh(preserve_all_data_layers=True,
+                                                  depsgraph=depsgraph)
+
+                # Create `bmesh` from temporary mesh and update edit mesh.
+                if context.mode == 'EDIT_MESH':
+                    bm = bmesh.from_edit_mesh(obj.data)
+                    bm.clear()
+                    bm.from_mesh(temp_data)
+                    bmesh.update_edit_mesh(obj.data)
+                else:
+                    bm = bmesh.new()
+                    bm.from_mesh(temp_data)
+                    bm.to_mesh(obj.data)
+
+                bm.free()
+                evaluated_obj.to_mesh_clear()
+
+                # Remove modifiers.
+                for mod in modifiers:
+                    obj.modifiers.remove(mod)
+
+                # Remove shape keys if there are any.
+                # (after above operations none of the shape keys have any effect).
+                if obj.data.shape_keys:
+                    obj.shape_key_clear()
+
+        except Exception as e:
+            # print("Error applying modifiers with `bmesh` method:", e, "falling back to `bpy.ops` method")
+
+            context_override = {"active_object": obj, "mode": 'OBJECT'}
+            with context.temp_override(**context_override):
+                # Apply shape keys if there are any.
+                if obj.data.shape_keys:
+                    bpy.ops.object.shape_key_remove(all=True, apply_mix=True)
+
+                # If all modifiers need to be applied convert to Mesh.
+                if modifiers == [mod for mod in obj.modifiers if not is_viewport_modifier(mod)]:
+                    print("Applying all modifiers by converting to Mesh")
+                    convert_to_mesh(context, obj)
+                    return
+
+                for mod in modifiers:
+                    bpy.ops.object.modifier_apply(modifier=mod.name)
 
     context.view_layer.objects.active = _stored_active_obj
 
@@ -197,41 +370,335 @@ def hide_modifiers(obj, excluding: list):
             mod.show_viewport = False
 
     try:
-        yield
+        yield visible_modifiers
     finally:
         for mod in visible_modifiers:
             mod.show_viewport = True
 
 
-def add_modifier_asset(obj, path: str, asset: str):
-    """Loads in the node group asset and adds a Geometry Nodes modifier using it."""
+@contextmanager
+def full_fidelity(obj, modifiers: list):
+    """
+    Temporarily evaluates given Boolean modifiers in the viewport instead of their viewport-only copies
+    (which are hidden, because they're not in the list of modifiers), and hides low-poly proxies of their cutters.
+    Yields whether anything was changed (i.e. whether the last viewport evaluation differs from the full-fidelity one).
+    NOTE: Modifiers are restored by name, because applied ones are removed before the context exits.
+    """
+
+    enabled = []
+    proxies = []
+    for mod in modifiers:
+        if not is_boolean_modifier(mod):
+            continue
+
+        copy = get_viewport_modifier(mod)
+        if copy != mod:
+            mod.show_viewport = copy.show_viewport
+            enabled.append(mod.name)
+
+        proxy = mod.object.modifiers.get(PROXY_MODIFIER)
+        if proxy is not None and proxy.show_viewport:
+            proxy.show_viewport = False
+            proxies.append(proxy)
 
     try:
-        # Load in the node group.
-        if bpy.app.version >= (5, 0, 0):
-            with bpy.data.libraries.load(path, link=True, pack=True) as (data_from, data_to):
-                if asset in data_from.node_groups:
-                    data_to.node_groups = [asset]
+        yield bool(enabled or proxies)
+    finally:
+        for name in enabled:
+            mod = obj.modifiers.get(name)
+            if mod is not None:
+                mod.show_viewport = False
+
+        for proxy in proxies:
+            proxy.show_viewport = True
+
+        # Remove viewport-only copies of applied modifiers.
+        remove_orphan_viewport_modifiers(obj)
+
+
+def suspend_modifiers(obj, modifiers: list, reason: str):
+    """
+    Temporarily disables modifiers in the viewport and records that the add-on (and not the user) disabled them,
+    so that they can be re-enabled later, and so that the interface can still display them as enabled.
+    Boolean modifiers that have viewport-only copies are suspended by suspending their copies.
+    """
+
+    for mod in modifiers:
+        mod = get_viewport_modifier(mod)
+        if not mod.show_viewport:
+            continue
+
+        item = obj.booleans.suspended_modifiers.add()
+        item.name = mod.name
+        item.reason = reason
+        mod.show_viewport = False
 
-        else:
-            with bpy.data.libraries.load(path) as (data_from, data_to):
-                if asset in data_from.node_groups:
-                    data_to.node_groups = [asset]
 
-        node_group = bpy.data.node_groups[asset]
+def resume_modifiers(obj, reasons=None) -> list:
+    """Re-enables modifiers that were suspended for one of the given reasons (or for any reason)."""
 
-        # Add modifier to the object.
-        mod = obj.modifiers.new(asset, type='NODES')
-        mod.node_group = node_group
+    resumed = []
+    records = obj.booleans.suspended_modifiers
+    for i in reversed(range(len(records))):
+        item = records[i]
+        if reasons is not None and item.reason not in reasons:
+            continue
+
+        mod = obj.modifiers.get(item.name)
+        if mod is not None:
+            mod.show_viewport = True
+            resumed.append(mod)
+        records.remove(i)
+
+    return resumed
+
+
+def solo_modifier(obj, mod):
+    """Suspends all other Boolean modifiers of the object, so that only the base mesh and the given one are evaluated."""
+
+    others = [m for m in obj.modifiers if is_boolean_modifier(m, check_cutter=False) and m != mod]
+    suspend_modifiers(obj, others, 'SOLO')
+
+    obj.booleans.solo = mod.name
+    mod = get_viewport_modifier(mod)
+    if not mod.show_viewport and not is_modifier_suspended(obj, mod):
+        mod.show_viewport = True
+        obj.booleans.solo_enabled = True
+
+
+def unsolo_modifier(obj):
+    """Restores the state Boolean modifiers of the object were in before one of them was soloed."""
+
+    if not obj.booleans.solo:
+        return
+
+    mod = obj.modifiers.get(obj.booleans.solo)
+    if mod is not None and obj.booleans.solo_enabled:
+        get_viewport_modifier(mod).show_viewport = False
+
+    obj.booleans.solo = ""
+    obj.booleans.solo_enabled = False
+    resume_modifiers(obj, reasons=('SOLO',))
+
+
+def ensure_result_node_group() -> bpy.types.NodeTree:
+    """Returns the node group that outputs the geometry of another object, and creates it if it doesn't exist."""
+
+    name = "." + RESULT_MODIFIER
+    node_group = bpy.data.node_groups.get(name)
+
+    if node_group is None:
+        node_group = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+        node_group.is_modifier = True
+        node_group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        node_group.interface.new_socket("Object", in_out='INPUT', socket_type='NodeSocketObject')
+        node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+        group_input = node_group.nodes.new('NodeGroupInput')
+        group_output = node_group.nodes.new('NodeGroupOutput')
+        object_info = node_group.nodes.new('GeometryNodeObjectInfo')
+        object_info.transform_space = 'ORIGINAL'
+        group_output.location = (400, 0)
+        object_info.location = (200, 0)
+
+        node_group.links.new(group_input.outputs["Object"], object_info.inputs["Object"])
+        node_group.links.new(object_info.outputs["Geometry"], group_output.inputs["Geometry"])
+
+    return node_group
+
+
+def add_result_modifier(obj, mesh, modifiers: list, reason: str):
+    """
+    Displays the stored result of the given modifiers (`mesh`) instead of evaluating them.
+    Modifiers are suspended, and the Geometry Nodes modifier that outputs the mesh (through the hidden result object)
+    is placed right after the last one of them, so that modifiers which come after still affect the result.
+    """
+
+    # Store the mesh in the hidden result object (it's not linked to any scene).
+    result = obj.booleans.result
+    if result is None:
+        result = bpy.data.objects.new(obj.name + "_result", mesh)
+        obj.booleans.result = result
+    else:
+        old_mesh = result.data
+        result.data = mesh
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+    mod = obj.modifiers.get(RESULT_MODIFIER)
+    if mod is None:
+        mod = obj.modifiers.new(RESULT_MODIFIER, 'NODES')
+        mod.node_group = ensure_result_node_group()
+        mod.show_render = False
+        mod.show_in_editmode = False
         mod.show_group_selector = False
         mod.show_manage_panel = False
 
-        return mod
+        socket = mod.node_group.interface.items_tree["Object"]
+        update_modifier_input(mod, socket.identifier, result)
+
+    resume_modifiers(obj, reasons=RESULT_REASONS)
+    suspend_modifiers(obj, modifiers, reason)
+
+    # Place result modifier right after the last replaced modifier.
+    index = obj.modifiers.find(mod.name)
+    last_index = max(obj.modifiers.find(m.name) for m in modifiers)
+    obj.modifiers.move(index, last_index + 1 if index > last_index else last_index)
+
+
+def remove_result_modifier(obj):
+    """Removes the displayed result of the object and resumes evaluation of modifiers it replaced."""
+
+    mod = obj.modifiers.get(RESULT_MODIFIER)
+    if mod is not None:
+        obj.modifiers.remove(mod)
+
+    result = obj.booleans.result
+    if result is not None:
+        mesh = result.data
+        bpy.data.objects.remove(result)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+    obj.booleans.result_key = ""
+    obj.booleans.frozen = False
+    resume_modifiers(obj, reasons=RESULT_REASONS)
+
+
+def set_viewport_fidelity(obj, mod, solver: str, proxy_faces: int):
+    """
+    Makes the Boolean modifier use the cheaper `solver` in the viewport through its viewport-only copy.
+    Modifier itself keeps the configured solver and stays enabled in the render, but it's suspended in the viewport,
+    so files rendered, exported or applied without the add-on still get the full-fidelity result.
+    Cutters with more than `proxy_faces` faces get the Decimate modifier that is only visible in the viewport.
+    """
+
+    if bpy.app.version < (5, 0, 0) and solver == 'FLOAT':
+        solver = 'FAST'
+
+    if mod.solver != solver and get_viewport_modifier(mod) == mod:
+        # Modifier is suspended before the copy exists, so that suspending isn't redirected to the copy.
+        enabled = mod.show_viewport
+        suspend_modifiers(obj, [mod], 'FIDELITY')
+
+        copy = obj.modifiers.new(mod.name + VIEWPORT_MODIFIER_SUFFIX, 'BOOLEAN')
+        copy.show_viewport = enabled
+        copy.show_render = False
+        copy.show_expanded = False
+        copy.solver = solver
+        sync_viewport_modifier(mod, copy)
+
+        # Place the copy right after the modifier.
+        obj.modifiers.move(obj.modifiers.find(copy.name), obj.modifiers.find(mod.name) + 1)
+
+    cutter = mod.object
+    if cutter.type != 'MESH' or proxy_faces == 0:
+        return
+
+    faces = len(cutter.data.polygons)
+    proxy = cutter.modifiers.get(PROXY_MODIFIER)
+    if faces <= proxy_faces:
+        if proxy is not None:
+            cutter.modifiers.remove(proxy)
+        return
+
+    if proxy is None:
+        proxy = cutter.modifiers.new(PROXY_MODIFIER, 'DECIMATE')
+        proxy.show_render = False
+        proxy.show_in_editmode = False
+        proxy.show_expanded = False
+    proxy.decimate_type = 'COLLAPSE'
+    proxy.ratio = proxy_faces / faces
+
+
+def sync_viewport_modifier(mod, copy):
+    """Copies settings of the Boolean modifier (except the solver) to its viewport-only copy."""
+
+    for prop in ("operation", "operand_type", "object", "collection", "material_mode",
+                 "use_self", "use_hole_tolerant", "double_threshold", "show_in_editmode"):
+        value = getattr(mod, prop)
+        if getattr(copy, prop) != value:
+            setattr(copy, prop, value)
+
+
+def sync_viewport_modifiers(obj):
+    """
+    Keeps viewport-only copies of Boolean modifiers of the object in sync with modifiers they're copies of,
+    i.e. after the user edits the modifier, or enables it in the viewport (copy is enabled instead).
+    """
+
+    remove_orphan_viewport_modifiers(obj)
+
+    for copy in obj.modifiers:
+        if not is_viewport_modifier(copy):
+            continue
+
+        mod = obj.modifiers[copy.name[:-len(VIEWPORT_MODIFIER_SUFFIX)]]
+        sync_viewport_modifier(mod, copy)
+
+        if mod.show_viewport:
+            mod.show_viewport = False
+            copy.show_viewport = True
 
-    except Exception as e:
-        print("Modifier node group could not be loaded:", e)
+
+def remove_orphan_viewport_modifiers(obj):
+    """Removes viewport-only copies of Boolean modifiers that were applied or removed."""
+
+    for copy in list(obj.modifiers):
+        if not is_viewport_modifier(copy):
+            continue
+
+        name = copy.name[:-len(VIEWPORT_MODIFIER_SUFFIX)]
+        if name in obj.modifiers:
+            continue
+
+        _forget_suspended_modifiers(obj, (name, copy.name))
+        obj.modifiers.remove(copy)
+
+
+def remove_viewport_fidelity(obj):
+    """Removes viewport-only copies of Boolean modifiers of the object (and its cutter proxy), enabling modifiers instead."""
+
+    for copy in list(obj.modifiers):
+        if not is_viewport_modifier(copy):
+            continue
+
+        mod = obj.modifiers.get(copy.name[:-len(VIEWPORT_MODIFIER_SUFFIX)])
+        if mod is not None:
+            enabled = is_modifier_enabled(obj, mod)
+            _forget_suspended_modifiers(obj, (mod.name, copy.name))
+            mod.show_viewport = enabled
+        obj.modifiers.remove(copy)
+
+    proxy = obj.modifiers.get(PROXY_MODIFIER)
+    if proxy is not None:
+        obj.modifiers.remove(proxy)
+
+
+def _forget_suspended_modifiers(obj, names):
+    """Removes records of suspended modifiers with given names (without enabling them)."""
+
+    records = obj.booleans.suspended_modifiers
+    for i in reversed(range(len(records))):
+        if records[i].name in names:
+            records.remove(i)
+
+
+def add_modifier_asset(obj, asset: str):
+    """Adds a Geometry Nodes modifier using the node group asset (which is loaded in only once per session)."""
+
+    node_group = get_node_group(asset)
+    if node_group is None:
+        print("Modifier node group could not be loaded:", asset)
         return None
 
+    mod = obj.modifiers.new(asset, type='NODES')
+    mod.node_group = node_group
+    mod.show_group_selector = False
+    mod.show_manage_panel = False
+
+    return mod
+
 
 def update_modifier_input(modifier, socket: str, value):
     """Change the value of the geometry nodes modifier input socket."""
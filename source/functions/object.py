@@ -110,8 +110,11 @@ def change_parent(context, obj, parent, inverse=False):
         obj.matrix_parent_inverse = parent.matrix_world.inverted()
 
 
-def set_object_origin(obj, bm, point='CENTER', custom: Vector=None):
-    """Sets the origin of a mesh type object to given position by shifting vertices."""
+def set_object_origin(obj, bm, point='CENTER', custom: Vector=None, update_mesh=True):
+    """
+    Sets the origin of a mesh type object to given position by shifting vertices.
+    When `update_mesh` is False, only `bmesh` is transformed and writing it into the mesh is left to the caller.
+    """
 
     # Center of the bounding box.
     if point == 'CENTER_OBJ':
@@ -133,7 +136,8 @@ def set_object_origin(obj, bm, point='CENTER', custom: Vector=None):
 
     matrix = Matrix.Translation(position_local)
     bmesh.ops.transform(bm, matrix=matrix.inverted(), verts=bm.verts)
-    bm.to_mesh(obj.data)
+    if update_mesh:
+        bm.to_mesh(obj.data)
 
     obj.location = position_world
 
@@ -0,0 +1,203 @@
+import bpy
+import numpy as np
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+from .bvh import (
+    MAX_RAY_HITS,
+    RAY_EPSILON,
+)
+
+
+#### ------------------------------ /bounds/ ------------------------------ ####
+
+def get_oriented_bounds(obj, points=None) -> tuple:
+    """
+    Returns the oriented bounding box of the object in world space, as its center, unit axes (rows) and half-extents.
+    Box is made from `points` in object space if they're given, or from the bounding box of the object.
+    """
+
+    corners = points if points else [Vector(c) for c in obj.bound_box]
+
+    low = Vector([min(c[axis] for c in corners) for axis in range(3)])
+    high = Vector([max(c[axis] for c in corners) for axis in range(3)])
+
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    columns = matrix[:3, :3].T
+    scales = np.linalg.norm(columns, axis=1)
+    axes = columns / np.maximum(scales, 1e-12)[:, None]
+
+    center = matrix[:3, :3] @ np.array((low + high) / 2) + matrix[:3, 3]
+    half = np.array((high - low) / 2) * scales
+
+    return center, axes, half
+
+
+def build_bounds_table(objects) -> tuple:
+    """Returns oriented bounding boxes of objects stacked into arrays (centers, axes & half-extents), for vectorized tests."""
+
+    bounds = [get_oriented_bounds(obj) for obj in objects]
+    if not bounds:
+        return np.zeros((0, 3)), np.zeros((0, 3, 3)), np.zeros((0, 3))
+
+    centers, axes, halves = zip(*bounds)
+    return np.array(centers), np.array(axes), np.array(halves)
+
+
+
+#### ------------------------------ /overlap/ ------------------------------ ####
+
+def overlap_oriented_bounds(bounds, table, epsilon=1e-6) -> np.ndarray:
+    """
+    Tests one oriented bounding box against all boxes in the table with the separating axis theorem.
+    Returns the boolean mask of boxes in the table that overlap it.
+    """
+
+    center, axes, half = bounds
+    centers, table_axes, table_halves = table
+    count = len(centers)
+    if count == 0:
+        return np.zeros(0, dtype=bool)
+
+    # Candidate separating axes: face normals of both boxes, and cross products of their edges.
+    crosses = np.cross(axes[None, :, None, :], table_axes[:, None, :, :]).reshape(count, 9, 3)
+    candidates = np.concatenate((np.broadcast_to(axes, (count, 3, 3)), table_axes, crosses), axis=1)
+
+    # Projected radii of both boxes, and projected distance between their centers.
+    radius = (np.abs(candidates @ axes.T) * half).sum(axis=2)
+    table_radius = (np.abs(np.einsum('nlj,nkj->nlk', candidates, table_axes)) * table_halves[:, None, :]).sum(axis=2)
+    distance = np.abs(np.einsum('nlj,nj->nl', candidates, centers - center))
+
+    separated = distance > radius + table_radius + epsilon
+    return ~separated.any(axis=1)
+
+
+
+#### ------------------------------ /pairs/ ------------------------------ ####
+
+def get_world_bounds(objects) -> tuple:
+    """Returns minimum & maximum corners of world-space axis-aligned bounding boxes of objects (as N x 3 arrays)."""
+
+    if not objects:
+        return np.zeros((0, 3)), np.zeros((0, 3))
+
+    corners = np.array([obj.bound_box for obj in objects], dtype=np.float64)
+    matrices = np.array([obj.matrix_world for obj in objects], dtype=np.float64)
+    world = np.einsum('nij,nkj->nki', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+
+    return world.min(axis=1), world.max(axis=1)
+
+
+def sweep_and_prune(bounds_a, bounds_b) -> list:
+    """
+    Returns index pairs (a, b) of bounding boxes from both lists that overlap.
+    Boxes of `bounds_a` are sorted along the axis in which all boxes are spread the most, so that for each
+    box of `bounds_b` only boxes that start before it ends along that axis are tested on all three axes.
+    """
+
+    low_a, high_a = bounds_a
+    low_b, high_b = bounds_b
+    if len(low_a) == 0 or len(low_b) == 0:
+        return []
+
+    spread = np.maximum(high_a.max(axis=0), high_b.max(axis=0)) - np.minimum(low_a.min(axis=0), low_b.min(axis=0))
+    axis = int(np.argmax(spread))
+
+    order = np.argsort(low_a[:, axis], kind='stable')
+    sorted_low = low_a[order, axis]
+
+    pairs = []
+    for b in range(len(low_b)):
+        end = np.searchsorted(sorted_low, high_b[b, axis], side='right')
+        candidates = order[:end]
+        mask = np.all((high_a[candidates] >= low_b[b]) & (low_a[candidates] <= high_b[b]), axis=1)
+        pairs.extend((int(a), b) for a in candidates[mask])
+
+    return pairs
+
+
+def build_world_bvh_tree(obj, depsgraph) -> BVHTree:
+    """
+    Builds the BVH tree from the evaluated triangles of the object in world space
+    (so that trees of different objects can be tested against each other without transforming them again).
+    """
+
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+
+    try:
+        if mesh is None:
+            return None
+
+        mesh.calc_loop_triangles()
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+        mesh.vertices.foreach_get("co", positions)
+        triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", triangles)
+
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        positions = positions.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+        # NOTE: Building from lists is faster than from NumPy arrays, which are read row by row.
+        return BVHTree.FromPolygons(positions.tolist(), triangles.reshape(-1, 3).tolist())
+
+    finally:
+        obj_eval.to_mesh_clear()
+
+
+def is_point_inside(tree, point: Vector) -> bool:
+    """Checks whether the point is inside of the closed geometry of the BVH tree (by counting surfaces a ray crosses)."""
+
+    direction = Vector((0.5773, 0.5774, 0.5775)).normalized()
+    crossings = 0
+    for __ in range(MAX_RAY_HITS):
+        location, __, __, __ = tree.ray_cast(point, direction)
+        if location is None:
+            break
+        crossings += 1
+        point = location + direction * RAY_EPSILON
+
+    return crossings % 2 == 1
+
+
+def are_trees_intersecting(tree_a, tree_b) -> bool:
+    """Checks whether geometry of two BVH trees (in the same space) intersects, or one of them is inside of the other."""
+
+    if tree_a.overlap(tree_b):
+        return True
+
+    # Surfaces don't intersect, but one object can still be entirely inside of the other.
+    # (any point on the surface of the inner object is then inside of the outer one).
+    point_a = tree_a.find_nearest(Vector())[0]
+    point_b = tree_b.find_nearest(Vector())[0]
+    if point_b is not None and is_point_inside(tree_a, point_b):
+        return True
+    if point_a is not None and is_point_inside(tree_b, point_a):
+        return True
+
+    return False
+
+
+def find_intersecting_pairs(canvases, cutters, depsgraph) -> set:
+    """
+    Returns the set of (canvas, cutter) pairs whose evaluated geometry intersects.
+    Sweep and prune over world-space bounding boxes finds candidate pairs, which are then tested with BVH trees.
+    Trees are built once for each object in any of the candidate pairs. Objects that don't evaluate to a mesh
+    are treated as intersecting everything they're paired with.
+    """
+
+    candidates = sweep_and_prune(get_world_bounds(canvases), get_world_bounds(cutters))
+
+    trees = {}
+    def get_tree(obj):
+        if obj not in trees:
+            trees[obj] = build_world_bvh_tree(obj, depsgraph)
+        return trees[obj]
+
+    pairs = set()
+    for a, b in candidates:
+        tree_a, tree_b = get_tree(canvases[a]), get_tree(cutters[b])
+        if tree_a is None or tree_b is None or are_trees_intersecting(tree_a, tree_b):
+            pairs.add((canvases[a], cutters[b]))
+
+    return pairs
@@ -6,6 +6,9 @@ from ..constants import (
 from .mesh import (
     is_instanced_mesh,
 )
+from .modifier import (
+    get_viewport_modifier,
+)
 from .object import (
     has_evaluated_mesh,
 )
@@ -111,6 +114,18 @@ def convert_to_mesh_confirmation(cls, context, event, cutters: list, title="Bool
 
 
 
+def is_transforming(context) -> bool:
+    """Checks whether the transform operator (i.e. grab, rotate, scale) is running in any window."""
+
+    for window in context.window_manager.windows:
+        for op in getattr(window, "modal_operators", []):
+            if op.bl_idname.startswith("TRANSFORM_OT_"):
+                return True
+
+    return False
+
+
+
 #### ------------------------------ /operator_helpers/ ------------------------------ ####
 
 def _guess_toggle_state(modifiers):
@@ -119,7 +134,7 @@ def _guess_toggle_state(modifiers):
     enabled = 0
     disabled = 0
     for mod in modifiers:
-        if mod.show_viewport:
+        if get_viewport_modifier(mod).show_viewport:
             enabled += 1
         else:
             disabled += 1
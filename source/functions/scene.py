@@ -1,8 +1,8 @@
 import bpy
 from .. import __package__ as base_package
 
-from .object import (
-    hide_objects,
+from .bvh import (
+    raycast_objects,
 )
 from .types import (
     Ray,
@@ -32,6 +32,25 @@ def ensure_collection(context) -> bpy.types.Collection:
     return coll
 
 
+def ensure_archive_collection(context) -> bpy.types.Collection:
+    """Returns the hidden collection for archived cutters and creates it if it doesn't exist."""
+
+    prefs = context.preferences.addons[base_package].preferences
+    collection_name = prefs.collection_name + "_archive"
+
+    coll = bpy.data.collections.get(collection_name)
+
+    # Create the collection if it doesn't exist.
+    if coll is None:
+        coll = bpy.data.collections.new(collection_name)
+        coll.hide_viewport = True
+        coll.hide_render = True
+        coll.color_tag = 'COLOR_01'
+        context.scene.collection.children.link(coll)
+
+    return coll
+
+
 def delete_empty_collection(context):
     """Removes Boolean cutters collection if it has no more objects in it."""
 
@@ -52,7 +71,10 @@ def delete_empty_collection(context):
 
 
 def raycast(context, position, objects):
-    """Cast a ray in the scene to get the surface on any of the given objects."""
+    """
+    Cast a ray from the view to get the surface on any of the given objects.
+    Uses cached BVH trees of the objects, so that visibility of other objects doesn't have to be changed.
+    """
 
     region = context.region
     rv3d = context.region_data
@@ -61,8 +83,7 @@ def raycast(context, position, objects):
     origin, direction = region_2d_to_ray_3d(region, rv3d, position)
 
     # Cast Ray
-    with hide_objects(context, exceptions=objects):
-        hit, location, normal, index, object, matrix = context.scene.ray_cast(depsgraph, origin, direction)
-        ray = Ray(hit, location, normal, index, object, matrix)
+    hit, location, normal, index, object, matrix = raycast_objects(objects, depsgraph, origin, direction)
+    ray = Ray(hit, location, normal, index, object, matrix)
 
     return ray
@@ -6,17 +6,6 @@ from bpy_extras import view3d_utils
 
 #### ------------------------------ FUNCTIONS ------------------------------ ####
 
-def redraw_regions(context):
-    """Redraw regions to find the limits of the 3D viewport."""
-
-    for area in context.window.screen.areas:
-        if area.type != 'VIEW_3D':
-            continue
-        for region in area.regions:
-            if region.type in {'WINDOW', 'UI'}:
-                region.tag_redraw()
-
-
 def distance_from_point_to_segment(point: Vector, line_p1: Vector, line_p2: Vector) -> float:
     """
     Calculates the shortest distance between the point and the finite segment.
@@ -0,0 +1,620 @@
+import bpy
+import time
+from bpy.app.handlers import persistent
+from . import __package__ as base_package
+
+from .functions.animation import (
+    is_static_stack,
+)
+from .functions.asset import (
+    preload_assets,
+)
+from .functions.bvh import (
+    forget_bvh_trees,
+)
+from .functions.cache import (
+    store_canvas_result,
+    restore_canvas_result,
+    restore_static_result,
+    show_result_in_render,
+    hide_result_in_render,
+    store_canvas_checkpoints,
+    store_disk_results,
+    restore_disk_results,
+    list_result_dependencies,
+    release_canvas_results,
+    forget_mesh_fingerprints,
+    list_cached_canvases,
+    forget_cached_canvases,
+)
+from .functions.culling import (
+    list_view_regions,
+    cull_boolean_modifiers,
+    uncull_boolean_modifiers,
+)
+from .functions.canvas import (
+    is_canvas,
+)
+from .functions.cutter import (
+    list_cutter_users,
+)
+from .functions.modifier import (
+    is_boolean_modifier,
+    is_viewport_modifier,
+    get_viewport_modifier,
+    suspend_modifiers,
+    resume_modifiers,
+    sync_viewport_modifiers,
+)
+from .functions.poll import (
+    is_transforming,
+)
+
+
+# Prevents handlers from reacting to changes they made themselves.
+_updating = False
+
+# Names of canvases whose checkpoints should be stored (and cached results looked up) once changes settle down.
+_pending_checkpoints = set()
+_pending_results = set()
+_last_change = 0.0
+
+# Time (in seconds) since the last change after which missing checkpoints are evaluated.
+CHECKPOINT_DELAY = 0.5
+
+# Names of canvases whose results are reused on every frame (because their modifier stacks are static).
+_static_canvases = set()
+_last_frame = None
+
+# Canvases whose evaluation is deferred until the transform ends (names and the way they're deferred).
+_deferred_canvases = {}
+
+# Modifiers that were hidden in the render while results of canvases are rendered instead of them.
+_rendering = False
+_render_modifiers = {}
+
+# Views that culling was last updated for, and whether objects were changed since.
+_culled_views = None
+_culling_dirty = True
+
+# Interval (in seconds) in which culling checks whether views changed.
+CULLING_INTERVAL = 0.2
+
+
+#### ------------------------------ HANDLERS ------------------------------ ####
+
+@persistent
+def update_cached_results(scene, depsgraph):
+    """Replaces displayed results of canvases that were changed (with cached ones, or with live evaluation)."""
+
+    global _updating, _last_frame
+    if _updating:
+        return
+
+    context = bpy.context
+
+    # Results of static canvases are still valid when the update was caused by the frame change.
+    frame_changed = scene.frame_current_final != _last_frame
+    _last_frame = scene.frame_current_final
+
+    canvases = list_cached_canvases(scene)
+    if not canvases:
+        return
+
+    updated = {update.id.original for update in depsgraph.updates}
+
+    _updating = True
+    try:
+        for canvas in canvases:
+            if updated.isdisjoint(list_result_dependencies(canvas)):
+                continue
+            if frame_changed and canvas.name in _static_canvases:
+                continue
+            if canvas.name in _deferred_canvases:
+                continue
+
+            # Displayed result no longer matches the canvas, so it's replaced right away. Modifiers are
+            # already evaluated otherwise, so the cache is only looked up once changes settle down.
+            if canvas.booleans.result_key:
+                restore_canvas_result(context, canvas)
+            else:
+                schedule_result_lookup(canvas)
+
+            if canvas.booleans.use_checkpoints:
+                schedule_checkpoints(canvas)
+    finally:
+        _updating = False
+
+
+@persistent
+def defer_interactive_evaluation(scene, depsgraph):
+    """
+    Stops evaluating Boolean modifiers affected by the running transform (of cutters, or of canvas in Edit Mode)
+    until the transform ends. They're either disabled, or replaced by the result they had when transform started.
+    """
+
+    global _updating
+    if _updating:
+        return
+
+    context = bpy.context
+    prefs = context.preferences.addons[base_package].preferences
+    if prefs.defer_evaluation == 'NONE':
+        return
+    if not is_transforming(context):
+        return
+
+    updated = {update.id.original for update in depsgraph.updates}
+    updated_objects = [id for id in updated if isinstance(id, bpy.types.Object)]
+
+    # Canvases that use transformed cutters.
+    cutters = [obj for obj in updated_objects if obj.booleans.cutter]
+    affected = {canvas: list(modifiers) for canvas, modifiers in list_cutter_users(cutters).items()}
+
+    # Canvases that are edited in Edit Mode.
+    for obj in updated_objects:
+        if obj.type != 'MESH' or obj.mode != 'EDIT':
+            continue
+
+        modifiers = [mod for mod in obj.modifiers
+                     if is_boolean_modifier(mod) and get_viewport_modifier(mod).show_viewport and mod.show_in_editmode]
+        if modifiers:
+            affected.setdefault(obj, []).extend(modifiers)
+
+    _updating = True
+    try:
+        for canvas, modifiers in affected.items():
+            if canvas.name in _deferred_canvases:
+                continue
+
+            # Cached results can't represent the mesh that's being edited.
+            if prefs.defer_evaluation == 'RESULT' and canvas.mode != 'EDIT':
+                if restore_static_result(context, canvas):
+                    _deferred_canvases[canvas.name] = 'RESULT'
+                    continue
+
+            suspend_modifiers(canvas, modifiers, 'DEFER')
+            _deferred_canvases[canvas.name] = 'DISABLE'
+    finally:
+        _updating = False
+
+    if _deferred_canvases and not bpy.app.timers.is_registered(resume_deferred_evaluation):
+        bpy.app.timers.register(resume_deferred_evaluation, first_interval=0.1)
+
+
+@persistent
+def sync_viewport_copies(scene, depsgraph):
+    """Keeps viewport-only copies of Boolean modifiers (made by viewport fidelity) in sync with their modifiers."""
+
+    global _updating
+    if _updating:
+        return
+
+    updated = {update.id.original for update in depsgraph.updates if isinstance(update.id, bpy.types.Object)}
+
+    _updating = True
+    try:
+        for obj in updated:
+            if any(is_viewport_modifier(mod) for mod in obj.modifiers):
+                sync_viewport_modifiers(obj)
+    finally:
+        _updating = False
+
+
+@persistent
+def tag_view_culling(scene, depsgraph):
+    """Tags culling to be updated when objects are transformed or their geometry changes (i.e. when cutters move)."""
+
+    global _culling_dirty
+    if _updating:
+        return
+
+    for update in depsgraph.updates:
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        if update.is_updated_transform or update.is_updated_geometry:
+            _culling_dirty = True
+            return
+
+
+@persistent
+def uncull_all_modifiers(*args):
+    """
+    Enables culled Boolean modifiers before the file is saved (and after it's opened), so that files never open
+    with them disabled, i.e. without the add-on. Culling disables them again on its next update.
+    """
+
+    global _updating, _culled_views
+
+    _updating = True
+    try:
+        uncull_boolean_modifiers(bpy.data.objects)
+    finally:
+        _updating = False
+
+    _culled_views = None
+
+
+@persistent
+def forget_updated_geometry(scene, depsgraph):
+    """Forgets cached BVH trees (used for raycasting) and mesh fingerprints of objects whose geometry changed."""
+
+    updated = [update.id.original for update in depsgraph.updates
+               if isinstance(update.id, bpy.types.Object) and update.is_updated_geometry]
+    if updated:
+        forget_bvh_trees(updated)
+
+    meshes = {update.id.original for update in depsgraph.updates if isinstance(update.id, bpy.types.Mesh)}
+    meshes.update(obj.data for obj in updated if obj.type == 'MESH')
+    if meshes:
+        forget_mesh_fingerprints(meshes)
+
+
+@persistent
+def forget_all_geometry(*args):
+    """
+    Forgets all cached BVH trees, mesh fingerprints and canvases that use the cache
+    when the file is opened, or when undo replaces their data.
+    """
+
+    forget_bvh_trees()
+    forget_mesh_fingerprints()
+    forget_cached_canvases()
+
+
+@persistent
+def store_results_before_undo(scene, *args):
+    """Stores results of canvases before the undo step is loaded, so that they can be restored on redo."""
+
+    context = bpy.context
+    prefs = context.preferences.addons[base_package].preferences
+    if not prefs.use_result_cache:
+        return
+
+    for obj in context.view_layer.objects:
+        if obj.type == 'MESH' and is_canvas(obj):
+            store_canvas_result(context, obj)
+
+
+@persistent
+def restore_results_after_undo(scene, *args):
+    """Displays cached results of canvases whose configuration was restored by the undo step."""
+
+    global _updating
+
+    context = bpy.context
+
+    _updating = True
+    try:
+        for obj in context.view_layer.objects:
+            if obj.type == 'MESH' and is_canvas(obj):
+                restore_canvas_result(context, obj)
+    finally:
+        _updating = False
+
+
+
+@persistent
+def store_results_on_save(*args):
+    """Writes results of canvases into the disk cache next to the saved .blend file."""
+
+    context = bpy.context
+    prefs = context.preferences.addons[base_package].preferences
+    if not prefs.use_disk_cache:
+        return
+
+    canvases = [obj for obj in context.view_layer.objects if obj.type == 'MESH' and is_canvas(obj)]
+    store_disk_results(context, canvases)
+
+
+@persistent
+def restore_results_on_load(*args):
+    """Displays results from the disk cache instead of evaluating modifier stacks of canvases in the opened file."""
+
+    global _updating
+
+    context = bpy.context
+    prefs = context.preferences.addons[base_package].preferences
+    if not prefs.use_disk_cache:
+        return
+
+    _updating = True
+    try:
+        canvases = [obj for obj in context.view_layer.objects if obj.type == 'MESH' and is_canvas(obj)]
+        restore_disk_results(context, canvases)
+    finally:
+        _updating = False
+
+
+@persistent
+def preload_assets_on_load(*args):
+    """
+    Loads node group assets into the opened file (if it already has cutters), so that Carver tools don't have to.
+    Files without cutters are left alone, because loaded node groups would be saved into them.
+    """
+
+    prefs = bpy.context.preferences.addons[base_package].preferences
+    if not prefs.preload_assets:
+        return None
+
+    if any(obj.booleans.cutter for obj in bpy.data.objects):
+        preload_assets()
+
+    return None
+
+
+
+@persistent
+def reuse_static_results(scene, *args):
+    """
+    Displays (and renders) the same result on every frame for canvases whose modifier stacks don't change over time.
+    NOTE: In renders results are only displayed when the interface is locked, because otherwise
+    the render thread is reading data while handlers run, and data can't be changed safely.
+    """
+
+    global _updating
+
+    context = bpy.context
+    prefs = context.preferences.addons[base_package].preferences
+    if not prefs.use_animation_cache:
+        return
+    if _rendering and not scene.render.use_lock_interface:
+        return
+
+    _updating = True
+    try:
+        _static_canvases.clear()
+        for obj in scene.objects:
+            if obj.type != 'MESH' or not is_canvas(obj):
+                continue
+            if not is_static_stack(obj):
+                continue
+            if not restore_static_result(context, obj):
+                continue
+
+            _static_canvases.add(obj.name)
+            if _rendering and obj.name not in _render_modifiers:
+                _render_modifiers[obj.name] = show_result_in_render(obj)
+    finally:
+        _updating = False
+
+
+@persistent
+def start_rendering(*args):
+    """Marks that the render started, so that results of static canvases are rendered too."""
+
+    global _rendering
+    _rendering = True
+
+
+@persistent
+def stop_rendering(*args):
+    """Restores render visibility of modifiers that were replaced by results after the render."""
+
+    global _rendering, _updating
+    _rendering = False
+
+    _updating = True
+    try:
+        for name, modifiers in _render_modifiers.items():
+            canvas = bpy.data.objects.get(name)
+            if canvas is not None:
+                hide_result_in_render(canvas, modifiers)
+        _render_modifiers.clear()
+    finally:
+        _updating = False
+
+
+
+#### ------------------------------ TIMERS ------------------------------ ####
+
+def resume_deferred_evaluation():
+    """Timer that evaluates Boolean modifiers of deferred canvases again once the transform ends."""
+
+    global _updating
+
+    context = bpy.context
+    if is_transforming(context):
+        return 0.1
+
+    _updating = True
+    try:
+        for name, mode in _deferred_canvases.items():
+            canvas = bpy.data.objects.get(name)
+            if canvas is None:
+                continue
+
+            if mode == 'RESULT':
+                restore_canvas_result(context, canvas)
+            else:
+                resume_modifiers(canvas, reasons=('DEFER',))
+    finally:
+        _deferred_canvases.clear()
+        _updating = False
+
+    return None
+
+
+def update_view_culling():
+    """
+    Timer that disables viewport evaluation of Boolean modifiers whose cutters aren't visible in any 3D Viewport
+    (or are too small to see), and enables them again when they become visible. Only runs when views or objects change.
+    """
+
+    global _updating, _culled_views, _culling_dirty
+
+    context = bpy.context
+    prefs = context.preferences.addons[base_package].preferences
+    if not prefs.use_view_culling:
+        return None
+
+    views = list_view_regions(context.window_manager)
+    state = [(region.width, region.height, [tuple(row) for row in rv3d.perspective_matrix]) for region, rv3d in views]
+    if state == _culled_views and not _culling_dirty:
+        return CULLING_INTERVAL
+
+    _culled_views = state
+    _culling_dirty = False
+
+    _updating = True
+    try:
+        canvases = [obj for obj in context.scene.objects if obj.type == 'MESH' and obj.booleans.canvas]
+        cull_boolean_modifiers(canvases, views, prefs.culling_pixels)
+    finally:
+        _updating = False
+
+    return CULLING_INTERVAL
+
+
+def start_view_culling():
+    global _culled_views
+    _culled_views = None
+
+    if not bpy.app.timers.is_registered(update_view_culling):
+        bpy.app.timers.register(update_view_culling, first_interval=CULLING_INTERVAL, persistent=True)
+
+
+def stop_view_culling():
+    """Stops culling, and enables viewport evaluation of all culled Boolean modifiers."""
+
+    global _updating
+
+    if bpy.app.timers.is_registered(update_view_culling):
+        bpy.app.timers.unregister(update_view_culling)
+
+    _updating = True
+    try:
+        uncull_boolean_modifiers(bpy.data.objects)
+    finally:
+        _updating = False
+
+
+def schedule_checkpoints(canvas):
+    """Evaluate missing checkpoints of the canvas once it stops changing (i.e. when user stops moving the cutter)."""
+
+    global _last_change
+
+    _pending_checkpoints.add(canvas.name)
+    _last_change = time.monotonic()
+
+    if not bpy.app.timers.is_registered(store_pending_checkpoints):
+        bpy.app.timers.register(store_pending_checkpoints, first_interval=CHECKPOINT_DELAY)
+
+
+def schedule_result_lookup(canvas):
+    """Look up the cached result of the canvas once it stops changing, instead of fingerprinting it on every update."""
+
+    global _last_change
+
+    _pending_results.add(canvas.name)
+    _last_change = time.monotonic()
+
+    if not bpy.app.timers.is_registered(store_pending_checkpoints):
+        bpy.app.timers.register(store_pending_checkpoints, first_interval=CHECKPOINT_DELAY)
+
+
+def store_pending_checkpoints():
+    """Timer that evaluates missing checkpoints of scheduled canvases, and displays cached results of scheduled ones."""
+
+    global _updating
+
+    remaining = CHECKPOINT_DELAY - (time.monotonic() - _last_change)
+    if remaining > 0:
+        return remaining
+
+    context = bpy.context
+
+    _updating = True
+    try:
+        for name in _pending_checkpoints | _pending_results:
+            canvas = bpy.data.objects.get(name)
+            if canvas is None:
+                continue
+            if canvas.name in _deferred_canvases:
+                continue
+
+            if name in _pending_checkpoints and canvas.booleans.use_checkpoints:
+                store_canvas_checkpoints(context, canvas)
+            restore_canvas_result(context, canvas)
+    finally:
+        _pending_checkpoints.clear()
+        _pending_results.clear()
+        _updating = False
+
+    return None
+
+
+
+#### ------------------------------ REGISTRATION ------------------------------ ####
+
+handlers = (
+    (bpy.app.handlers.depsgraph_update_post, forget_updated_geometry),
+    (bpy.app.handlers.depsgraph_update_post, sync_viewport_copies),
+    (bpy.app.handlers.depsgraph_update_post, defer_interactive_evaluation),
+    (bpy.app.handlers.depsgraph_update_post, update_cached_results),
+    (bpy.app.handlers.depsgraph_update_post, tag_view_culling),
+    (bpy.app.handlers.undo_pre, store_results_before_undo),
+    (bpy.app.handlers.undo_post, forget_all_geometry),
+    (bpy.app.handlers.redo_post, forget_all_geometry),
+    (bpy.app.handlers.redo_pre, store_results_before_undo),
+    (bpy.app.handlers.undo_post, restore_results_after_undo),
+    (bpy.app.handlers.redo_post, restore_results_after_undo),
+    (bpy.app.handlers.save_pre, uncull_all_modifiers),
+    (bpy.app.handlers.save_post, store_results_on_save),
+    (bpy.app.handlers.load_post, restore_results_on_load),
+    (bpy.app.handlers.load_post, preload_assets_on_load),
+    (bpy.app.handlers.load_post, uncull_all_modifiers),
+    (bpy.app.handlers.load_pre, forget_all_geometry),
+    (bpy.app.handlers.frame_change_pre, reuse_static_results),
+    (bpy.app.handlers.render_init, start_rendering),
+    (bpy.app.handlers.render_pre, reuse_static_results),
+    (bpy.app.handlers.render_complete, stop_rendering),
+    (bpy.app.handlers.render_cancel, stop_rendering),
+)
+
+def register():
+    for handler_list, handler in handlers:
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+    prefs = bpy.context.preferences.addons[base_package].preferences
+    if prefs.use_view_culling:
+        start_view_culling()
+
+    # Data can't be loaded while add-on is registered, so preloading is delayed.
+    if prefs.preload_assets and not bpy.app.timers.is_registered(preload_assets_on_load):
+        bpy.app.timers.register(preload_assets_on_load, first_interval=1.0)
+
+def unregister():
+    for handler_list, handler in reversed(handlers):
+        if handler in handler_list:
+            handler_list.remove(handler)
+
+    if bpy.app.timers.is_registered(store_pending_checkpoints):
+        bpy.app.timers.unregister(store_pending_checkpoints)
+    _pending_checkpoints.clear()
+    _pending_results.clear()
+
+    if bpy.app.timers.is_registered(preload_assets_on_load):
+        bpy.app.timers.unregister(preload_assets_on_load)
+
+    forget_bvh_trees()
+    forget_mesh_fingerprints()
+
+    try:
+        stop_view_culling()
+    except Exception:
+        pass
+
+    if bpy.app.timers.is_registered(resume_deferred_evaluation):
+        bpy.app.timers.unregister(resume_deferred_evaluation)
+        resume_deferred_evaluation()
+
+    if _rendering:
+        stop_rendering()
+
+    # Modifier stacks shouldn't stay replaced by results when the add-on is disabled.
+    try:
+        release_canvas_results(include_frozen=True)
+    except Exception:
+        pass
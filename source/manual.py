@@ -29,6 +29,15 @@ def bool_tool_manual_map():
                           ("bpy.ops.object.boolean_toggle_all", "utilities/toggle.html"),
                           ("bpy.ops.object.boolean_remove_all", "utilities/remove.html"),
                           ("bpy.ops.object.boolean_apply_all", "utilities/apply.html"),
+                          ("bpy.ops.object.boolean_restore_archive", "utilities/apply.html"),
+                          ("bpy.ops.object.boolean_analyze_stack", "utilities/index.html"),
+                          ("bpy.ops.object.boolean_reorder_stack", "utilities/index.html"),
+                          ("bpy.ops.object.boolean_clear_cache", "utilities/index.html"),
+                          ("bpy.ops.object.boolean_clear_disk_cache", "utilities/index.html"),
+                          ("bpy.ops.object.boolean_freeze_canvas", "utilities/index.html"),
+                          ("bpy.ops.object.boolean_thaw_canvas", "utilities/index.html"),
+                          ("bpy.ops.object.boolean_revert_cut", "utilities/index.html"),
+                          ("bpy.ops.object.boolean_replay_cut", "utilities/index.html"),
                           # Select
                           ("bpy.ops.object.select_cutter_canvas", "utilities/select.html"),
                           ("bpy.ops.object.boolean_select_all", "utilities/select.html"),
@@ -1,22 +1,40 @@
 import bpy
+import uuid
 from collections import defaultdict
 from .. import __package__ as base_package
 
+from ..functions.cache import (
+    MeshArrays,
+    fingerprint_applied,
+    can_cache_result,
+    is_storable_mesh,
+)
 from ..functions.canvas import (
     filter_canvases,
     create_slice,
+    enforce_boolean_limit,
 )
 from ..functions.cutter import (
     filter_cutters,
     make_cutter,
 )
+from ..functions.history import (
+    record_cut,
+)
+from ..functions.mesh import (
+    is_instanced_mesh,
+)
 from ..functions.modifier import (
     add_boolean_modifier,
     apply_modifiers,
     get_modifiers_to_apply,
 )
+from ..functions.overlap import (
+    find_intersecting_pairs,
+)
 from ..functions.object import (
     change_parent,
+    convert_to_mesh,
     delete_object,
 )
 from ..functions.poll import (
@@ -29,6 +47,20 @@ from ..functions.poll import (
 #### ------------------------------ PROPERTIES ------------------------------ ####
 
 class BooleanBase():
+    """
+    NOTE: Redo panel undoes the operation and executes the operator again, so intermediates that don't depend
+    on operator properties are stored in `_redo_cache` to be reused by re-executions. Cache belongs to the
+    invocation whose `redo_token` it stores, and is released when any other execution starts (or operator can't be redone).
+    Undo replaces all data-blocks, so objects are stored by their names, and meshes as NumPy arrays.
+    """
+
+    _redo_cache = {}
+
+    # Set by `invoke`, so that only re-executions of the same invocation reuse its cache.
+    redo_token: bpy.props.StringProperty(
+        options = {'HIDDEN', 'SKIP_SAVE'},
+    )
+
     # Add-on properties.
     flip: bpy.props.BoolProperty(
         name = "Flip Canvas & Cutters",
@@ -36,6 +68,14 @@ class BooleanBase():
         default = False,
     )
 
+    all_pairs: bpy.props.BoolProperty(
+        name = "All Pairs",
+        description = ("Add Boolean modifiers for every pair of canvas and cutter, even ones that don't intersect.\n"
+                       "Otherwise they're skipped in Difference & Slice modes, where they wouldn't change the result"),
+        options = {'SKIP_SAVE'},
+        default = False,
+    )
+
     # Boolean modifier properties.
     material_mode: bpy.props.EnumProperty(
         name = "Materials",
@@ -82,6 +122,10 @@ class BooleanBase():
         col.prop(self, "flip")
         if self._unflippable:
             col.enabled = False
+        col = layout.column()
+        col.prop(self, "all_pairs")
+        if self.mode not in ("DIFFERENCE", "SLICE"):
+            col.enabled = False
 
         layout.separator()
         if prefs.solver == 'EXACT':
@@ -93,8 +137,48 @@ class BooleanBase():
 
 
     # Custom Methods.
+    def _start_redo_cache(self):
+        """Starts the new redo cache for the invocation (called from `invoke`)."""
+
+        self.redo_token = uuid.uuid4().hex
+        self._redo_cache.clear()
+        self._redo_cache["token"] = self.redo_token
+
+
+    def _check_redo_cache(self):
+        """Releases the redo cache unless this execution is the redo of the invocation it belongs to."""
+
+        if not self.redo_token or self._redo_cache.get("token") != self.redo_token:
+            self._redo_cache.clear()
+            return
+
+        if not bpy.app.timers.is_registered(release_redo_cache):
+            bpy.app.timers.register(release_redo_cache, first_interval=REDO_CACHE_INTERVAL)
+
+
+    def _store_redo_cache(self, key, value):
+        """Stores the intermediate for re-executions (only if the operator was invoked, i.e. it can be redone)."""
+
+        if self.redo_token:
+            self._redo_cache[key] = value
+
+
     def _filter_objects(self, context) -> tuple[list, list]:
-        """Returns lists of cutters & canvases."""
+        """Returns lists of cutters & canvases (reusing ones from the previous execution when redoing)."""
+
+        selected = tuple(sorted(obj.name for obj in context.selected_objects))
+        key = ("filter", self.flip, context.active_object.name, selected)
+
+        cached = self._redo_cache.get(key)
+        if cached is not None:
+            canvases = [bpy.data.objects.get(name) for name in cached[0]]
+            cutters = [bpy.data.objects.get(name) for name in cached[1]]
+            if None not in canvases and None not in cutters:
+                # Conversion of non-mesh cutters was undone too (it changes the object type, so it can't be stored).
+                for cutter in cutters:
+                    if cutter.type != 'MESH':
+                        convert_to_mesh(context, cutter)
+                return canvases, cutters
 
         canvases = [context.active_object]
         cutters = [obj for obj in context.selected_objects if obj != context.active_object]
@@ -115,9 +199,52 @@ class BooleanBase():
             self.report({'WARNING'}, "No valid cutters selected")
             return None, None
 
+        self._store_redo_cache(key, ([obj.name for obj in canvases], [obj.name for obj in cutters]))
         return canvases, cutters
 
 
+    def _filter_pairs(self, context, canvases, cutters):
+        """
+        Returns the set of (canvas, cutter) pairs that intersect and should get Boolean modifiers,
+        or None if all pairs should get them (Union & Intersect change the canvas even when objects don't touch).
+        """
+
+        if self.all_pairs or self.mode not in ("DIFFERENCE", "SLICE"):
+            return None
+
+        key = ("pairs", tuple(obj.name for obj in canvases), tuple(obj.name for obj in cutters))
+        cached = self._redo_cache.get(key)
+        if cached is not None:
+            pairs = {(bpy.data.objects.get(canvas), bpy.data.objects.get(cutter)) for canvas, cutter in cached}
+            if not any(None in pair for pair in pairs):
+                return pairs
+
+        pairs = find_intersecting_pairs(canvases, cutters, context.evaluated_depsgraph_get())
+        self._store_redo_cache(key, [(canvas.name, cutter.name) for canvas, cutter in pairs])
+        return pairs
+
+
+    def _apply_modifiers(self, context, obj, modifiers: list):
+        """Applies modifiers on the object, reusing the resulting mesh of the previous execution if it didn't change."""
+
+        key = ""
+        if can_cache_result(obj) and not obj.booleans.result_key and not is_instanced_mesh(obj.data):
+            key = fingerprint_applied(obj, modifiers)
+
+        arrays = self._redo_cache.get(("result", key)) if key else None
+        if arrays is not None:
+            obj.data.clear_geometry()
+            obj.data.materials.clear()
+            arrays.to_mesh(obj.data)
+            for mod in modifiers:
+                obj.modifiers.remove(mod)
+            return
+
+        apply_modifiers(context, obj, modifiers)
+        if key and self.redo_token and is_storable_mesh(obj.data, obj):
+            self._store_redo_cache(("result", key), MeshArrays(obj.data, keep_selection=True))
+
+
 
 #### ------------------------------ /brush_boolean/ ------------------------------ ####
 
@@ -129,6 +256,8 @@ class BrushBoolean(BooleanBase):
             self.report({'WARNING'}, "Boolean operator needs at least two selected objects")
             return {'CANCELLED'}
 
+        self._start_redo_cache()
+
         if not self.flip:
             cutters = [obj for obj in context.selected_objects if obj != context.active_object]
         else:
@@ -140,12 +269,23 @@ class BrushBoolean(BooleanBase):
 
     def execute(self, context):
         prefs = context.preferences.addons[base_package].preferences
+        self._check_redo_cache()
 
         # Create lists of cutters & canvases.
         canvases, cutters = self._filter_objects(context)
         if canvases is None or cutters is None:
             return {'CANCELLED'}
 
+        # Only intersecting pairs of objects get modifiers.
+        pairs = self._filter_pairs(context, canvases, cutters)
+        if pairs is not None:
+            if not pairs:
+                self.report({'WARNING'}, "Selected objects don't intersect")
+                return {'CANCELLED'}
+
+            canvases = [canvas for canvas in canvases if any(canvas == pair[0] for pair in pairs)]
+            cutters = [cutter for cutter in cutters if any(cutter == pair[1] for pair in pairs)]
+
         # Create slices.
         if self.mode == "SLICE":
             for cutter in cutters:
@@ -154,6 +294,8 @@ class BrushBoolean(BooleanBase):
                 inheriting Boolean modifiers that the operator adds.
                 """
                 for canvas in canvases:
+                    if pairs is not None and (canvas, cutter) not in pairs:
+                        continue
                     slice = create_slice(context, canvas, modifier=True)
                     add_boolean_modifier(self, context, slice, cutter, "INTERSECT", prefs.solver, pin=prefs.pin)
 
@@ -164,6 +306,8 @@ class BrushBoolean(BooleanBase):
 
             mode = "DIFFERENCE" if self.mode == "SLICE" else self.mode
             for canvas in canvases:
+                if pairs is not None and (canvas, cutter) not in pairs:
+                    continue
                 add_boolean_modifier(self, context, canvas, cutter, mode, prefs.solver, pin=prefs.pin)
 
             if prefs.parent:
@@ -172,6 +316,7 @@ class BrushBoolean(BooleanBase):
         # Set Boolean property to canvases.
         for canvas in canvases:
             canvas.booleans.canvas = True
+            enforce_boolean_limit(context, canvas, pinned=prefs.pin)
 
         return {'FINISHED'}
 
@@ -248,6 +393,8 @@ class AutoBoolean(BooleanBase):
             self.report({'WARNING'}, "Boolean operator needs at least two selected objects")
             return {'CANCELLED'}
 
+        self._start_redo_cache()
+
         if not self.flip:
             canvases = [context.active_object]
         else:
@@ -264,12 +411,19 @@ class AutoBoolean(BooleanBase):
     def execute(self, context):
         prefs = context.preferences.addons[base_package].preferences
         new_modifiers = defaultdict(list)
+        self._check_redo_cache()
 
         # Create lists of cutters & canvases.
         canvases, cutters = self._filter_objects(context)
         if canvases is None or cutters is None:
             return {'CANCELLED'}
 
+        # Only intersecting pairs of objects get modifiers.
+        pairs = self._filter_pairs(context, canvases, cutters)
+        if pairs is not None and not pairs:
+            self.report({'WARNING'}, "Selected objects don't intersect")
+            return {'CANCELLED'}
+
         # Create slices.
         if self.mode == "SLICE":
             for cutter in cutters:
@@ -278,6 +432,8 @@ class AutoBoolean(BooleanBase):
                 inheriting Boolean modifiers that the operator adds.
                 """
                 for canvas in canvases:
+                    if pairs is not None and (canvas, cutter) not in pairs:
+                        continue
                     slice = create_slice(context, canvas)
                     modifier = add_boolean_modifier(self, context, slice, cutter, "INTERSECT",
                                                     prefs.solver, pin=prefs.pin)
@@ -288,6 +444,8 @@ class AutoBoolean(BooleanBase):
             # Add Boolean modifier on canvases.
             mode = "DIFFERENCE" if self.mode == "SLICE" else self.mode
             for canvas in canvases:
+                if pairs is not None and (canvas, cutter) not in pairs:
+                    continue
                 modifier = add_boolean_modifier(self, context, canvas, cutter, mode, prefs.solver, pin=prefs.pin)
                 new_modifiers[canvas].append(modifier)
 
@@ -303,7 +461,8 @@ class AutoBoolean(BooleanBase):
         # Apply modifiers on canvases & slices.
         for obj, modifiers in new_modifiers.items():
             modifiers = get_modifiers_to_apply(context, obj, modifiers)
-            apply_modifiers(context, obj, modifiers)
+            with record_cut(context, obj, self.bl_label):
+                self._apply_modifiers(context, obj, modifiers)
 
         # Delete cutters.
         for cutter in cutters:
@@ -374,6 +533,24 @@ class OBJECT_OT_boolean_auto_slice(bpy.types.Operator, AutoBoolean):
 
 
 
+#### ------------------------------ TIMERS ------------------------------ ####
+
+# Interval (in seconds) in which the redo cache checks whether its operator can still be redone.
+REDO_CACHE_INTERVAL = 1.0
+
+def release_redo_cache():
+    """Timer that releases the redo cache once another operator was executed (so that its meshes aren't kept for the session)."""
+
+    token = BooleanBase._redo_cache.get("token")
+    operators = bpy.context.window_manager.operators
+    if token and len(operators) > 0 and getattr(operators[-1].properties, "redo_token", None) == token:
+        return REDO_CACHE_INTERVAL
+
+    BooleanBase._redo_cache.clear()
+    return None
+
+
+
 #### ------------------------------ REGISTRATION ------------------------------ ####
 
 addon_keymaps = []
@@ -438,6 +615,10 @@ def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
+    if bpy.app.timers.is_registered(release_redo_cache):
+        bpy.app.timers.unregister(release_redo_cache)
+    BooleanBase._redo_cache.clear()
+
     # KEYMAP
     for km, kmi in addon_keymaps:
         km.keymap_items.remove(kmi)
@@ -2,19 +2,36 @@ import bpy
 import itertools
 from .. import __package__ as base_package
 
+from ..functions.cache import (
+    result_cache,
+    clear_disk_cache,
+    store_canvas_result,
+    restore_canvas_result,
+    freeze_canvas,
+    thaw_canvas,
+)
 from ..functions.canvas import (
     list_selected_canvases,
     list_canvas_cutters,
     list_canvas_slices,
+    restore_archived_modifiers,
 )
 from ..functions.cutter import (
     list_cutter_users,
     handle_unused_cutters,
 )
+from ..functions.history import (
+    revert_cut,
+    replay_cut,
+)
 from ..functions.modifier import (
     apply_modifiers,
+    get_viewport_modifier,
     get_modifiers_to_apply,
     is_boolean_modifier,
+    list_misplaced_booleans,
+    reorder_misplaced_booleans,
+    remove_result_modifier,
 )
 from ..functions.object import (
     delete_object,
@@ -38,6 +55,12 @@ class OBJECT_OT_boolean_toggle_all(bpy.types.Operator):
     bl_description = "Toggle all Boolean cutters affecting selected canvases"
     bl_options = {'UNDO'}
 
+    include_frozen: bpy.props.BoolProperty(
+        name = "Include Frozen",
+        description = "Also toggle cutters of frozen canvases (thawing them)",
+        default = False,
+    )
+
     @classmethod
     def poll(cls, context):
         return basic_poll(cls, context, check_active=False)
@@ -45,10 +68,17 @@ class OBJECT_OT_boolean_toggle_all(bpy.types.Operator):
     def execute(self, context):
         # Filter canvases.
         canvases = list_selected_canvases(context)
+        if not self.include_frozen:
+            canvases = [canvas for canvas in canvases if not canvas.booleans.frozen]
         if len(canvases) == 0:
             self.report({'WARNING'}, "No valid canvases selected")
             return {'CANCELLED'}
 
+        # Cache results before toggling, and evaluate actual modifiers again.
+        for canvas in canvases:
+            store_canvas_result(context, canvas)
+            remove_result_modifier(canvas)
+
         cutters, modifiers = list_canvas_cutters(canvases)
         modifiers = list(itertools.chain.from_iterable(modifiers.values()))
         slices = list_canvas_slices(context, canvases)
@@ -58,7 +88,7 @@ class OBJECT_OT_boolean_toggle_all(bpy.types.Operator):
 
         # Toggle Modifiers
         for mod in modifiers:
-            mod.show_viewport = not state
+            get_viewport_modifier(mod).show_viewport = not state
             mod.show_render = not state
 
         # Hide Slices
@@ -70,7 +100,7 @@ class OBJECT_OT_boolean_toggle_all(bpy.types.Operator):
                 if not is_boolean_modifier(mod):
                     continue
                 if mod.object in cutters:
-                    mod.show_viewport = not state
+                    get_viewport_modifier(mod).show_viewport = not state
                     mod.show_render = not state
 
         # Hide Unused Cutters
@@ -80,6 +110,10 @@ class OBJECT_OT_boolean_toggle_all(bpy.types.Operator):
                 cutter.hide_viewport = state
                 cutter.hide_set(state)
 
+        # Restore Cached Results
+        for canvas in canvases:
+            restore_canvas_result(context, canvas)
+
         return {'FINISHED'}
 
 
@@ -146,6 +180,11 @@ class OBJECT_OT_boolean_apply_all(bpy.types.Operator):
         description = "Completely remove cutters if they're not used by any other remaining canvas",
         default = True,
     )
+    include_frozen: bpy.props.BoolProperty(
+        name = "Include Frozen",
+        description = "Also apply cutters of frozen canvases",
+        default = False,
+    )
 
     @classmethod
     def poll(cls, context):
@@ -153,7 +192,7 @@ class OBJECT_OT_boolean_apply_all(bpy.types.Operator):
 
     def invoke(self, context, event):
         # Filter canvases.
-        canvases = list_selected_canvases(context)
+        canvases = self.filter_canvases(context)
         if len(canvases) == 0:
             self.report({'WARNING'}, "No valid canvases selected")
             return {'CANCELLED'}
@@ -163,7 +202,7 @@ class OBJECT_OT_boolean_apply_all(bpy.types.Operator):
     def execute(self, context):
         prefs = context.preferences.addons[base_package].preferences
 
-        canvases = list_selected_canvases(context)
+        canvases = self.filter_canvases(context)
         cutters, __ = list_canvas_cutters(canvases)
         slices = list_canvas_slices(context, canvases)
 
@@ -191,6 +230,294 @@ class OBJECT_OT_boolean_apply_all(bpy.types.Operator):
 
         return {'FINISHED'}
 
+    def filter_canvases(self, context):
+        """Returns selected canvases (without frozen ones, unless they're included)."""
+
+        canvases = list_selected_canvases(context)
+        if not self.include_frozen:
+            canvases = [canvas for canvas in canvases if not canvas.booleans.frozen]
+
+        return canvases
+
+
+
+# Analyze Modifier Stack
+class OBJECT_OT_boolean_analyze_stack(bpy.types.Operator):
+    bl_idname = "object.boolean_analyze_stack"
+    bl_label = "Analyze Modifier Stack"
+    bl_description = ("Find Boolean modifiers on selected canvases that come after modifiers which multiply geometry\n"
+                      "(Subdivision Surface, Multiresolution, Bevel), and estimate how much geometry they receive")
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return basic_poll(cls, context, check_active=False)
+
+    def execute(self, context):
+        canvases = list_selected_canvases(context)
+        if len(canvases) == 0:
+            self.report({'WARNING'}, "No valid canvases selected")
+            return {'CANCELLED'}
+
+        count = 0
+        for canvas in canvases:
+            for mod, multipliers, triangles in list_misplaced_booleans(canvas):
+                names = ", ".join(m.name for m in multipliers)
+                self.report({'WARNING'}, f"{canvas.name}: '{mod.name}' comes after {names} (~{triangles:,} triangles)")
+                count += 1
+
+        if count == 0:
+            self.report({'INFO'}, "No Boolean modifiers come after geometry-multiplying modifiers")
+        else:
+            self.report({'WARNING'}, f"{count} Boolean modifier(s) come after geometry-multiplying modifiers (see Info log)")
+
+        return {'FINISHED'}
+
+
+# Reorder Modifier Stack
+class OBJECT_OT_boolean_reorder_stack(bpy.types.Operator):
+    bl_idname = "object.boolean_reorder_stack"
+    bl_label = "Reorder Boolean Modifiers"
+    bl_description = ("Move Boolean modifiers directly above the modifiers which multiply geometry (Subdivision Surface, Bevel).\n"
+                      "Boolean modifiers aren't moved past other modifiers (i.e. Mirror, Array), which would change what they cut.\n"
+                      "NOTE: This changes the result, since those modifiers will affect the cuts as well")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return basic_poll(cls, context, check_active=False)
+
+    def invoke(self, context, event):
+        canvases = list_selected_canvases(context)
+
+        misplaced = []
+        multipliers = set()
+        for canvas in canvases:
+            for mod, mods, __ in list_misplaced_booleans(canvas):
+                misplaced.append(mod)
+                multipliers.update(m.name for m in mods)
+
+        if len(misplaced) == 0:
+            self.report({'INFO'}, "No Boolean modifiers come after geometry-multiplying modifiers")
+            return {'CANCELLED'}
+
+        # Moving the modifier always changes the result, so never do it without asking.
+        message = (f"Moving {len(misplaced)} Boolean modifier(s) above {', '.join(sorted(multipliers))} will change the result,\n"
+                   "because cuts will be subdivided or beveled as well. Do you proceed?")
+        return context.window_manager.invoke_confirm(self, event, title="Reorder Boolean Modifiers",
+                                                     confirm_text="Reorder", icon='WARNING',
+                                                     message=message)
+
+    def execute(self, context):
+        canvases = list_selected_canvases(context)
+        if len(canvases) == 0:
+            self.report({'WARNING'}, "No valid canvases selected")
+            return {'CANCELLED'}
+
+        moved = []
+        skipped = []
+        for canvas in canvases:
+            canvas_moved, canvas_skipped = reorder_misplaced_booleans(canvas)
+            moved.extend(canvas_moved)
+            skipped.extend(canvas_skipped)
+
+        for mod, blocker in skipped:
+            if blocker.type == 'MULTIRES':
+                reason = "Multiresolution modifier requires original data"
+            else:
+                reason = "it would change the geometry that is cut"
+            self.report({'WARNING'}, f"{mod.id_data.name}: '{mod.name}' can't be moved above '{blocker.name}', because {reason}")
+
+        if skipped:
+            self.report({'WARNING'}, f"Moved {len(moved)} Boolean modifier(s), {len(skipped)} couldn't be moved (see Info log)")
+        else:
+            self.report({'INFO'}, f"Moved {len(moved)} Boolean modifier(s)")
+
+        return {'FINISHED'}
+
+
+# Clear Result Cache
+class OBJECT_OT_boolean_clear_cache(bpy.types.Operator):
+    bl_idname = "object.boolean_clear_cache"
+    bl_label = "Clear Result Cache"
+    bl_description = "Free the memory taken up by stored results of Boolean modifier stacks"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        size = result_cache.size
+        result_cache.clear()
+        self.report({'INFO'}, f"Freed {size / 2**20:.1f} MB")
+
+        return {'FINISHED'}
+
+
+# Clear Disk Cache
+class OBJECT_OT_boolean_clear_disk_cache(bpy.types.Operator):
+    bl_idname = "object.boolean_clear_disk_cache"
+    bl_label = "Clear Disk Cache"
+    bl_description = "Remove results of Boolean modifier stacks that are stored on disk next to the current file"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return bpy.data.filepath != ""
+
+    def execute(self, context):
+        size = clear_disk_cache()
+        self.report({'INFO'}, f"Removed {size / 2**20:.1f} MB")
+
+        return {'FINISHED'}
+
+
+# Restore Archived Cutters
+class OBJECT_OT_boolean_restore_archive(bpy.types.Operator):
+    bl_idname = "object.boolean_restore_archive"
+    bl_label = "Restore Archived Cutters"
+    bl_description = ("Restore cutters that were automatically applied to selected canvases and re-create their modifiers.\n"
+                      "NOTE: Changes made to the mesh after the cutters were archived will be lost")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return basic_poll(cls, context, check_active=False)
+
+    def execute(self, context):
+        canvases = [obj for obj in context.selected_objects if obj.booleans.archived_mesh]
+        if len(canvases) == 0:
+            self.report({'WARNING'}, "Selected objects don't have archived cutters")
+            return {'CANCELLED'}
+
+        for canvas in canvases:
+            restore_archived_modifiers(context, canvas)
+
+        return {'FINISHED'}
+
+
+# Revert Cut
+class OBJECT_OT_boolean_revert_cut(bpy.types.Operator):
+    bl_idname = "object.boolean_revert_cut"
+    bl_label = "Revert Cut"
+    bl_description = ("Take back the destructive cut from the cut history of the active object, keeping all later changes.\n"
+                      "Cuts whose faces were changed by later edits can't be reverted")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty(
+        name = "Index",
+        options = {'HIDDEN', 'SKIP_SAVE'},
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object and context.active_object.type == 'MESH' and context.mode == 'OBJECT'
+
+    def execute(self, context):
+        obj = context.active_object
+        if not 0 <= self.index < len(obj.booleans.cuts):
+            return {'CANCELLED'}
+
+        cut = obj.booleans.cuts[self.index]
+        if cut.reverted:
+            self.report({'INFO'}, "Cut is already reverted")
+            return {'CANCELLED'}
+
+        missing = revert_cut(obj, cut)
+        if missing:
+            self.report({'WARNING'}, f"{missing} face(s) of the cut were changed by later edits, so it can't be reverted")
+            return {'CANCELLED'}
+
+        if obj.booleans.result_key:
+            remove_result_modifier(obj)
+        cut.reverted = True
+
+        return {'FINISHED'}
+
+
+# Replay Cut
+class OBJECT_OT_boolean_replay_cut(bpy.types.Operator):
+    bl_idname = "object.boolean_replay_cut"
+    bl_label = "Replay Cut"
+    bl_description = "Make the reverted destructive cut from the cut history of the active object again"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty(
+        name = "Index",
+        options = {'HIDDEN', 'SKIP_SAVE'},
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object and context.active_object.type == 'MESH' and context.mode == 'OBJECT'
+
+    def execute(self, context):
+        obj = context.active_object
+        if not 0 <= self.index < len(obj.booleans.cuts):
+            return {'CANCELLED'}
+
+        cut = obj.booleans.cuts[self.index]
+        if not cut.reverted:
+            self.report({'INFO'}, "Cut isn't reverted")
+            return {'CANCELLED'}
+
+        missing = replay_cut(obj, cut)
+        if missing:
+            self.report({'WARNING'}, f"{missing} face(s) were changed since the cut was reverted, so it can't be replayed")
+            return {'CANCELLED'}
+
+        if obj.booleans.result_key:
+            remove_result_modifier(obj)
+        cut.reverted = False
+
+        return {'FINISHED'}
+
+
+# Freeze Canvas
+class OBJECT_OT_boolean_freeze_canvas(bpy.types.Operator):
+    bl_idname = "object.boolean_freeze_canvas"
+    bl_label = "Freeze Canvas"
+    bl_description = ("Display the current result of selected canvases instead of evaluating their Boolean modifiers.\n"
+                      "Cutters and modifiers are kept, and changes to them are ignored until canvases are thawed")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return basic_poll(cls, context, check_active=False)
+
+    def execute(self, context):
+        canvases = [canvas for canvas in list_selected_canvases(context) if not canvas.booleans.frozen]
+        if len(canvases) == 0:
+            self.report({'WARNING'}, "No unfrozen canvases selected")
+            return {'CANCELLED'}
+
+        failed = [canvas.name for canvas in canvases if not freeze_canvas(context, canvas)]
+        if failed:
+            self.report({'WARNING'}, f"Result of {', '.join(failed)} can't be stored (meshes with shape keys or vertex groups can't be frozen)")
+
+        return {'FINISHED'}
+
+
+# Thaw Canvas
+class OBJECT_OT_boolean_thaw_canvas(bpy.types.Operator):
+    bl_idname = "object.boolean_thaw_canvas"
+    bl_label = "Thaw Canvas"
+    bl_description = "Evaluate Boolean modifiers of selected frozen canvases again"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return basic_poll(cls, context, check_active=False)
+
+    def execute(self, context):
+        canvases = [obj for obj in context.selected_objects if obj.booleans.frozen]
+        if len(canvases) == 0:
+            self.report({'WARNING'}, "No frozen canvases selected")
+            return {'CANCELLED'}
+
+        for canvas in canvases:
+            thaw_canvas(canvas)
+            restore_canvas_result(context, canvas)
+
+        return {'FINISHED'}
+
 
 
 #### ------------------------------ REGISTRATION ------------------------------ ####
@@ -201,6 +528,15 @@ classes = (
     OBJECT_OT_boolean_toggle_all,
     OBJECT_OT_boolean_remove_all,
     OBJECT_OT_boolean_apply_all,
+    OBJECT_OT_boolean_analyze_stack,
+    OBJECT_OT_boolean_reorder_stack,
+    OBJECT_OT_boolean_clear_cache,
+    OBJECT_OT_boolean_clear_disk_cache,
+    OBJECT_OT_boolean_restore_archive,
+    OBJECT_OT_boolean_revert_cut,
+    OBJECT_OT_boolean_replay_cut,
+    OBJECT_OT_boolean_freeze_canvas,
+    OBJECT_OT_boolean_thaw_canvas,
 )
 
 
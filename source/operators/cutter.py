@@ -2,6 +2,10 @@ import bpy
 import itertools
 from .. import __package__ as base_package
 
+from ..functions.cache import (
+    store_canvas_result,
+    restore_canvas_result,
+)
 from ..functions.canvas import (
     list_canvas_cutters,
     list_canvas_slices,
@@ -14,7 +18,11 @@ from ..functions.cutter import (
 )
 from ..functions.modifier import (
     apply_modifiers,
+    get_viewport_modifier,
     is_boolean_modifier,
+    remove_result_modifier,
+    solo_modifier,
+    unsolo_modifier,
 )
 from ..functions.object import (
     change_parent,
@@ -43,7 +51,10 @@ class OBJECT_OT_boolean_toggle_cutter(bpy.types.Operator):
 
     @classmethod
     def description(cls, context, properties):
-        if properties.specified_cutter:
+        if properties.method == 'SOLO':
+            return ("Only evaluate this cutter (and the base mesh) in the viewport.\n"
+                    "Click again to restore other cutters to the state they were in before")
+        elif properties.specified_cutter:
             return ("Toggle selected cutter and its effect")
         else:
             return ("Toggle all selected cutters and their effects")
@@ -51,7 +62,8 @@ class OBJECT_OT_boolean_toggle_cutter(bpy.types.Operator):
     method: bpy.props.EnumProperty(
         name = "Method",
         items = (('ALL', "All", "Toggle all selected cutters"),
-                 ('SPECIFIED', "Specified", "Toggle selected cutter")),
+                 ('SPECIFIED', "Specified", "Toggle selected cutter"),
+                 ('SOLO', "Solo", "Disable all other cutters of the specified canvas in the viewport, or restore them")),
         default = 'ALL',
     )
 
@@ -67,14 +79,19 @@ class OBJECT_OT_boolean_toggle_cutter(bpy.types.Operator):
         return basic_poll(cls, context, check_active=False)
 
     def execute(self, context):
+        if self.method == 'SOLO':
+            return self.solo(context)
+
         # Create lists of cutters & canvases.
         if self.method == 'SPECIFIED':
             cutters: list = [context.scene.objects[self.specified_cutter]]
             canvases: list = [context.scene.objects[self.specified_canvas]]
+            self.store_results(context, canvases)
             modifiers: list = [canvases[0].modifiers.get(self.specified_modifier)]
             slices: list = list_canvas_slices(context, canvases)
         elif self.method == 'ALL':
             cutters: list = list_selected_cutters(context)
+            self.store_results(context, list_cutter_users(cutters).keys())
             canvases: dict = list_cutter_users(cutters)
             modifiers: list = list(itertools.chain.from_iterable(canvases.values()))
 
@@ -90,7 +107,7 @@ class OBJECT_OT_boolean_toggle_cutter(bpy.types.Operator):
 
         # Toggle Modifiers
         for mod in modifiers:
-            mod.show_viewport = not state
+            get_viewport_modifier(mod).show_viewport = not state
             mod.show_render = not state
 
         # Hide Slices
@@ -111,7 +128,7 @@ class OBJECT_OT_boolean_toggle_cutter(bpy.types.Operator):
                     if not is_boolean_modifier(mod):
                         continue
                     if mod.object in cutters:
-                        mod.show_viewport = not state
+                        get_viewport_modifier(mod).show_viewport = not state
                         mod.show_render = not state
 
                         slice.hide_viewport = state
@@ -125,9 +142,41 @@ class OBJECT_OT_boolean_toggle_cutter(bpy.types.Operator):
                     cutter.hide_viewport = state
                     cutter.hide_set(state)
 
+        # Restore Cached Results
+        for canvas in canvases:
+            restore_canvas_result(context, canvas)
+
         return {'FINISHED'}
 
 
+    def solo(self, context):
+        """Solo the specified cutter on the canvas, or restore other cutters if it's already soloed."""
+
+        canvas = context.scene.objects[self.specified_canvas]
+        mod = canvas.modifiers.get(self.specified_modifier)
+        if mod is None:
+            return {'CANCELLED'}
+
+        soloed = canvas.booleans.solo == mod.name
+        self.store_results(context, [canvas])
+        if not soloed:
+            solo_modifier(canvas, mod)
+
+        # Cached result of the whole stack is displayed right away when solo ends.
+        restore_canvas_result(context, canvas)
+
+        return {'FINISHED'}
+
+
+    def store_results(self, context, canvases):
+        """Cache results of canvases before toggling, and evaluate their actual modifiers (without solo) again."""
+
+        for canvas in canvases:
+            store_canvas_result(context, canvas)
+            remove_result_modifier(canvas)
+            unsolo_modifier(canvas)
+
+
 # Remove Boolean Cutter
 class OBJECT_OT_boolean_remove_cutter(bpy.types.Operator):
     bl_idname = "object.boolean_remove_cutter"
@@ -1,6 +1,18 @@
 import bpy
 from . import ui
 
+from .functions.cache import (
+    result_cache,
+    release_canvas_results,
+)
+from .functions.modifier import (
+    remove_viewport_fidelity,
+)
+from .handlers import (
+    start_view_culling,
+    stop_view_culling,
+)
+
 
 #### ------------------------------ FUNCTIONS ------------------------------ ####
 
@@ -11,6 +23,8 @@ def update_sidebar_category(self, context):
         ui.panels.VIEW3D_PT_boolean,
         ui.panels.VIEW3D_PT_boolean_helpers,
         ui.panels.VIEW3D_PT_boolean_cutters,
+        ui.panels.VIEW3D_PT_boolean_performance,
+        ui.panels.VIEW3D_PT_boolean_history,
     ]
 
     for cls in panel_classes:
@@ -23,6 +37,36 @@ def update_sidebar_category(self, context):
 
 
 
+def update_result_cache(self, context):
+    """Release displayed results and free the memory when result cache is disabled or made smaller."""
+
+    if not self.use_result_cache:
+        release_canvas_results()
+        result_cache.clear()
+    else:
+        result_cache.trim(self.cache_size * 2**20)
+
+
+def update_viewport_fidelity(self, context):
+    """Remove viewport-only copies of Boolean modifiers and cutter proxies (enabling modifiers instead) when disabled."""
+
+    if self.use_viewport_fidelity:
+        return
+
+    for obj in bpy.data.objects:
+        remove_viewport_fidelity(obj)
+
+
+def update_view_culling(self, context):
+    """Start culling Boolean modifiers when enabled, and enable all culled modifiers when disabled."""
+
+    if self.use_view_culling:
+        start_view_culling()
+    else:
+        stop_view_culling()
+
+
+
 #### ------------------------------ PREFERENCES ------------------------------ ####
 
 class BoolToolPreferences(bpy.types.AddonPreferences):
@@ -33,7 +77,8 @@ class BoolToolPreferences(bpy.types.AddonPreferences):
         name = "Category",
         items = (('ADDON', "Add-on", "General add-on features"),
                  ('SHARED', "Shared", "Features shared by all of add-ons operators and tools"),
-                 ('OPERATORS', "Boolean Operators", "Features for brush and auto Boolean operators")),
+                 ('OPERATORS', "Boolean Operators", "Features for brush and auto Boolean operators"),
+                 ('PERFORMANCE', "Performance", "Features that reduce how often Boolean modifiers are evaluated")),
         default = 'OPERATORS'
     )
 
@@ -114,6 +159,147 @@ class BoolToolPreferences(bpy.types.AddonPreferences):
         default = False,
     )
 
+    # Performance
+    use_result_cache: bpy.props.BoolProperty(
+        name = "Cache Boolean Results",
+        description = ("Store results of Boolean modifier stacks in memory, so that configurations which were already\n"
+                       "evaluated (i.e. toggling cutter off and on, undo & redo) are restored without running the solver.\n"
+                       "NOTE: While stored result is displayed modifiers it replaces are hidden in the viewport"),
+        default = False,
+        update = update_result_cache,
+    )
+    cache_size: bpy.props.IntProperty(
+        name = "Cache Size",
+        description = "Maximum amount of memory that stored results can take up",
+        min = 16, soft_max = 4096,
+        default = 512,
+        update = update_result_cache,
+    )
+
+    use_disk_cache: bpy.props.BoolProperty(
+        name = "Disk Cache",
+        description = ("When the file is saved, write results of Boolean modifier stacks in a folder next to it.\n"
+                       "When the file is opened, stored results are displayed instead of evaluating modifiers,\n"
+                       "until the canvas or one of its cutters is changed"),
+        default = False,
+    )
+    disk_cache_size: bpy.props.IntProperty(
+        name = "Disk Cache Size",
+        description = "Maximum size of the disk cache folder of each file. Least recently used results are removed first",
+        min = 64, soft_max = 16384,
+        default = 2048,
+    )
+
+    use_animation_cache: bpy.props.BoolProperty(
+        name = "Reuse Results During Animation",
+        description = ("During playback and rendering, reuse the same result on every frame for canvases whose cutters\n"
+                       "don't move relative to them (i.e. when cutters are parented to the animated canvas),\n"
+                       "and whose geometry isn't animated. Only canvases with actual relative motion are evaluated.\n"
+                       "NOTE: Results are only reused in renders when the interface is locked (Render > Lock Interface)"),
+        default = False,
+    )
+
+    defer_evaluation: bpy.props.EnumProperty(
+        name = "Defer While Transforming",
+        description = ("Don't evaluate Boolean modifiers affected by the transform (of cutters, or of the canvas in Edit Mode)\n"
+                       "while it's running, and evaluate them once when it ends"),
+        items = (('NONE', "Off", "Evaluate Boolean modifiers on every change"),
+                 ('DISABLE', "Hide Cuts", "Disable affected Boolean modifiers while transforming"),
+                 ('RESULT', "Show Last Result", ("Display the result from before the transform started "
+                                                 "(affected Boolean modifiers are disabled in Edit Mode)"))),
+        default = 'NONE',
+    )
+
+    use_view_culling: bpy.props.BoolProperty(
+        name = "View Culling",
+        description = ("Disable Boolean modifiers in the viewport while their cutters are outside of all 3D Viewports,\n"
+                       "or too small on the screen for their cuts to be visible, and enable them when they come into the view.\n"
+                       "NOTE: Rendering and applying modifiers always uses all of them"),
+        default = False,
+        update = update_view_culling,
+    )
+    culling_pixels: bpy.props.IntProperty(
+        name = "Minimum Size",
+        description = "Boolean modifiers are disabled when their cutters are smaller than this on the screen (in pixels)",
+        subtype = 'PIXEL',
+        min = 0, soft_max = 100,
+        default = 4,
+        update = update_view_culling,
+    )
+
+    use_cut_history: bpy.props.BoolProperty(
+        name = "Cut History",
+        description = ("Store the difference each destructive cut (Carver, Auto Boolean) made to the mesh, so that any of them\n"
+                       "can be reverted or replayed later. Only faces in the cut region are stored (compressed) in the object.\n"
+                       "NOTE: Restored faces keep their positions, materials, UV maps and shading, but not other attributes"),
+        default = False,
+    )
+    cut_history_size: bpy.props.IntProperty(
+        name = "Cuts",
+        description = "Maximum number of cuts stored in the history of each object. Oldest ones are forgotten first",
+        min = 1, soft_max = 100,
+        default = 20,
+    )
+
+    preload_assets: bpy.props.BoolProperty(
+        name = "Preload Assets",
+        description = ("Load node groups used by cutter effects (Array, Smooth by Angle) when the add-on is enabled\n"
+                       "and when the file is opened, instead of the first time Carver tools use them.\n"
+                       "Only files that already have cutters are affected, because node groups are saved with them"),
+        default = False,
+    )
+
+    use_viewport_fidelity: bpy.props.BoolProperty(
+        name = "Viewport Fidelity",
+        description = ("New Boolean modifiers are evaluated in the viewport by their viewport-only copies that use\n"
+                       "the cheaper solver, and heavy cutters are replaced by their decimated proxies. Modifiers keep\n"
+                       "the configured solver and are only disabled in the viewport, so render and apply don't change"),
+        default = False,
+        update = update_viewport_fidelity,
+    )
+    viewport_solver: bpy.props.EnumProperty(
+        name = "Viewport Solver",
+        description = "Solver that Boolean modifiers use in the viewport",
+        items = [('FLOAT', "Float", ""),
+                 ('MANIFOLD', "Manifold", "")],
+        default = 'FLOAT',
+    )
+    proxy_faces: bpy.props.IntProperty(
+        name = "Proxy Faces",
+        description = ("Cutters with more faces than this are decimated down to it in the viewport.\n"
+                       "Set to 0 to always use full-resolution cutters"),
+        min = 0, soft_max = 100000,
+        default = 2000,
+    )
+
+    use_idle_evaluation: bpy.props.BoolProperty(
+        name = "Idle Evaluation",
+        description = ("While Carver tools set the depth, cut canvases again only when the mouse stops moving\n"
+                       "(or at the capped rate), instead of on every change. Cutter preview is always updated immediately"),
+        default = False,
+    )
+    idle_time: bpy.props.IntProperty(
+        name = "Idle Time",
+        description = "How long (in milliseconds) the mouse has to stay still before canvases are cut again",
+        min = 0, soft_max = 1000,
+        default = 150,
+    )
+    evaluation_rate: bpy.props.IntProperty(
+        name = "Rate Cap",
+        description = ("How many times per second canvases are cut at most while the mouse keeps moving.\n"
+                       "Set to 0 to only cut them when the mouse stops"),
+        min = 0, soft_max = 30,
+        default = 5,
+    )
+
+    modal_rate: bpy.props.IntProperty(
+        name = "Modal Update Rate",
+        description = ("How many times per second Carver tools update the cutter while the mouse moves.\n"
+                       "Mouse movement in between is merged into the next update. Set to 0 to update on every event"),
+        min = 0, soft_min = 15, soft_max = 240,
+        default = 60,
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.use_property_split = True
@@ -164,6 +350,68 @@ class BoolToolPreferences(bpy.types.AddonPreferences):
             col.prop(self, "parent")
             col.prop(self, "pin")
 
+        # Performance Properties
+        if self.category == 'PERFORMANCE':
+            col = layout.column(align=True, heading="Result Cache")
+            row = col.row(align=True)
+            sub = row.row(align=True)
+            sub.prop(self, "use_result_cache", text="")
+            sub = sub.row(align=True)
+            sub.active = self.use_result_cache
+            sub.prop(self, "cache_size", text="Size (MB)")
+
+            col = layout.column(align=True, heading="Disk Cache")
+            row = col.row(align=True)
+            sub = row.row(align=True)
+            sub.prop(self, "use_disk_cache", text="")
+            sub = sub.row(align=True)
+            sub.active = self.use_disk_cache
+            sub.prop(self, "disk_cache_size", text="Size (MB)")
+
+            col = layout.column(align=True, heading="Viewport Fidelity")
+            row = col.row(align=True)
+            sub = row.row(align=True)
+            sub.prop(self, "use_viewport_fidelity", text="")
+            sub = sub.row(align=True)
+            sub.active = self.use_viewport_fidelity
+            sub.prop(self, "viewport_solver", expand=True)
+            sub = col.row(align=True)
+            sub.active = self.use_viewport_fidelity
+            sub.prop(self, "proxy_faces")
+
+            col = layout.column(align=True, heading="View Culling")
+            row = col.row(align=True)
+            sub = row.row(align=True)
+            sub.prop(self, "use_view_culling", text="")
+            sub = sub.row(align=True)
+            sub.active = self.use_view_culling
+            sub.prop(self, "culling_pixels")
+
+            col = layout.column(align=True, heading="Idle Evaluation")
+            row = col.row(align=True)
+            sub = row.row(align=True)
+            sub.prop(self, "use_idle_evaluation", text="")
+            sub = sub.row(align=True)
+            sub.active = self.use_idle_evaluation
+            sub.prop(self, "idle_time", text="Idle Time (ms)")
+            sub = col.row(align=True)
+            sub.active = self.use_idle_evaluation
+            sub.prop(self, "evaluation_rate")
+
+            col = layout.column(align=True, heading="Cut History")
+            row = col.row(align=True)
+            sub = row.row(align=True)
+            sub.prop(self, "use_cut_history", text="")
+            sub = sub.row(align=True)
+            sub.active = self.use_cut_history
+            sub.prop(self, "cut_history_size")
+
+            col = layout.column()
+            col.prop(self, "defer_evaluation")
+            col.prop(self, "use_animation_cache")
+            col.prop(self, "preload_assets")
+            col.prop(self, "modal_rate")
+
 
 
 #### ------------------------------ REGISTRATION ------------------------------ ####
@@ -1,8 +1,110 @@
 import bpy
 
+from .functions.cache import (
+    restore_canvas_result,
+    track_cached_canvas,
+)
+from .handlers import (
+    schedule_checkpoints,
+)
+
+
+#### ------------------------------ FUNCTIONS ------------------------------ ####
+
+def update_checkpoints(self, context):
+    """Evaluate checkpoints when they're enabled (or their interval changes), and remove them when disabled."""
+
+    canvas = self.id_data
+    restore_canvas_result(context, canvas)
+    if self.use_checkpoints:
+        track_cached_canvas(canvas)
+        schedule_checkpoints(canvas)
+
+
 
 #### ------------------------------ PROPERTIES ------------------------------ ####
 
+class OBJECT_PG_boolean_archive(bpy.types.PropertyGroup):
+    # Boolean modifier that was automatically applied, stored so that it can be re-created.
+
+    object: bpy.props.PointerProperty(
+        name = "Cutter",
+        type = bpy.types.Object,
+        options = set(),
+    )
+    operation: bpy.props.StringProperty(
+        name = "Operation",
+        options = set(),
+    )
+    solver: bpy.props.StringProperty(
+        name = "Solver",
+        options = set(),
+    )
+    material_mode: bpy.props.StringProperty(
+        name = "Materials",
+        options = set(),
+    )
+    use_self: bpy.props.BoolProperty(
+        name = "Self Intersection",
+        options = set(),
+    )
+    use_hole_tolerant: bpy.props.BoolProperty(
+        name = "Hole Tolerant",
+        options = set(),
+    )
+    double_threshold: bpy.props.FloatProperty(
+        name = "Overlap Threshold",
+        options = set(),
+    )
+    index: bpy.props.IntProperty(
+        name = "Index",
+        description = "Position of the modifier in the stack when it was archived (-1 if it wasn't recorded)",
+        default = -1,
+        options = set(),
+    )
+    batch: bpy.props.IntProperty(
+        name = "Batch",
+        description = "Number of the archiving that applied the modifier (modifiers are restored from the last one)",
+        options = set(),
+    )
+
+
+class OBJECT_PG_boolean_suspended(bpy.types.PropertyGroup):
+    # Modifier that was temporarily disabled by the add-on (and not by the user), stored so that it can be re-enabled.
+    # NOTE: `name` is the name of the modifier.
+
+    reason: bpy.props.StringProperty(
+        name = "Reason",
+        options = set(),
+    )
+
+
+class OBJECT_PG_boolean_cut(bpy.types.PropertyGroup):
+    # Destructive cut stored as the difference it made (faces it removed & added), so that it can be reverted or replayed.
+    # NOTE: `name` is the name of the operator that made the cut.
+
+    removed: bpy.props.StringProperty(
+        name = "Removed Faces",
+        description = "Compressed faces that the cut removed",
+        options = set(),
+    )
+    added: bpy.props.StringProperty(
+        name = "Added Faces",
+        description = "Compressed faces that the cut added",
+        options = set(),
+    )
+    faces: bpy.props.IntProperty(
+        name = "Faces",
+        description = "Number of faces that the cut removed and added",
+        options = set(),
+    )
+    reverted: bpy.props.BoolProperty(
+        name = "Reverted",
+        options = set(),
+        default = False,
+    )
+
+
 class OBJECT_PG_booleans(bpy.types.PropertyGroup):
     # OBJECT-level Properties
 
@@ -34,11 +136,102 @@ class OBJECT_PG_booleans(bpy.types.PropertyGroup):
 
     modifiers_list_index: bpy.props.IntProperty()
 
+    # Rolling auto-apply.
+    auto_apply: bpy.props.BoolProperty(
+        name = "Auto Apply Oldest Cutters",
+        description = ("Automatically apply the oldest Boolean modifiers when their number exceeds the limit.\n"
+                       "Their cutters are archived in a hidden collection, so that the operation can be reverted"),
+        options = set(),
+        default = False,
+    )
+    auto_apply_limit: bpy.props.IntProperty(
+        name = "Limit",
+        description = "Maximum number of live Boolean modifiers on the canvas",
+        options = set(),
+        min = 1, soft_max = 500,
+        default = 100,
+    )
+    archived_cutters: bpy.props.CollectionProperty(
+        name = "Archived Cutters",
+        type = OBJECT_PG_boolean_archive,
+        options = set(),
+    )
+    archived_mesh: bpy.props.PointerProperty(
+        name = "Archived Mesh",
+        description = "Mesh of the canvas as it was before the first cutter was archived",
+        type = bpy.types.Mesh,
+        options = set(),
+    )
+
+    # Result cache.
+    suspended_modifiers: bpy.props.CollectionProperty(
+        name = "Suspended Modifiers",
+        type = OBJECT_PG_boolean_suspended,
+        options = set(),
+    )
+    result: bpy.props.PointerProperty(
+        name = "Result",
+        description = "Hidden object which holds the stored result of the modifier stack that is displayed instead of it",
+        type = bpy.types.Object,
+        options = set(),
+    )
+    use_checkpoints: bpy.props.BoolProperty(
+        name = "Checkpoints",
+        description = ("Store intermediate results of the modifier stack after every few Boolean modifiers, so that changing\n"
+                       "a cutter only evaluates Boolean modifiers from the nearest checkpoint before it onward.\n"
+                       "NOTE: Checkpoints take up the memory of the result cache"),
+        options = set(),
+        default = False,
+        update = update_checkpoints,
+    )
+    checkpoint_interval: bpy.props.IntProperty(
+        name = "Interval",
+        description = "Number of Boolean modifiers between two checkpoints",
+        options = set(),
+        min = 2, soft_max = 100,
+        default = 20,
+        update = update_checkpoints,
+    )
+    frozen: bpy.props.BoolProperty(
+        name = "Frozen",
+        description = "Stored result is displayed instead of the modifier stack until the canvas is thawed",
+        options = set(),
+        default = False,
+    )
+    result_key: bpy.props.StringProperty(
+        name = "Result Key",
+        description = "Fingerprint of the configuration which displayed result belongs to",
+        options = set(),
+    )
+
+    # Cut history.
+    cuts: bpy.props.CollectionProperty(
+        name = "Cuts",
+        type = OBJECT_PG_boolean_cut,
+        options = set(),
+    )
+
+    # Solo.
+    solo: bpy.props.StringProperty(
+        name = "Solo Modifier",
+        description = "Name of the Boolean modifier that is the only one evaluated in the viewport",
+        options = set(),
+    )
+    solo_enabled: bpy.props.BoolProperty(
+        name = "Enabled by Solo",
+        description = "Soloed Boolean modifier was disabled before, and will be disabled again when solo ends",
+        options = set(),
+        default = False,
+    )
+
 
 
 #### ------------------------------ REGISTRATION ------------------------------ ####
 
 classes = (
+    OBJECT_PG_boolean_archive,
+    OBJECT_PG_boolean_suspended,
+    OBJECT_PG_boolean_cut,
     OBJECT_PG_booleans,
 )
 
@@ -1,17 +1,17 @@
 import bpy
 import os
-from mathutils import Vector
 
+from .. import __package__ as base_package
 from ..constants import (
     ICONS_PATH,
 )
-from ..functions.view import (
-    redraw_regions,
-)
 
 from .common.base import (
     CarverBase,
 )
+from .common.scheduler import (
+    ModalScheduler,
+)
 from .common.properties import (
     CarverPropsBevel,
 )
@@ -122,6 +122,19 @@ class OBJECT_OT_carve_box(CarverBase, CarverPropsBevel):
         self._initial_origin = self.origin  # Initial shape origin.
         self._initial_aspect = self.aspect  # Initial shape aspect.
         self._stored_phase = "DRAW"
+        self._preview_state = None  # State of the cutter during the last drawn live preview.
+        self._draw_state = None  # State of the cutter that preview geometry was built for.
+        self._draw_buffers = (None, None)
+        self._canvas_proxies = []  # Proxies displayed instead of heavy canvases (with interactive fidelity).
+        self._snapshot = None  # Copy of the cutter that canvases are cut with (with idle evaluation).
+        self._snapshot_state = None
+        self._snapshot_timer = None  # Timer that updates the snapshot (stopped when the modal ends).
+        self._canvas_bounds = None  # Oriented bounding boxes of selected objects (for broadphase).
+        self._reach_state = None  # State of the cutter that reached canvases were found for.
+
+        # Modal Scheduler
+        prefs = context.preferences.addons[base_package].preferences
+        self.scheduler = ModalScheduler(self, context, rate=prefs.modal_rate)
 
         # Add Draw Handler
         self._handler = bpy.types.SpaceView3D.draw_handler_add(self.draw_shaders,
@@ -134,10 +147,9 @@ class OBJECT_OT_carve_box(CarverBase, CarverPropsBevel):
 
 
     def modal(self, context, event):
-        redraw_regions(context)
-
-        # Status Bar Text
-        self.status(context)
+        # Coalesce mouse movement into one update per frame (also redraws & sets status bar text).
+        if not self.scheduler.process(context, event):
+            return {'RUNNING_MODAL'}
 
         # Modifier Keys
         self.event_aspect(context, event)
@@ -155,8 +167,8 @@ class OBJECT_OT_carve_box(CarverBase, CarverPropsBevel):
                 return {'PASS_THROUGH'}
 
         # Mouse Move
-        if event.type == 'MOUSEMOVE':
-            self.mouse.current = Vector((event.mouse_region_x, event.mouse_region_y))
+        if self.scheduler.moved:
+            self.mouse.current = self.scheduler.flush()
 
             # Draw
             if self.phase == "DRAW":
@@ -166,8 +178,11 @@ class OBJECT_OT_carve_box(CarverBase, CarverPropsBevel):
             elif self.phase == "EXTRUDE":
                 self.set_extrusion_depth(context)
 
+        # Enable Boolean modifiers only on canvases that the cutter can reach.
+        self.update_reached_canvases()
+
         # Confirm
-        elif event.type == 'LEFTMOUSE':
+        if event.type == 'LEFTMOUSE':
             # Confirm Shape
             if self.phase == "DRAW" and event.value == 'RELEASE':
                 """
@@ -3,16 +3,17 @@ import os
 from mathutils import Vector
 from bpy_extras import view3d_utils
 
+from .. import __package__ as base_package
 from ..constants import (
     ICONS_PATH,
 )
-from ..functions.view import (
-    redraw_regions,
-)
 
 from .common.base import (
     CarverBase,
 )
+from .common.scheduler import (
+    ModalScheduler,
+)
 from .common.types import (
     Selection,
     Mouse,
@@ -97,6 +98,19 @@ class OBJECT_OT_carve_polyline(CarverBase):
         self.phase = "DRAW"
         self._distance_from_first = 0
         self._stored_phase = "DRAW"
+        self._preview_state = None  # State of the cutter during the last drawn live preview.
+        self._draw_state = None  # State of the cutter that preview geometry was built for.
+        self._draw_buffers = (None, None)
+        self._canvas_proxies = []  # Proxies displayed instead of heavy canvases (with interactive fidelity).
+        self._snapshot = None  # Copy of the cutter that canvases are cut with (with idle evaluation).
+        self._snapshot_state = None
+        self._snapshot_timer = None  # Timer that updates the snapshot (stopped when the modal ends).
+        self._canvas_bounds = None  # Oriented bounding boxes of selected objects (for broadphase).
+        self._reach_state = None  # State of the cutter that reached canvases were found for.
+
+        # Modal Scheduler
+        prefs = context.preferences.addons[base_package].preferences
+        self.scheduler = ModalScheduler(self, context, rate=prefs.modal_rate)
 
         # Add Draw Handler
         self._handler = bpy.types.SpaceView3D.draw_handler_add(self.draw_shaders,
@@ -109,10 +123,9 @@ class OBJECT_OT_carve_polyline(CarverBase):
 
 
     def modal(self, context, event):
-        redraw_regions(context)
-
-        # Status Bar Text
-        self.status(context)
+        # Coalesce mouse movement into one update per frame (also redraws & sets status bar text).
+        if not self.scheduler.process(context, event):
+            return {'RUNNING_MODAL'}
 
         # Modifier Keys
         self.event_array(context, event)
@@ -125,8 +138,8 @@ class OBJECT_OT_carve_polyline(CarverBase):
                 return {'PASS_THROUGH'}
 
         # Mouse Move
-        if event.type == 'MOUSEMOVE':
-            self.mouse.current = Vector((event.mouse_region_x, event.mouse_region_y))
+        if self.scheduler.moved:
+            self.mouse.current = self.scheduler.flush()
 
             # Draw
             if self.phase == "DRAW":
@@ -145,8 +158,11 @@ class OBJECT_OT_carve_polyline(CarverBase):
             elif self.phase == "EXTRUDE":
                 self.set_extrusion_depth(context)
 
+        # Enable Boolean modifiers only on canvases that the cutter can reach.
+        self.update_reached_canvases()
+
         # Add Points & Confirm
-        elif event.type == 'LEFTMOUSE' and event.value == 'PRESS':
+        if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
             if self.phase == "DRAW":
                 # Add Point
                 if self._distance_from_first < 75:
@@ -328,7 +344,7 @@ class OBJECT_OT_carve_polyline(CarverBase):
             self.cutter.faces = [face]
 
         # Update bmesh.
-        bm.to_mesh(self.cutter.mesh)
+        self.update_cutter_mesh(topology=True)
 
 
     def _remove_polyline_point(self, context, jump_mouse=True):
@@ -367,7 +383,7 @@ class OBJECT_OT_carve_polyline(CarverBase):
             bm.edges.new([new_last, first_vert])
 
         # Update bmesh.
-        bm.to_mesh(self.cutter.mesh)
+        self.update_cutter_mesh(topology=True)
 
         # Jump mouse to the new last vert.
         if jump_mouse:
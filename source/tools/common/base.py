@@ -1,28 +1,55 @@
 import bpy
 import bmesh
 import math
+import time
 import mathutils
+import numpy as np
 from bpy_extras import view3d_utils
 from mathutils import Vector, Matrix
 
+from ... import __package__ as base_package
+from ...constants import (
+    INTERACTIVE_FIDELITY_FACES,
+)
+from ...functions.bvh import (
+    RAYCAST_TYPES,
+    find_exit_distance,
+)
+from ...functions.canvas import (
+    enforce_boolean_limit,
+)
 from ...functions.cutter import (
     make_cutter,
 )
 from ...functions.draw import (
     draw_shader,
-    draw_bmesh_faces,
     draw_circle_billboard,
 )
+from ...functions.history import (
+    record_cut,
+)
 from ...functions.mesh import (
+    get_triangle_buffers,
+    get_evaluated_polygon,
+    get_faces_in_bounds,
+    get_vertices_in_bounds,
+    sample_flat_mesh,
+    write_faces,
+    write_vertex_positions,
     is_instanced_mesh,
     extrude_face,
-    are_intersecting,
 )
 from ...functions.modifier import (
     add_boolean_modifier,
     apply_modifiers,
+    get_viewport_modifier,
     get_modifiers_to_apply,
 )
+from ...functions.overlap import (
+    get_oriented_bounds,
+    build_bounds_table,
+    overlap_oriented_bounds,
+)
 from ...functions.object import (
     is_linked,
     set_object_origin,
@@ -41,6 +68,9 @@ from ...functions.view import (
 from .events import (
     CarverEvents,
 )
+from .types import (
+    CanvasProxy,
+)
 from .properties import (
     CarverPropsOperator,
     CarverPropsShape,
@@ -50,6 +80,14 @@ from .properties import (
 )
 
 
+# Interval (in seconds) in which the timer checks whether the cutter snapshot should be updated.
+SNAPSHOT_INTERVAL = 0.02
+
+# Margin (relative to the size of the cutter footprint) that regions of canvas proxies are cropped with,
+# so that they're only cropped again when the cutter moves further than that.
+PROXY_MARGIN = 0.25
+
+
 #### ------------------------------ CLASSES ------------------------------ ####
 
 class CarverBase(bpy.types.Operator,
@@ -182,25 +220,24 @@ class CarverBase(bpy.types.Operator,
 
     def draw_shaders(self, context):
         """
-        Creates a drawing from bmesh faces of the cutter.
+        Creates a drawing from triangles of the cutter mesh.
         Evaluated cutter object is used to draw modifier effects as well (bevel, array).
         """
 
         obj = self.cutter.obj
+        state = self._get_preview_state()
 
-        # Get evaluated cutter object.
-        depsgraph = context.evaluated_depsgraph_get()
-        eval_cutter_obj = obj.evaluated_get(depsgraph)
-        eval_cutter_mesh = eval_cutter_obj.to_mesh()
-
-        # Create temporary bmesh.
-        temp_bm = bmesh.new()
-        temp_bm.from_mesh(eval_cutter_mesh)
-        temp_bm.faces.ensure_lookup_table()
-        faces = temp_bm.faces
+        # Rebuild preview geometry only when the cutter (its shape, effects or matrix) changed since the last redraw.
+        if state != self._draw_state:
+            depsgraph = context.evaluated_depsgraph_get()
+            eval_cutter_obj = obj.evaluated_get(depsgraph)
+            eval_cutter_mesh = eval_cutter_obj.to_mesh()
+            self._draw_buffers = get_triangle_buffers(eval_cutter_mesh, obj.matrix_world)
+            eval_cutter_obj.to_mesh_clear()
+            self._draw_state = state
 
         # Draw Faces
-        vertices, indices = draw_bmesh_faces(faces, obj.matrix_world)
+        vertices, indices = self._draw_buffers
         if vertices is not None and indices is not None:
             draw_shader('SOLID', (0.48, 0.04, 0.04), 0.4, vertices, indices=indices)
 
@@ -225,7 +262,30 @@ class CarverBase(bpy.types.Operator,
                 if len(vertices) > 0:
                     draw_shader('LINE_LOOP', (0, 0, 0), 1.0, vertices)
 
-        temp_bm.free()
+        # Store the state of the cutter that canvases were evaluated with for this preview.
+        if self.objects.modifiers:
+            self._preview_state = self._snapshot_state if self._snapshot is not None else state
+
+
+    def _get_preview_state(self) -> int:
+        """
+        Returns the hash of everything on the cutter side that affects the result of the live cut.
+        Comparing two hashes tells whether canvases need to be evaluated again.
+        """
+
+        obj = self.cutter.obj
+        mesh = self.cutter.mesh
+
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        matrix = np.array(obj.matrix_world, dtype=np.float32)
+
+        modifiers = tuple((mod.name, mod.show_viewport) for mod in obj.modifiers)
+        effects = (self.rows, self.columns, self.gap,
+                   getattr(self, "bevel_width", None), getattr(self, "bevel_segments", None),
+                   getattr(self, "bevel_profile", None))
+
+        return hash((matrix.tobytes(), coords.tobytes(), modifiers, effects))
 
 
     def update_cutter_shape(self, context):
@@ -288,7 +348,19 @@ class CarverBase(bpy.types.Operator,
             vert.co = Vector((x, y, 0))
 
         # Update Mesh & bmesh
-        bm.to_mesh(self.cutter.mesh)
+        self.update_cutter_mesh()
+
+
+    def update_cutter_mesh(self, topology=False):
+        """
+        Writes cutter `bmesh` into its mesh. While topology is unchanged only vertex positions are written,
+        full conversion is done after topology (or attribute) edits, or when `topology` is True.
+        """
+
+        cutter = self.cutter
+        if topology or not cutter.synced or not write_vertex_positions(cutter.bm, cutter.mesh):
+            cutter.bm.to_mesh(cutter.mesh)
+            cutter.synced = True
 
 
     def extrude_cutter(self, context):
@@ -321,20 +393,31 @@ class CarverBase(bpy.types.Operator,
             if self.alignment == 'CURSOR' and self.depth == 'CURSOR':
                 self.depth = 'AUTO'
 
+            offset = self.offset if self.alignment == 'SURFACE' else 0.1
+
+            # Push the extruded face to where rays cast from the cutter shape leave selected objects.
+            if self.depth == 'EXACT':
+                exit_distance = self._calculate_exact_depth(context)
+
+                # Fall back to auto when the shape doesn't hit any of the objects.
+                if exit_distance is None:
+                    self.depth = 'AUTO'
+                else:
+                    for v in face.verts:
+                        v.co += normal * (-exit_distance - offset)
+
             # Push the extruded face towards the furthest point of the collective bounding box.
             if self.depth == 'AUTO':
-                corners = []
-                for ob in self.objects.selected:
-                    corners.extend(ob.matrix_world @ Vector(c) for c in ob.bound_box)
+                matrix_inv = self.cutter.obj.matrix_world.inverted()
 
                 furthest_corner = 0.0
-                for corner in corners:
-                    local_corner = self.cutter.obj.matrix_world.inverted() @ corner
-                    t = (local_corner - location).dot(normal)
-                    if t < furthest_corner:
-                        furthest_corner = t
-
-                offset = self.offset if self.alignment == 'SURFACE' else 0.1
+                for ob in self.objects.selected:
+                    # Corners are transformed straight into the cutter space with a single matrix per object.
+                    matrix = matrix_inv @ ob.matrix_world
+                    for c in ob.bound_box:
+                        t = (matrix @ Vector(c) - location).dot(normal)
+                        if t < furthest_corner:
+                            furthest_corner = t
 
                 for v in face.verts:
                     v.co += normal * (furthest_corner - offset)
@@ -372,16 +455,71 @@ class CarverBase(bpy.types.Operator,
         if getattr(self.effects, "bevel", None):
             self.effects.transfer_bevel_weights(self)
 
-        bm.to_mesh(obj.data)
+        # Select all faces of the cutter so that newly created faces in canvas
+        # are also selected after applying the modifier.
+        # (NOTE: Done here and not on confirm, so that live preview already has the final selection).
+        for f in bm.faces:
+            f.select = True
+
+        self.update_cutter_mesh(topology=True)
         obj.data.update()
         context.view_layer.update()
 
         self.phase = "EXTRUDE"
 
 
+    def _calculate_exact_depth(self, context):
+        """
+        Casts rays from points covering the cutter shape (including array & bevel effects) through selected objects,
+        and returns the distance (from the shape, along the workplane normal) at which the last of them leaves objects.
+        Rays are sampled, so thin features between them can be missed. Depth is extended to also cover
+        vertices of selected objects that are inside of the bounds of the shape.
+        """
+
+        obj = self.cutter.obj
+        depsgraph = context.evaluated_depsgraph_get()
+
+        eval_cutter_obj = obj.evaluated_get(depsgraph)
+        eval_cutter_mesh = eval_cutter_obj.to_mesh()
+        points = sample_flat_mesh(eval_cutter_mesh)
+        eval_cutter_obj.to_mesh_clear()
+        if len(points) == 0:
+            return None
+
+        origins = [obj.matrix_world @ point for point in points]
+        direction = -self.workplane.normal
+        exit_distance = find_exit_distance(self.objects.selected, depsgraph, origins, direction)
+
+        # Furthest vertex inside of the footprint of the shape (calculated in the cutter space, like the auto depth).
+        normal = obj.matrix_world.to_3x3().inverted() @ self.workplane.normal
+        location = obj.matrix_world.inverted() @ self.workplane.location
+        min_co = (min(p.x for p in points), min(p.y for p in points))
+        max_co = (max(p.x for p in points), max(p.y for p in points))
+
+        matrix_inv = obj.matrix_world.inverted()
+        for ob in self.objects.selected:
+            if ob.type not in RAYCAST_TYPES:
+                continue
+
+            ob_eval = ob.evaluated_get(depsgraph)
+            mesh = ob_eval.to_mesh()
+            vertices = get_vertices_in_bounds(mesh, matrix_inv @ ob.matrix_world, min_co, max_co)
+            ob_eval.to_mesh_clear()
+            if len(vertices) == 0:
+                continue
+
+            distance = -float(((vertices - np.array(location)) @ np.array(normal)).min())
+            if distance > 0.0 and (exit_distance is None or distance > exit_distance):
+                exit_distance = distance
+
+        return exit_distance
+
+
     def set_extrusion_depth(self, context):
         """Change extude depth during modal."""
 
+        self._update_canvas_proxies(context)
+
         region = context.region
         rv3d = context.region_data
 
@@ -417,7 +555,7 @@ class CarverBase(bpy.types.Operator,
 
                 v.co = vert_co + offset
 
-        self.cutter.bm.to_mesh(self.cutter.mesh)
+        self.update_cutter_mesh()
 
 
     # Alignment Methods
@@ -434,23 +572,23 @@ class CarverBase(bpy.types.Operator,
             return None, None, None
 
         ray_obj_matrix = ray.obj.matrix_world
-        mesh = ray.obj.evaluated_get(context.view_layer.depsgraph).to_mesh()
+        polygon = get_evaluated_polygon(ray.obj, context.view_layer.depsgraph, ray.index)
 
-        if mesh is None:
+        if polygon is None:
             self.alignment = 'VIEW'
             return None, None, None
 
-        # Create temporary `bmesh`.
-        temp_bm = bmesh.new()
-        temp_bm.from_mesh(mesh)
-        temp_bm.faces.ensure_lookup_table()
-
-        face = temp_bm.faces[ray.index]
+        # Read the hit face (corners are in the same order as loops of the face in `bmesh`).
+        coords, face_normal = polygon
+        edges = [(coords[i], coords[(i + 1) % len(coords)]) for i in range(len(coords))]
 
         if self.orientation == 'FACE':
             # Get the tangent, normal, and bitangent from the face normal.
-            tangent = face.calc_tangent_edge()
-            normal = face.normal
+            # (same as `BMFace.calc_tangent_edge`, i.e. direction of the longest edge, last one if they're equal).
+            lengths = [(start - end).length_squared for start, end in edges]
+            start, end = edges[len(lengths) - 1 - lengths[::-1].index(max(lengths))]
+            tangent = (start - end).normalized()
+            normal = face_normal
             bitangent = normal.cross(tangent)
 
         elif self.orientation in ('CLOSEST_EDGE', 'LONGEST_EDGE'):
@@ -458,32 +596,28 @@ class CarverBase(bpy.types.Operator,
 
             if self.orientation == 'LONGEST_EDGE':
                 lengths = [
-                    (ray_obj_matrix @ edge.verts[0].co - ray_obj_matrix @ edge.verts[1].co).length
-                    for edge in face.edges
+                    (ray_obj_matrix @ start - ray_obj_matrix @ end).length
+                    for start, end in edges
                 ]
-                longest_edge = sorted(zip(lengths, face.edges), key=lambda x: x[0], reverse=True)[0][1]
-                edge = longest_edge
+                edge = edges[lengths.index(max(lengths))]
 
             elif self.orientation == 'CLOSEST_EDGE':
                 distances = [
                     distance_from_point_to_segment(
                         ray.location,
-                        ray_obj_matrix @ edge.verts[0].co,
-                        ray_obj_matrix @ edge.verts[1].co,
+                        ray_obj_matrix @ start,
+                        ray_obj_matrix @ end,
                     )
-                    for edge in face.edges
+                    for start, end in edges
                 ]
-                closest_edge = sorted(zip(distances, face.edges), key=lambda x: x[0])[0][1]
-                edge = closest_edge
-
-            # Get the loop (face corner) for the edge that is also in the face.
-            face_corner = next(loop for loop in edge.link_loops if loop.face == face)
+                edge = edges[distances.index(min(distances))]
 
-            start = face_corner.vert
-            end = face_corner.link_loop_next.vert
-            direction = (end.co - start.co)
+            # Edge goes from the corner to the next corner of the face.
+            start, end = edge
+            direction = (end - start)
 
-            tangent = edge.calc_tangent(face_corner)
+            # (same as `BMEdge.calc_tangent`).
+            tangent = (start - end).cross(face_normal).normalized()
             normal = direction.cross(tangent)
             bitangent = normal.cross(tangent)
 
@@ -494,10 +628,6 @@ class CarverBase(bpy.types.Operator,
         matrix[2].xyz = (ray_obj_matrix.to_3x3() @ normal).normalized()
         matrix[3].xyz = ray.location + (ray.normal * self.offset)
 
-        # destroy_temporary_bmesh
-        temp_bm.free()
-        del mesh
-
         matrix = matrix.transposed()
         location = ray.location + (ray.normal * self.offset)
         normal = ray.normal
@@ -593,12 +723,327 @@ class CarverBase(bpy.types.Operator,
 
         cutter = self.cutter.obj
 
+        # Proxies are created before modifiers are added, from canvases that aren't cut yet.
+        if self.interactive_fidelity and self.depth == 'MANUAL' and context.mode == 'OBJECT':
+            self._create_canvas_proxies(context)
+
         for obj in self.objects.selected:
             mod = add_boolean_modifier(self, context, obj,
                                        cutter, "DIFFERENCE",
                                        self.solver, pin=self.pin, redo=False)
             self.objects.modifiers[obj] = mod
 
+        for proxy in self._canvas_proxies:
+            get_viewport_modifier(self.objects.modifiers[proxy.canvas]).show_viewport = False
+
+        # Only modifiers on canvases that the cutter can reach are evaluated.
+        self._canvas_bounds = build_bounds_table(self.objects.selected)
+        self.update_reached_canvases()
+
+        # Canvases are evaluated when the mouse is idle, instead of on every event that changes the cutter.
+        prefs = context.preferences.addons[base_package].preferences
+        if prefs.use_idle_evaluation and self.depth == 'MANUAL':
+            self._create_cutter_snapshot(context)
+
+
+    # Broadphase
+    def _find_reached_canvases(self) -> list:
+        """Returns selected objects whose oriented bounding boxes overlap the oriented bounding box of the cutter."""
+
+        bounds = get_oriented_bounds(self.cutter.obj, self._get_cutter_extent())
+        mask = overlap_oriented_bounds(bounds, self._canvas_bounds)
+
+        return [obj for obj, reached in zip(self.objects.selected, mask) if reached]
+
+
+    def _get_cutter_extent(self) -> list:
+        """
+        Returns minimum & maximum corners of the box (in cutter space) that contains the cutter with its effects.
+        Box is made from the cutter `bmesh` and array effect parameters, because evaluated bounds of the cutter
+        are only updated on the next depsgraph evaluation. Bevel doesn't make the cutter any bigger.
+        """
+
+        coords = [v.co for v in self.cutter.bm.verts]
+        low = Vector([min(co[axis] for co in coords) for axis in range(3)])
+        high = Vector([max(co[axis] for co in coords) for axis in range(3)])
+
+        # Duplicates are offset by the size of the cutter, to either side (depending on the rotation of the cutter).
+        if self.effects.array is not None:
+            size = high - low
+            offset = Vector(((self.columns - 1) * size.x * self.gap, (self.rows - 1) * size.y * self.gap, 0))
+            low -= offset
+            high += offset
+
+        return [low, high]
+
+
+    def update_reached_canvases(self):
+        """
+        Enables Boolean modifiers (in the viewport) only on canvases that the cutter can reach.
+        Canvases are checked again only when the cutter changed (i.e. was moved, rotated, reshaped or extruded).
+        """
+
+        if not self.objects.modifiers:
+            return
+
+        state = self._get_preview_state()
+        if state == self._reach_state:
+            return
+        self._reach_state = state
+
+        reached = self._find_reached_canvases()
+        proxies = {proxy.canvas: proxy for proxy in self._canvas_proxies}
+
+        for obj, mod in self.objects.modifiers.items():
+            # Proxy is cut instead of the canvas while it's displayed.
+            if obj in proxies:
+                mod = proxies[obj].region.modifiers.get("boolean_proxy")
+                if mod is None:
+                    continue
+            else:
+                mod = get_viewport_modifier(mod)
+
+            show = obj in reached
+            if mod.show_viewport != show:
+                mod.show_viewport = show
+
+
+    # Interactive Fidelity
+    def _create_canvas_proxies(self, context):
+        """
+        Replaces heavy canvases with proxies for the duration of the modal.
+        Faces of the canvas under the cutter are separated into the region object, which is cut with the Float solver,
+        so that setting the depth doesn't evaluate the Boolean modifier (with the final solver) on the whole canvas.
+        """
+
+        depsgraph = context.view_layer.depsgraph
+
+        for obj in self.objects.selected:
+            if obj.type != 'MESH' or len(obj.data.polygons) < INTERACTIVE_FIDELITY_FACES:
+                continue
+
+            source = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+            proxy = CanvasProxy(obj, source)
+            self._canvas_proxies.append(proxy)
+            self._crop_canvas_proxy(context, proxy)
+
+            obj.hide_set(True)
+
+
+    def _crop_canvas_proxy(self, context, proxy):
+        """
+        Fills region & rest objects of the proxy (creating them the first time) with faces that are under
+        the current cutter footprint, and the rest of them. Meshes of the objects are reused by later crops.
+        """
+
+        cutter = self.cutter.obj
+        canvas = proxy.canvas
+
+        if proxy.region is None:
+            objects = []
+            for name in ("boolean_proxy_region", "boolean_proxy"):
+                ob = bpy.data.objects.new(name, bpy.data.meshes.new(name))
+                ob.matrix_world = canvas.matrix_world
+                ob.hide_select = True
+                for collection in canvas.users_collection:
+                    collection.objects.link(ob)
+                objects.append(ob)
+            proxy.region, proxy.rest = objects
+
+            mod = proxy.region.modifiers.new("boolean_proxy", 'BOOLEAN')
+            mod.operation = 'DIFFERENCE'
+            mod.object = self._snapshot or cutter
+            mod.solver = 'FLOAT' if bpy.app.version >= (5, 0, 0) else 'FAST'
+
+        # Footprint of the cutter (including effects) on its workplane, with the margin.
+        low, high = self._get_cutter_extent()
+        margin = (high.xy - low.xy).length * PROXY_MARGIN
+        min_co = low.xy - Vector((margin, margin))
+        max_co = high.xy + Vector((margin, margin))
+
+        matrix = cutter.matrix_world.inverted() @ canvas.matrix_world
+        face_mask = get_faces_in_bounds(proxy.source, matrix, min_co, max_co)
+        write_faces(proxy.source, face_mask, proxy.region.data)
+        write_faces(proxy.source, ~face_mask, proxy.rest.data)
+
+        proxy.matrix = cutter.matrix_world.copy()
+        proxy.bounds = (min_co, max_co)
+
+
+    def _is_proxy_cropped(self, proxy) -> bool:
+        """Checks whether the region of the proxy still contains the whole footprint of the cutter."""
+
+        if proxy.matrix is None:
+            return False
+
+        # Region contains faces along the axis of the cutter it was cropped for, so rotating the cutter needs a new one.
+        matrix = self.cutter.obj.matrix_world
+        if not np.allclose(np.array(proxy.matrix.to_3x3().normalized()), np.array(matrix.to_3x3().normalized()), atol=1e-5):
+            return False
+
+        low, high = self._get_cutter_extent()
+        local = proxy.matrix.inverted_safe() @ matrix
+        min_co, max_co = proxy.bounds
+        for x in (low.x, high.x):
+            for y in (low.y, high.y):
+                co = local @ Vector((x, y, low.z))
+                if not (min_co.x <= co.x <= max_co.x and min_co.y <= co.y <= max_co.y):
+                    return False
+
+        return True
+
+
+    def _update_canvas_proxies(self, context):
+        """Crops proxies again when the cutter was rotated, or moved out of their regions after they were cropped."""
+
+        for proxy in self._canvas_proxies:
+            if not self._is_proxy_cropped(proxy):
+                self._crop_canvas_proxy(context, proxy)
+
+
+    def _remove_canvas_proxies(self, context):
+        """Removes proxies, and shows canvases they were displayed instead of (with their Boolean modifiers)."""
+
+        for proxy in self._canvas_proxies:
+            for ob in (proxy.region, proxy.rest):
+                if ob is not None:
+                    delete_object(ob)
+            bpy.data.meshes.remove(proxy.source)
+
+            canvas = proxy.canvas
+            canvas.hide_set(False)
+            canvas.select_set(proxy.selected)
+            if canvas == self.objects.active:
+                context.view_layer.objects.active = canvas
+
+            mod = self.objects.modifiers.get(canvas)
+            if mod is not None:
+                get_viewport_modifier(mod).show_viewport = True
+
+        # Live preview wasn't drawn for the real canvases, so it can't be reused.
+        if self._canvas_proxies:
+            self._preview_state = None
+        self._canvas_proxies.clear()
+
+
+    # Idle Evaluation
+    def _list_cutting_modifiers(self) -> list:
+        """Returns Boolean modifiers (on canvases and their proxies) that cut with the cutter during the modal."""
+
+        modifiers = list(self.objects.modifiers.values())
+        modifiers += [get_viewport_modifier(mod) for mod in modifiers if get_viewport_modifier(mod) != mod]
+        for proxy in self._canvas_proxies:
+            mod = proxy.region.modifiers.get("boolean_proxy")
+            if mod is not None:
+                modifiers.append(mod)
+
+        return modifiers
+
+
+    def _create_cutter_snapshot(self, context):
+        """
+        Makes Boolean modifiers cut with the snapshot (evaluated copy) of the cutter instead of the cutter itself.
+        Editing the cutter then only updates its preview, and canvases are evaluated when the timer updates the snapshot.
+        """
+
+        cutter = self.cutter.obj
+        depsgraph = context.evaluated_depsgraph_get()
+
+        mesh = bpy.data.meshes.new_from_object(cutter.evaluated_get(depsgraph))
+        snapshot = bpy.data.objects.new("boolean_cutter_snapshot", mesh)
+        snapshot.matrix_world = cutter.matrix_world
+        snapshot.display_type = 'BOUNDS'
+        for collection in cutter.users_collection:
+            collection.objects.link(snapshot)
+        snapshot.hide_set(True)
+
+        self._snapshot = snapshot
+        self._snapshot_state = self._get_preview_state()
+        self._snapshot_time = time.perf_counter()
+
+        for mod in self._list_cutting_modifiers():
+            mod.object = snapshot
+
+        def timer():
+            # Operator can already be freed when the flag is set, so it's checked before touching it.
+            if timer.stopped:
+                return None
+            try:
+                return self._update_cutter_snapshot()
+            except ReferenceError:
+                return None
+
+        timer.stopped = False
+        self._snapshot_timer = timer
+        bpy.app.timers.register(timer, first_interval=SNAPSHOT_INTERVAL)
+
+
+    def _stop_snapshot_timer(self):
+        """Stops the timer that updates the snapshot (when the snapshot is removed, or the modal ends)."""
+
+        timer = self._snapshot_timer
+        if timer is None:
+            return
+
+        timer.stopped = True
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+        self._snapshot_timer = None
+
+
+    def _update_cutter_snapshot(self):
+        """
+        Timer that copies the current cutter into the snapshot when it changed, and the mouse was idle
+        for long enough (or enough time passed since the last update, if evaluation rate is capped).
+        """
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+
+        prefs = bpy.context.preferences.addons[base_package].preferences
+        now = time.perf_counter()
+        idle = now - self.scheduler.last_update >= prefs.idle_time / 1000
+        due = prefs.evaluation_rate > 0 and now - self._snapshot_time >= 1.0 / prefs.evaluation_rate
+        if not (idle or due):
+            return SNAPSHOT_INTERVAL
+
+        state = self._get_preview_state()
+        if state == self._snapshot_state:
+            return SNAPSHOT_INTERVAL
+
+        cutter = self.cutter.obj
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+
+        old_mesh = snapshot.data
+        snapshot.data = bpy.data.meshes.new_from_object(cutter.evaluated_get(depsgraph))
+        snapshot.matrix_world = cutter.matrix_world
+        bpy.data.meshes.remove(old_mesh)
+
+        self._snapshot_state = state
+        self._snapshot_time = now
+        self.scheduler.region.tag_redraw()
+
+        return SNAPSHOT_INTERVAL
+
+
+    def _remove_cutter_snapshot(self, context):
+        """Makes Boolean modifiers cut with the cutter again, and removes the snapshot."""
+
+        self._stop_snapshot_timer()
+        if self._snapshot is None:
+            return
+
+        for mod in self._list_cutting_modifiers():
+            mod.object = self.cutter.obj
+
+        delete_object(self._snapshot)
+        self._snapshot = None
+
+        # Canvases were last evaluated with the snapshot, the live preview can only be reused if it was up to date.
+        if self._snapshot_state != self._get_preview_state():
+            self._preview_state = None
+
 
     def confirm(self, context):
         """
@@ -608,12 +1053,22 @@ class CarverBase(bpy.types.Operator,
         """
 
         cutter = self.cutter.obj
+        self._remove_cutter_snapshot(context)
+        self._remove_canvas_proxies(context)
 
-        # Remove modifiers from selected objects that don't intersect with the cutter.
+        # Remove modifiers from selected objects that the cutter can't reach.
+        reached = self._find_reached_canvases()
         intersecting_canvases = []
+        shown_canvases = set()
         for obj, mod in self.objects.modifiers.items():
-            if are_intersecting(obj, cutter):
+            if obj in reached:
                 intersecting_canvases.append(obj)
+
+                # Last evaluation of the canvas didn't include the modifier if it was disabled during the preview.
+                mod = get_viewport_modifier(mod)
+                if not mod.show_viewport:
+                    mod.show_viewport = True
+                    shown_canvases.add(obj)
             else:
                 obj.modifiers.remove(mod)
 
@@ -621,11 +1076,6 @@ class CarverBase(bpy.types.Operator,
             self.finalize(context)
             return
 
-        # Select all faces of the cutter so that newly created faces in canvas
-        # are also selected after applying the modifier.
-        for face in self.cutter.mesh.polygons:
-            face.select = True
-
         if self.mode == 'MODIFIER':
             cutter.display_type = self.display
 
@@ -660,16 +1110,22 @@ class CarverBase(bpy.types.Operator,
             # Set Boolean properties to canvases.
             for obj in intersecting_canvases:
                 obj.booleans.canvas = True
+                enforce_boolean_limit(context, obj, pinned=self.pin)
 
             self.finalize(context, clean_up=False)
             return
 
         elif self.mode == 'DESTRUCTIVE':
+            # Reuse the result of the live preview if nothing changed since it was drawn.
+            use_evaluated = self._preview_state is not None and self._preview_state == self._get_preview_state()
+
             # Apply modifiers & delete the cutter.
             for obj, modifiers in self.objects.modifiers.items():
                 if obj in intersecting_canvases:
                     modifiers = get_modifiers_to_apply(context, obj, [modifiers])
-                    apply_modifiers(context, obj, modifiers, force_clean=True)
+                    with record_cut(context, obj, self.bl_label):
+                        apply_modifiers(context, obj, modifiers, force_clean=True,
+                                        use_evaluated=use_evaluated and obj not in shown_canvases)
 
             self.finalize(context)
             return
@@ -681,6 +1137,10 @@ class CarverBase(bpy.types.Operator,
         Regardless of whether it was confirmed or cancelled.
         """
 
+        self._stop_snapshot_timer()
+        self._remove_cutter_snapshot(context)
+        self._remove_canvas_proxies(context)
+
         # Operation was aborted, or successfully finished in the Destructive mode.
         # Delete everything created by the operator (i.e. cutter).
         if clean_up:
@@ -698,5 +1158,14 @@ class CarverBase(bpy.types.Operator,
             self.effects.array.use_pin_to_last = False
 
         bpy.types.SpaceView3D.draw_handler_remove(self._handler, 'WINDOW')
+        self.scheduler.stop(context)
         context.workspace.status_text_set(None)
-        context.window.cursor_set('DEFAULT' if context.mode == 'OBJECT' else 'CROSSHAIR')
+        if context.window is not None:
+            context.window.cursor_set('DEFAULT' if context.mode == 'OBJECT' else 'CROSSHAIR')
+
+
+    def cancel(self, context):
+        """Cleans up when Blender ends the modal on its own (i.e. when another file is opened, or the window is closed)."""
+
+        self._stop_snapshot_timer()
+        self.finalize(context, abort=True)
@@ -87,7 +87,8 @@ class CarverEvents():
             if self.origin == 'EDGE':
                 self.cutter.bm.verts.ensure_lookup_table()
                 point = self.cutter.bm.verts[0].co
-                set_object_origin(self.cutter.obj, self.cutter.bm, point='CUSTOM', custom=point)
+                set_object_origin(self.cutter.obj, self.cutter.bm, point='CUSTOM', custom=point, update_mesh=False)
+                self.update_cutter_mesh()
 
 
         # Set correct phase.
@@ -128,7 +129,8 @@ class CarverEvents():
 
                     # Offset the object location when drawing from edge to move rotation pivot to center.
                     if self.origin == 'EDGE':
-                        set_object_origin(obj, self.cutter.bm, point='CENTER_OBJ')
+                        set_object_origin(obj, self.cutter.bm, point='CENTER_OBJ', update_mesh=False)
+                        self.update_cutter_mesh()
 
                     # Calculate rotation amount.
                     rotation_total = Matrix.Rotation(self.rotation, 4, self.workplane.normal)
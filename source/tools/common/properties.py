@@ -21,6 +21,11 @@ class CarverPropsOperator():
             ('MANUAL', "Manual", "Depth can be manually set after creating a cutter shape", icon_measure, 0),
             ('AUTO', "Auto", "Depth is set automatically to cover selected objects entirely", icon_cpu, 1),
             ('CURSOR', "3D Cursor", "Depth is set to 3D cursors location", 'PIVOT_CURSOR', 2),
+            ('EXACT', "Exact", ("Depth is set to where the cutter shape leaves selected objects (found by casting rays through them).\n"
+                                "Cutter is only as deep as it needs to be to cut through, which makes the Boolean faster.\n"
+                                "NOTE: Depth is sampled (from points spread over the shape, and vertices of objects inside of its bounds),\n"
+                                "so thin features between sampled points can be missed"),
+             'MOD_SOLIDIFY', 3),
         ]
         return items
 
@@ -105,6 +110,12 @@ class CarverPropsModifier():
                  ('MANIFOLD', "Manifold", "")],
         default = 'FLOAT',
     )
+    interactive_fidelity: bpy.props.BoolProperty(
+        name = "Interactive Fidelity",
+        description = ("While setting the depth, only cut the region of heavy canvases under the cutter, with the Float solver.\n"
+                       "Whole canvases are cut with the chosen solver when the depth is confirmed"),
+        default = False,
+    )
     pin: bpy.props.BoolProperty(
         name = "Pin Boolean Modifier",
         description = ("Always make new Boolean modifiers first in the modifier stack.\n"
@@ -0,0 +1,100 @@
+import bpy
+import time
+from mathutils import Vector
+
+
+class ModalScheduler:
+    """
+    Coalesces mouse movement received by the modal operator into one update per frame,
+    and redraws only the region that operator was invoked in (and tool header when its properties change).
+    """
+
+    def __init__(self, operator, context, rate: int=60):
+        self.operator = operator
+        self.area = context.area
+        self.region = context.region
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+
+        self.mouse = None         # Latest mouse position that wasn't processed yet.
+        self.moved = False        # Whether the current event should process the mouse movement.
+        self.last_update = 0.0    # Time when mouse movement was processed last.
+        self.phase = None         # Phase that the status bar text was last set for.
+
+        # Operator properties that are displayed in the tool header.
+        self.props = [prop.identifier for prop in operator.bl_rna.properties if prop.identifier != "rna_type"]
+        self.props_state = None
+
+        # Statistics (for profiling).
+        self.processed = 0
+        self.skipped = 0
+
+        # Timer events process the last skipped mouse movement after the mouse stops.
+        self.timer = None
+        if self.interval > 0:
+            self.timer = context.window_manager.event_timer_add(self.interval, window=context.window)
+
+
+    def process(self, context, event) -> bool:
+        """
+        Returns whether the event should be processed by the modal.
+        Mouse movement is skipped until one frame has passed since the last processed one,
+        and the latest skipped position is then processed with the next timer (or any other) event.
+        """
+
+        now = time.perf_counter()
+        self.moved = False
+
+        if event.type == 'MOUSEMOVE':
+            self.mouse = Vector((event.mouse_region_x, event.mouse_region_y))
+            if now - self.last_update < self.interval:
+                self.skipped += 1
+                return False
+
+        elif event.type == 'TIMER':
+            if self.mouse is None or now - self.last_update < self.interval:
+                return False
+
+        if self.mouse is not None:
+            self.moved = True
+            self.last_update = now
+
+        self.processed += 1
+        self.redraw(context)
+
+        return True
+
+
+    def flush(self) -> Vector:
+        """Returns the mouse position that current event processes, and marks it as processed."""
+
+        mouse = self.mouse
+        self.mouse = None
+        return mouse
+
+
+    def redraw(self, context):
+        """Redraws the invoking region, tool header if operator properties changed, and the status bar if phase changed."""
+
+        self.region.tag_redraw()
+
+        props_state = tuple(getattr(self.operator, prop) for prop in self.props)
+        if props_state != self.props_state:
+            self.props_state = props_state
+            for region in self.area.regions:
+                if region.type == 'TOOL_HEADER':
+                    region.tag_redraw()
+
+        if self.operator.phase != self.phase:
+            self.phase = self.operator.phase
+            self.operator.status(context)
+
+
+    def stop(self, context):
+        """Removes the timer, and reports the numbers of events for profiling (when Blender is started with `--debug`)."""
+
+        if self.timer is not None:
+            context.window_manager.event_timer_remove(self.timer)
+            self.timer = None
+
+        if bpy.app.debug:
+            print("Carver modal events processed:", self.processed, "skipped:", self.skipped)
@@ -1,6 +1,5 @@
 import bpy
 import math
-import os
 from mathutils import Vector, Matrix
 
 from ...functions.mesh import (
@@ -64,9 +63,23 @@ class Cutter:
         self.faces: list = faces
         self.verts: list = verts
         self.center = Vector() # Center of the geometry.
+        self.synced = True     # Whether mesh has the same topology & attributes as `bmesh`.
+
+
+class CanvasProxy:
+    """Lighter stand-in that is displayed instead of a heavy canvas while the cutter depth is being set."""
+
+    def __init__(self, canvas, source):
+        self.canvas = canvas
+        self.source = source   # Evaluated mesh of the canvas before the cut.
+        self.region = None     # Object with faces of the canvas under the cutter (which are cut).
+        self.rest = None       # Object with all other faces of the canvas.
+        self.matrix = None     # Transform of the cutter that region was cropped for.
+        self.bounds = None     # Footprint (in the space of the cutter at that transform) that region contains.
+        self.selected = canvas.select_get()
+
 
 
-# Effects
 class Effects:
 
     def __init__(self):
@@ -138,9 +151,7 @@ class Effects:
 
         # Load geometry nodes modifier asset.
         if self.array is None:
-            root = os.path.abspath(os.path.join(__file__, "..", "..", ".."))
-            assets_path = os.path.join(root, "assets.blend")
-            mod = add_modifier_asset(cutter, path=assets_path, asset="cutter_array")
+            mod = add_modifier_asset(cutter, asset="cutter_array")
 
         if not mod:
             cls.report({'WARNING'}, "Array modifier cannot be loaded for cutter")
@@ -201,6 +212,8 @@ class Effects:
             for v in verts:
                 v[attr] = 1.0
 
+        cls.cutter.synced = False
+
         # Add Weld modifier (necessary for merging overlapping vertices).
         # Otherwise live cut produces corrupted booleans because of non-manifold geometry.
         self.add_weld_modifier(cls)
@@ -227,6 +240,7 @@ class Effects:
                 continue
             edge[edge_attr] = 1.0
 
+        cls.cutter.synced = False
         self.bevel.affect = 'EDGES'
 
 
@@ -238,34 +252,23 @@ class Effects:
         mesh = cls.cutter.mesh
         bm = cls.cutter.bm
 
-        modifier_asset_path = "nodes\\geometry_nodes_essentials.blend\\NodeTree\\Smooth by Angle"
-        modifier_asset_file = modifier_asset_path[:modifier_asset_path.find(".blend") + 6]
-        modifier_asset_name = modifier_asset_path.rsplit("\\", 1)[1]
-
-        # Try adding modifier with `bpy.ops` operator(s) first.
-        context_override = {
-            "object": obj,
-            "active_object": obj,
-            "selected_objects": [obj],
-            "selected_editable_objects": [obj],
-        }
-        with context.temp_override(**context_override):
-            try:
-                # Try adding the modifier with `shade_auto_smooth` operator.
-                bpy.ops.object.shade_auto_smooth()
-            except:
-                # Try adding the modifier with path to Essentials library.
-                bpy.ops.object.modifier_add_node_group(asset_library_type="ESSENTIALS",
-                                                       asset_library_identifier="",
-                                                       relative_asset_identifier=modifier_asset_path)
-
-        mod = obj.modifiers.active
-
-        # Try loading the node group manually if `bpy.ops` operators failed.
+        # Add modifier with the node group asset (loaded in only once per session).
+        mod = add_modifier_asset(obj, asset="Smooth by Angle")
+
+        # Try adding the modifier with `shade_auto_smooth` operator if asset couldn't be loaded.
         if mod is None:
-            dir = os.path.join(os.path.dirname(bpy.app.binary_path), "5.0", "datafiles", "assets")
-            assets_path = os.path.join(dir, modifier_asset_file)
-            mod = add_modifier_asset(obj, path=assets_path, asset=modifier_asset_name)
+            context_override = {
+                "object": obj,
+                "active_object": obj,
+                "selected_objects": [obj],
+                "selected_editable_objects": [obj],
+            }
+            with context.temp_override(**context_override):
+                try:
+                    bpy.ops.object.shade_auto_smooth()
+                    mod = obj.modifiers.active
+                except:
+                    pass
 
         # Resort to destructive editing if everything fails.
         if mod is None:
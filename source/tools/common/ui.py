@@ -127,6 +127,7 @@ class TOPBAR_PT_carver_cutter(bpy.types.Panel):
         # Modifier properties.
         col = layout.column()
         col.prop(props, "pin", text="Pin Modifier")
+        col.prop(props, "interactive_fidelity")
         col.separator()
 
         # Cutter object properties.
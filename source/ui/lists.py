@@ -2,6 +2,7 @@ import bpy
 
 from ..functions.modifier import (
     is_boolean_modifier,
+    is_modifier_enabled,
 )
 
 
@@ -29,13 +30,21 @@ class VIEW3D_UL_boolean_cutters(bpy.types.UIList):
         op_select.cutter = mod.object.name
 
         # Toggle Cutter
-        icon = 'HIDE_OFF' if mod.show_viewport else 'HIDE_ON'
+        icon = 'HIDE_OFF' if is_modifier_enabled(canvas, mod) else 'HIDE_ON'
         op_toggle = row.operator("object.boolean_toggle_cutter", text="", icon=icon, emboss=False)
         op_toggle.method = 'SPECIFIED'
         op_toggle.specified_cutter = mod.object.name
         op_toggle.specified_canvas = canvas.name
         op_toggle.specified_modifier = mod.name
 
+        # Solo Cutter
+        icon = 'SOLO_ON' if canvas.booleans.solo == mod.name else 'SOLO_OFF'
+        op_solo = row.operator("object.boolean_toggle_cutter", text="", icon=icon, emboss=False)
+        op_solo.method = 'SOLO'
+        op_solo.specified_cutter = mod.object.name
+        op_solo.specified_canvas = canvas.name
+        op_solo.specified_modifier = mod.name
+
 
     def filter_items(self, context, data, propname):
         flags = []
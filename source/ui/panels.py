@@ -1,9 +1,15 @@
 import bpy
 from .. import __package__ as base_package
 
+from ..functions.cache import (
+    result_cache,
+)
 from ..functions.canvas import (
     is_canvas,
 )
+from ..functions.modifier import (
+    list_misplaced_booleans,
+)
 
 from .common import (
     get_modifier_from_list_index,
@@ -125,6 +131,135 @@ class VIEW3D_PT_boolean_cutters(bpy.types.Panel):
         col.separator()
         col.menu("VIEW3D_MT_boolean_specials", icon='DOWNARROW_HLT', text="")
 
+        # Modifier Stack Warning
+        misplaced = list_misplaced_booleans(canvas)
+        if misplaced:
+            triangles = max(entry[2] for entry in misplaced)
+
+            box = layout.box()
+            col = box.column(align=True)
+            col.alert = True
+            col.label(text=f"{len(misplaced)} Boolean(s) after Subdivision/Bevel", icon='ERROR')
+            col.label(text=f"Solver input up to ~{triangles:,} triangles", icon='BLANK1')
+            row = box.row(align=True)
+            row.operator("object.boolean_analyze_stack", text="Analyze", icon='VIEWZOOM')
+            row.operator("object.boolean_reorder_stack", text="Reorder", icon='SORTSIZE')
+
+
+# Performance Panel
+class VIEW3D_PT_boolean_performance(bpy.types.Panel):
+    bl_label = "Performance"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Edit"
+    bl_context = "objectmode"
+    bl_parent_id = "VIEW3D_PT_boolean"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        prefs = context.preferences.addons[base_package].preferences
+        if not prefs.show_in_sidebar:
+            return False
+        if not context.active_object:
+            return False
+        if context.active_object.type != 'MESH':
+            return False
+        if is_canvas(context.active_object) or context.active_object.booleans.archived_mesh:
+            return True
+
+        return False
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        prefs = context.preferences.addons[base_package].preferences
+        canvas = context.active_object
+
+        # Freeze
+        if canvas.booleans.frozen:
+            layout.operator("object.boolean_thaw_canvas", icon='FREEZE', depress=True)
+        else:
+            layout.operator("object.boolean_freeze_canvas", icon='FREEZE')
+
+        # Rolling Auto-Apply
+        col = layout.column(align=True, heading="Auto Apply")
+        row = col.row(align=True)
+        row.prop(canvas.booleans, "auto_apply", text="")
+        sub = row.row(align=True)
+        sub.active = canvas.booleans.auto_apply
+        sub.prop(canvas.booleans, "auto_apply_limit")
+
+        if canvas.booleans.archived_mesh:
+            col.separator()
+            col.operator("object.boolean_restore_archive",
+                         text=f"Restore Archived ({len(canvas.booleans.archived_cutters)})", icon='LOOP_BACK')
+
+        # Checkpoints
+        col = layout.column(align=True, heading="Checkpoints")
+        row = col.row(align=True)
+        row.prop(canvas.booleans, "use_checkpoints", text="")
+        sub = row.row(align=True)
+        sub.active = canvas.booleans.use_checkpoints
+        sub.prop(canvas.booleans, "checkpoint_interval")
+
+        # Result Cache
+        if prefs.use_result_cache or canvas.booleans.use_checkpoints:
+            layout.separator()
+            col = layout.column(align=True)
+            col.label(text=f"Result Cache: {result_cache.hits} hits, {result_cache.misses} misses", icon='FILE_CACHE')
+            col.label(text=f"{len(result_cache)} results, {result_cache.size / 2**20:.1f} / {prefs.cache_size} MB",
+                      icon='BLANK1')
+            col.separator()
+            col.operator("object.boolean_clear_cache", icon='TRASH')
+
+        if prefs.use_disk_cache:
+            layout.operator("object.boolean_clear_disk_cache", icon='TRASH')
+
+
+# Cut History Panel
+class VIEW3D_PT_boolean_history(bpy.types.Panel):
+    bl_label = "Cut History"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Edit"
+    bl_context = "objectmode"
+    bl_parent_id = "VIEW3D_PT_boolean"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        prefs = context.preferences.addons[base_package].preferences
+        if not prefs.show_in_sidebar:
+            return False
+        if not context.active_object:
+            return False
+        if context.active_object.type != 'MESH':
+            return False
+        if len(context.active_object.booleans.cuts) > 0:
+            return True
+
+        return False
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.active_object
+
+        col = layout.column(align=True)
+        for i in reversed(range(len(obj.booleans.cuts))):
+            cut = obj.booleans.cuts[i]
+
+            row = col.row(align=True)
+            sub = row.row(align=True)
+            sub.active = not cut.reverted
+            sub.label(text=f"{i + 1}. {cut.name}", icon='MOD_BOOLEAN')
+            sub.label(text=f"{cut.faces:,} faces")
+            if cut.reverted:
+                row.operator("object.boolean_replay_cut", text="", icon='LOOP_FORWARDS').index = i
+            else:
+                row.operator("object.boolean_revert_cut", text="", icon='LOOP_BACK').index = i
+
 
 # Helpers Panel
 class VIEW3D_PT_boolean_helpers(bpy.types.Panel):
@@ -169,6 +304,8 @@ class VIEW3D_MT_boolean_specials(bpy.types.Menu):
 classes = (
     VIEW3D_PT_boolean,
     VIEW3D_PT_boolean_cutters,
+    VIEW3D_PT_boolean_performance,
+    VIEW3D_PT_boolean_history,
     VIEW3D_PT_boolean_helpers,
     VIEW3D_MT_boolean_specials,
 )
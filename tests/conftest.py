@@ -0,0 +1,66 @@
+"""
+Tests run in Blender's Python module (`pip install bpy`), without the user interface.
+Add-on is registered under its extension id, so that its properties and preferences are available to tests.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+try:
+    import bpy
+    import addon_utils
+except ImportError:
+    bpy = None
+    collect_ignore_glob = ["test_*.py"]
+
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "source")
+ADDON_ID = "bool_tool"
+
+
+def _enable_addon():
+    # Source directory isn't named like the add-on, so it's linked into a temporary path under its id.
+    path = tempfile.mkdtemp()
+    os.symlink(SOURCE_PATH, os.path.join(path, ADDON_ID))
+    sys.path.insert(0, path)
+
+    addon_utils.enable(ADDON_ID, default_set=True, handle_error=None)
+
+
+if bpy is not None and ADDON_ID not in bpy.context.preferences.addons:
+    _enable_addon()
+
+
+@pytest.fixture
+def scene():
+    """Empties the file before each test, and returns its scene."""
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    return bpy.context.scene
+
+
+@pytest.fixture
+def add_cube(scene):
+    """Returns the function that adds a cube object (with its own mesh) into the scene."""
+
+    import bmesh
+
+    def add(name, size=1.0, location=(0, 0, 0)):
+        mesh = bpy.data.meshes.new(name)
+        bm = bmesh.new()
+        bmesh.ops.create_cube(bm, size=size)
+        bm.to_mesh(mesh)
+        bm.free()
+
+        obj = bpy.data.objects.new(name, mesh)
+        obj.location = location
+        scene.collection.objects.link(obj)
+
+        # World matrix is only updated by the depsgraph.
+        bpy.context.view_layer.update()
+        return obj
+
+    return add
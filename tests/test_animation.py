@@ -0,0 +1,147 @@
+import bpy
+import pytest
+
+from bool_tool.functions.animation import (
+    is_static_stack,
+)
+
+
+def add_boolean(canvas, cutter):
+    mod = canvas.modifiers.new("boolean_" + cutter.name, 'BOOLEAN')
+    mod.object = cutter
+    return mod
+
+
+def animate(id_data, data_path, index=-1):
+    id_data.keyframe_insert(data_path, index=index, frame=1)
+    id_data.keyframe_insert(data_path, index=index, frame=10)
+
+
+def test_unanimated_stack_is_static(add_cube):
+    canvas = add_cube("Canvas")
+    add_boolean(canvas, add_cube("Cutter", size=0.5))
+
+    assert is_static_stack(canvas)
+
+
+def test_moving_canvas_with_parented_cutter_is_static(add_cube):
+    canvas = add_cube("Canvas")
+    cutter = add_cube("Cutter", size=0.5)
+    cutter.parent = canvas
+    add_boolean(canvas, cutter)
+    animate(canvas, "location")
+
+    assert is_static_stack(canvas)
+
+
+def test_moving_cutter_is_not_static(add_cube):
+    canvas = add_cube("Canvas")
+    cutter = add_cube("Cutter", size=0.5)
+    add_boolean(canvas, cutter)
+    animate(cutter, "location")
+
+    assert not is_static_stack(canvas)
+
+
+def test_animated_modifier_is_not_static(add_cube):
+    canvas = add_cube("Canvas")
+    mod = add_boolean(canvas, add_cube("Cutter", size=0.5))
+    mod.double_threshold = 0.0
+    canvas.keyframe_insert('modifiers["%s"].double_threshold' % mod.name, frame=1)
+
+    assert not is_static_stack(canvas)
+
+
+def test_armature_with_animated_pose_is_not_static(scene, add_cube):
+    canvas = add_cube("Canvas")
+    add_boolean(canvas, add_cube("Cutter", size=0.5))
+
+    armature = bpy.data.objects.new("Armature", bpy.data.armatures.new("Armature"))
+    scene.collection.objects.link(armature)
+    bpy.context.view_layer.objects.active = armature
+    bpy.ops.object.mode_set(mode='EDIT')
+    armature.data.edit_bones.new("Bone").tail = (0, 0, 1)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    mod = canvas.modifiers.new("Armature", 'ARMATURE')
+    mod.object = armature
+    assert is_static_stack(canvas)
+
+    armature.pose.bones["Bone"].keyframe_insert("location", frame=1)
+    assert not is_static_stack(canvas)
+
+
+def test_displace_with_texture_is_not_static(add_cube):
+    canvas = add_cube("Canvas")
+    add_boolean(canvas, add_cube("Cutter", size=0.5))
+
+    mod = canvas.modifiers.new("Displace", 'DISPLACE')
+    assert is_static_stack(canvas)
+
+    mod.texture = bpy.data.textures.new("Noise", 'CLOUDS')
+    assert not is_static_stack(canvas)
+
+
+def test_geometry_nodes_with_object_input_is_not_static(add_cube):
+    canvas = add_cube("Canvas")
+    add_boolean(canvas, add_cube("Cutter", size=0.5))
+
+    node_group = bpy.data.node_groups.new("Nodes", 'GeometryNodeTree')
+    node_group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    node_group.links.new(node_group.nodes.new('NodeGroupInput').outputs[0],
+                         node_group.nodes.new('NodeGroupOutput').inputs[0])
+
+    mod = canvas.modifiers.new("Nodes", 'NODES')
+    mod.node_group = node_group
+    assert is_static_stack(canvas)
+
+    node_group.interface.new_socket("Object", in_out='INPUT', socket_type='NodeSocketObject')
+    assert not is_static_stack(canvas)
+
+
+def test_geometry_nodes_with_object_info_is_not_static(add_cube):
+    canvas = add_cube("Canvas")
+
+    node_group = bpy.data.node_groups.new("Nodes", 'GeometryNodeTree')
+    node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    node_group.nodes.new('GeometryNodeObjectInfo')
+
+    mod = canvas.modifiers.new("Nodes", 'NODES')
+    mod.node_group = node_group
+
+    assert not is_static_stack(canvas)
+
+
+@pytest.fixture
+def animation_cache(scene):
+    """Enables reusing results during animation (and rendering) for the test."""
+
+    from bool_tool import handlers
+
+    prefs = bpy.context.preferences.addons["bool_tool"].preferences
+    prefs.use_animation_cache = True
+    yield handlers
+
+    prefs.use_animation_cache = False
+    handlers._rendering = False
+    handlers._render_modifiers.clear()
+
+
+@pytest.mark.parametrize("lock_interface", [False, True])
+def test_static_results_are_only_rendered_with_locked_interface(add_cube, animation_cache, lock_interface):
+    canvas = add_cube("Canvas")
+    add_boolean(canvas, add_cube("Cutter", size=0.5, location=(0.5, 0, 0)))
+    canvas.booleans.canvas = True
+
+    scene = bpy.context.scene
+    scene.render.use_lock_interface = lock_interface
+    animation_cache.start_rendering(scene)
+    animation_cache.reuse_static_results(scene)
+
+    # Nothing is changed while the render thread may be reading data.
+    assert bool(canvas.booleans.result_key) == lock_interface
+    assert ("Canvas" in animation_cache._render_modifiers) == lock_interface
+
+    animation_cache.stop_rendering(scene)
+    assert not animation_cache._render_modifiers
@@ -0,0 +1,33 @@
+import os
+
+import bpy
+import pytest
+
+from bool_tool.constants import NODE_GROUP_ASSETS
+from bool_tool.functions import asset
+
+
+@pytest.fixture
+def assets(scene):
+    """Forgets assets that couldn't be loaded by previous tests."""
+
+    asset._missing_assets.clear()
+    yield
+    asset._missing_assets.clear()
+
+
+@pytest.mark.parametrize("name", list(NODE_GROUP_ASSETS))
+def test_asset_path_exists(name):
+    assert os.path.isfile(asset.get_asset_path(name))
+
+
+def test_smooth_by_angle_is_loaded(assets):
+    node_group = asset.get_node_group("Smooth by Angle")
+
+    assert node_group is not None
+    assert node_group.name == "Smooth by Angle"
+    assert node_group.bl_idname == 'GeometryNodeTree'
+
+    # Node group that's already in the file is reused.
+    assert asset.get_node_group("Smooth by Angle") == node_group
+    assert len([group for group in bpy.data.node_groups if group.name == "Smooth by Angle"]) == 1
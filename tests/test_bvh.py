@@ -0,0 +1,59 @@
+import bpy
+import pytest
+from mathutils import Vector
+
+from bool_tool.functions.bvh import (
+    forget_bvh_trees,
+    get_bvh_tree,
+    raycast_objects,
+)
+
+
+def test_raycast_matches_scene_raycast(scene, add_cube):
+    near = add_cube("Near", location=(0, 0, 2))
+    near.rotation_euler = (0.3, 0.2, 0.1)
+    near.scale = (2.0, 1.0, 0.5)
+    far = add_cube("Far", location=(0, 0, -2))
+    bpy.context.view_layer.update()
+
+    depsgraph = bpy.context.view_layer.depsgraph
+    origin, direction = Vector((0.1, 0.1, 10)), Vector((0, 0, -1))
+    hit, location, normal, __, obj, __ = raycast_objects([far, near], depsgraph, origin, direction)
+    expected = scene.ray_cast(depsgraph, origin, direction)
+
+    assert hit and obj == near == expected[4]
+    assert tuple(location) == pytest.approx(tuple(expected[1]), abs=1e-5)
+    assert tuple(normal) == pytest.approx(tuple(expected[2]), abs=1e-5)
+
+
+def test_raycast_skips_hidden_objects(add_cube):
+    near = add_cube("Near", location=(0, 0, 2))
+    far = add_cube("Far", location=(0, 0, -2))
+    near.hide_set(True)
+
+    depsgraph = bpy.context.view_layer.depsgraph
+    hit, __, __, __, obj, __ = raycast_objects([near, far], depsgraph, Vector((0, 0, 10)), Vector((0, 0, -1)))
+
+    assert hit and obj == far
+    assert near.hide_get()
+
+
+def test_bvh_tree_is_cached_until_geometry_changes(add_cube):
+    cube = add_cube("Cube")
+    depsgraph = bpy.context.view_layer.depsgraph
+    tree = get_bvh_tree(cube, depsgraph)
+    assert get_bvh_tree(cube, depsgraph) is tree
+
+    forget_bvh_trees([cube])
+    tree = get_bvh_tree(cube, depsgraph)
+    assert get_bvh_tree(cube, depsgraph) is tree
+
+    # Tree is forgotten by the depsgraph handler when geometry of the object is updated.
+    for v in cube.data.vertices:
+        v.co.z += 5.0
+    cube.data.update()
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    assert get_bvh_tree(cube, depsgraph) is not tree
+
+    location, __, __, __ = get_bvh_tree(cube, depsgraph).ray_cast(Vector((0, 0, 10)), Vector((0, 0, -1)))
+    assert location.z == pytest.approx(5.5)
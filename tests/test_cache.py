@@ -0,0 +1,283 @@
+import os
+
+import bpy
+import pytest
+
+from bool_tool.functions.cache import (
+    MeshArrays,
+    clear_disk_cache,
+    fingerprint_applied,
+    fingerprint_canvas,
+    fingerprint_stack,
+    get_disk_cache_folder,
+    forget_cached_canvases,
+    forget_mesh_fingerprints,
+    is_storable_mesh,
+    list_cached_canvases,
+    list_checkpoints,
+    restore_canvas_result,
+    result_cache,
+    store_canvas_checkpoints,
+    store_disk_results,
+    trim_disk_cache,
+)
+
+
+def test_mesh_arrays_store_custom_normals(add_cube):
+    cube = add_cube("Cube")
+    mesh = cube.data
+    mesh.normals_split_custom_set([(0.0, 0.0, 1.0)] * len(mesh.loops))
+    attr = mesh.attributes.get("custom_normal")
+    if attr is None:
+        pytest.skip("Custom normals aren't stored as an attribute in this Blender version")
+
+    arrays = MeshArrays(mesh)
+    assert "custom_normal" in [name for name, __, __, __ in arrays.attributes]
+
+    copy = bpy.data.meshes.new("Copy")
+    arrays.to_mesh(copy)
+    assert copy.attributes["custom_normal"].data_type == attr.data_type
+    assert [tuple(loop.normal) for loop in copy.loops] == pytest.approx([tuple(loop.normal) for loop in mesh.loops])
+
+
+def test_meshes_with_string_attributes_are_not_stored(add_cube):
+    cube = add_cube("Cube")
+    cube.data.attributes.new("label", 'STRING', 'POINT')
+
+    assert not is_storable_mesh(cube.data)
+    with pytest.raises(ValueError):
+        MeshArrays(cube.data)
+
+
+def test_mesh_fingerprint_is_read_again_once_forgotten(add_cube):
+    cube = add_cube("Cube")
+    mod = cube.modifiers.new("Boolean", 'BOOLEAN')
+    mod.object = add_cube("Cutter", location=(0.5, 0, 0))
+    before = fingerprint_canvas(cube)
+    assert before
+
+    cube.data.vertices[0].co.x += 1.0
+    assert fingerprint_canvas(cube) == before
+
+    forget_mesh_fingerprints([cube.data])
+    assert fingerprint_canvas(cube) != before
+
+
+@pytest.fixture
+def canvas(add_cube):
+    """Canvas with two Boolean modifiers."""
+
+    canvas = add_cube("Canvas")
+    for name, location in (("First", (0.5, 0, 0)), ("Second", (0, 0.5, 0))):
+        mod = canvas.modifiers.new(name, 'BOOLEAN')
+        mod.object = add_cube(name, size=0.5, location=location)
+
+    return canvas
+
+
+def test_fingerprint_ignores_moving_canvas_with_cutters(canvas):
+    before = fingerprint_canvas(canvas)
+
+    for obj in (canvas, canvas.modifiers["First"].object, canvas.modifiers["Second"].object):
+        obj.location.z += 2.0
+    bpy.context.view_layer.update()
+
+    assert fingerprint_canvas(canvas) == before
+
+
+def test_fingerprint_changes_with_cutter_transform(canvas):
+    before = fingerprint_canvas(canvas)
+
+    canvas.modifiers["Second"].object.location.x += 0.1
+    bpy.context.view_layer.update()
+
+    assert fingerprint_canvas(canvas) != before
+
+
+def test_fingerprint_stack_is_chained(canvas):
+    before = fingerprint_stack(canvas)
+
+    canvas.modifiers["Second"].operation = 'UNION'
+    after = fingerprint_stack(canvas)
+
+    assert [mod.name for mod, __ in after] == ["First", "Second"]
+    assert after[0][1] == before[0][1]
+    assert after[1][1] != before[1][1]
+
+
+def test_fingerprint_skips_disabled_modifiers(canvas):
+    canvas.modifiers["Second"].show_viewport = False
+
+    assert [mod.name for mod, __ in fingerprint_stack(canvas)] == ["First"]
+
+
+def test_fingerprint_applied(canvas):
+    first, second = canvas.modifiers
+    stack = fingerprint_stack(canvas)
+
+    assert fingerprint_applied(canvas, [first]) == stack[0][1]
+    assert fingerprint_applied(canvas, [first, second]) == stack[1][1]
+
+    # Modifiers that aren't at the top of the stack can't be applied on their own.
+    assert fingerprint_applied(canvas, [second]) == ""
+
+
+def test_mesh_arrays_store_hidden_elements(add_cube):
+    cube = add_cube("Cube")
+    cube.data.polygons[0].hide = True
+
+    copy = bpy.data.meshes.new("Copy")
+    MeshArrays(cube.data).to_mesh(copy)
+
+    assert [face.hide for face in copy.polygons] == [face.hide for face in cube.data.polygons]
+
+
+def test_meshes_with_deform_data_are_not_stored(add_cube):
+    cube = add_cube("Cube")
+    assert is_storable_mesh(cube.data, cube)
+
+    cube.vertex_groups.new(name="Group")
+    assert not is_storable_mesh(cube.data, cube)
+
+    other = add_cube("Other")
+    other.shape_key_add(name="Basis")
+    assert not is_storable_mesh(other.data, other)
+
+
+def _auto_difference(add_cube, token, vertex_group=False):
+    """Adds canvas & cutter (same ones on every call) and runs Auto Boolean on them, as an execution with redo token."""
+
+    for name in ("Canvas", "Cutter"):
+        if name in bpy.data.objects:
+            bpy.data.objects.remove(bpy.data.objects[name])
+    canvas = add_cube("Canvas")
+    cutter = add_cube("Cutter", size=0.5, location=(0.5, 0.5, 0.5))
+    if vertex_group:
+        canvas.vertex_groups.new(name="Group").add(range(len(canvas.data.vertices)), 1.0, 'REPLACE')
+
+    canvas.select_set(True)
+    cutter.select_set(True)
+    bpy.context.view_layer.objects.active = canvas
+    bpy.ops.object.boolean_auto_difference(redo_token=token)
+    return canvas
+
+
+@pytest.mark.parametrize("vertex_group", [False, True])
+def test_redo_writes_the_same_mesh(add_cube, vertex_group):
+    from bool_tool.operators.boolean import BooleanBase
+
+    token = "redo"
+    BooleanBase._redo_cache.clear()
+    BooleanBase._redo_cache["token"] = token
+
+    first = _auto_difference(add_cube, token, vertex_group)
+    weights = sorted((v.index, [g.weight for g in v.groups]) for v in first.data.vertices)
+    stored = any(key[0] == "result" for key in BooleanBase._redo_cache if isinstance(key, tuple))
+    assert stored != vertex_group
+
+    # Redo (with the same input) writes the stored mesh, if there is one.
+    second = _auto_difference(add_cube, token, vertex_group)
+    assert len(second.data.vertices) == len(weights)
+    assert sorted((v.index, [g.weight for g in v.groups]) for v in second.data.vertices) == weights
+
+
+def test_only_tracked_canvases_are_listed(scene, canvas, add_cube):
+    forget_cached_canvases()
+    assert list_cached_canvases(scene) == []
+
+    canvas.booleans.use_checkpoints = True
+    assert list_cached_canvases(scene) == [canvas]
+
+    # Objects aren't searched again on every call...
+    other = add_cube("Other")
+    other.booleans.result_key = "key"
+    assert list_cached_canvases(scene) == [canvas]
+
+    # ...only once tracked canvas is renamed (or undo forgets them).
+    canvas.name = "Renamed"
+    assert set(list_cached_canvases(scene)) == {canvas, other}
+
+    canvas.booleans.use_checkpoints = False
+    other.booleans.result_key = ""
+    assert list_cached_canvases(scene) == []
+
+
+def test_checkpoints_resume_evaluation_from_changed_cutter(add_cube):
+    canvas = add_cube("Canvas")
+    corners = [(0.5, 0.5, 0.5), (-0.5, 0.5, 0.5), (0.5, -0.5, 0.5), (-0.5, -0.5, 0.5)]
+    for i, location in enumerate(corners):
+        mod = canvas.modifiers.new(f"Boolean {i}", 'BOOLEAN')
+        mod.object = add_cube(f"Cutter {i}", size=0.5, location=location)
+
+    result_cache.clear()
+    canvas.booleans.checkpoint_interval = 2
+    canvas.booleans.use_checkpoints = True
+    store_canvas_checkpoints(bpy.context, canvas)
+
+    stack = fingerprint_stack(canvas)
+    assert list_checkpoints(canvas, stack) == [1, 3]
+    assert stack[1][1] in result_cache and stack[3][1] in result_cache
+
+    # Moving the last cutter only invalidates the last checkpoint.
+    canvas.modifiers["Boolean 3"].object.location.z -= 0.1
+    bpy.context.view_layer.update()
+    assert restore_canvas_result(bpy.context, canvas)
+    assert canvas.booleans.result_key == stack[1][1]
+
+    # Result is the same as when the whole stack is evaluated.
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    resumed = len(canvas.evaluated_get(depsgraph).data.vertices)
+    canvas.booleans.use_checkpoints = False
+    assert not canvas.booleans.result_key
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    assert len(canvas.evaluated_get(depsgraph).data.vertices) == resumed
+    result_cache.clear()
+
+
+@pytest.fixture
+def disk_cache(canvas, tmp_path):
+    """Saves the file with the canvas into the temporary folder, with the disk cache enabled."""
+
+    prefs = bpy.context.preferences.addons["bool_tool"].preferences
+    prefs.use_disk_cache = True
+    canvas.booleans.canvas = True
+    bpy.ops.wm.save_as_mainfile(filepath=str(tmp_path / "cache.blend"))
+    yield get_disk_cache_folder()
+
+    prefs.use_disk_cache = False
+
+
+def test_disk_cache_is_written_on_save(disk_cache):
+    canvas = bpy.data.objects["Canvas"]
+
+    assert disk_cache == os.path.join(os.path.dirname(bpy.data.filepath), "cache_boolean_cache")
+    assert os.listdir(disk_cache) == [fingerprint_canvas(canvas)]
+
+
+def test_disk_cache_is_displayed_on_load(disk_cache):
+    bpy.ops.wm.open_mainfile(filepath=bpy.data.filepath)
+    canvas = bpy.data.objects["Canvas"]
+
+    assert canvas.booleans.result_key == fingerprint_canvas(canvas)
+    assert not any(mod.show_viewport for mod in canvas.modifiers if mod.type == 'BOOLEAN')
+
+    # Changing the cutter invalidates the displayed result.
+    canvas.modifiers["First"].object.location.x += 0.1
+    bpy.context.view_layer.update()
+    assert not canvas.booleans.result_key
+
+
+def test_disk_cache_is_trimmed_and_cleared(disk_cache):
+    canvas = bpy.data.objects["Canvas"]
+    canvas.modifiers["Second"].operation = 'UNION'
+    store_disk_results(bpy.context, [canvas])
+    assert len(os.listdir(disk_cache)) == 2
+
+    # Least recently used entries are removed first.
+    old, new = sorted(os.scandir(disk_cache), key=lambda entry: entry.stat().st_mtime)
+    os.utime(old.path, (0, 0))
+    trim_disk_cache(disk_cache, os.path.getsize(os.path.join(new.path, "positions.npy")) * 10)
+    assert os.listdir(disk_cache) == [new.name]
+
+    assert clear_disk_cache() > 0
+    assert not os.path.exists(disk_cache)
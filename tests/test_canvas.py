@@ -0,0 +1,119 @@
+import bpy
+import pytest
+
+from bool_tool.functions.cache import (
+    freeze_canvas,
+    thaw_canvas,
+)
+from bool_tool.functions.canvas import (
+    archive_boolean_modifiers,
+    restore_archived_modifiers,
+)
+
+
+@pytest.fixture
+def canvas(add_cube):
+    """Canvas with Boolean modifiers between other modifiers: Bevel, First, Weld, Second, Third."""
+
+    canvas = add_cube("Canvas")
+    canvas.booleans.canvas = True
+    canvas.modifiers.new("Bevel", 'BEVEL')
+    for name, location in (("First", (0.5, 0, 0)), ("Second", (0, 0.5, 0)), ("Third", (0, 0, 0.5))):
+        cutter = add_cube(name, size=0.5, location=location)
+        cutter.booleans.cutter = 'DIFFERENCE'
+        mod = canvas.modifiers.new(name, 'BOOLEAN')
+        mod.object = cutter
+        if name == "First":
+            canvas.modifiers.new("Weld", 'WELD')
+
+    return canvas
+
+
+@pytest.fixture
+def fidelity():
+    """Enables viewport fidelity for the test."""
+
+    prefs = bpy.context.preferences.addons["bool_tool"].preferences
+    prefs.use_viewport_fidelity = True
+    yield
+    prefs.use_viewport_fidelity = False
+
+
+def test_restored_modifiers_keep_their_positions(canvas):
+    canvas.modifiers["Second"].use_self = True
+    order = [mod.name for mod in canvas.modifiers]
+
+    archive_boolean_modifiers(bpy.context, canvas, [canvas.modifiers["First"]])
+    archive_boolean_modifiers(bpy.context, canvas, [canvas.modifiers["Second"]])
+    assert [mod.name for mod in canvas.modifiers] == ["Bevel", "Weld", "Third"]
+
+    restore_archived_modifiers(bpy.context, canvas)
+
+    assert [mod.name for mod in canvas.modifiers] == order
+    assert canvas.modifiers["Second"].use_self
+    assert len(canvas.booleans.archived_cutters) == 0
+
+
+def test_modifiers_archived_together_keep_their_positions(canvas):
+    order = [mod.name for mod in canvas.modifiers]
+
+    archive_boolean_modifiers(bpy.context, canvas, [canvas.modifiers["First"], canvas.modifiers["Third"]])
+    restore_archived_modifiers(bpy.context, canvas)
+
+    assert [mod.name for mod in canvas.modifiers] == order
+
+
+def test_restored_modifiers_get_viewport_copies(fidelity, canvas):
+    prefs = bpy.context.preferences.addons["bool_tool"].preferences
+    prefs.viewport_solver = 'FLOAT'
+    canvas.modifiers["First"].solver = 'EXACT'
+
+    archive_boolean_modifiers(bpy.context, canvas, [canvas.modifiers["First"]])
+    assert "First.viewport" not in canvas.modifiers
+
+    restore_archived_modifiers(bpy.context, canvas)
+
+    names = [mod.name for mod in canvas.modifiers]
+    assert names[:4] == ["Bevel", "First", "First.viewport", "Weld"]
+    assert canvas.modifiers["First"].solver == 'EXACT'
+
+
+def test_frozen_canvas_ignores_changes_until_thawed(canvas):
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    vertices = len(canvas.evaluated_get(depsgraph).data.vertices)
+
+    assert freeze_canvas(bpy.context, canvas)
+    assert canvas.booleans.frozen and canvas.booleans.result_key
+    assert not any(mod.show_viewport for mod in canvas.modifiers if mod.type == 'BOOLEAN')
+
+    # Moving the cutter doesn't replace the displayed result.
+    key = canvas.booleans.result_key
+    canvas.modifiers["First"].object.location.x += 0.1
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    assert canvas.booleans.result_key == key
+    assert len(canvas.evaluated_get(depsgraph).data.vertices) == vertices
+
+    thaw_canvas(canvas)
+    assert not canvas.booleans.frozen and not canvas.booleans.result_key
+    assert all(mod.show_viewport for mod in canvas.modifiers)
+
+
+def test_canvas_with_vertex_groups_is_not_frozen(canvas):
+    canvas.vertex_groups.new(name="Group")
+
+    assert not freeze_canvas(bpy.context, canvas)
+    assert not canvas.booleans.frozen and not canvas.booleans.result_key
+
+
+def test_toggle_all_skips_frozen_canvases(canvas):
+    canvas.select_set(True)
+    bpy.context.view_layer.objects.active = canvas
+    freeze_canvas(bpy.context, canvas)
+
+    assert bpy.ops.object.boolean_toggle_all() == {'CANCELLED'}
+    assert canvas.booleans.frozen
+
+    # Including frozen canvases thaws them.
+    assert bpy.ops.object.boolean_toggle_all(include_frozen=True) == {'FINISHED'}
+    assert not canvas.booleans.frozen
+    assert not any(mod.show_viewport for mod in canvas.modifiers if mod.type == 'BOOLEAN')
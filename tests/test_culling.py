@@ -0,0 +1,90 @@
+import math
+from types import SimpleNamespace
+
+from mathutils import Matrix
+
+from bool_tool.functions.culling import (
+    cull_boolean_modifiers,
+    list_visible_objects,
+)
+
+
+def _orthographic_view(size=10.0, pixels=1000):
+    """View that sees `size` units around the origin (along X & Y) in the region of `pixels` pixels."""
+
+    region = SimpleNamespace(width=pixels, height=pixels)
+    rv3d = SimpleNamespace(perspective_matrix=Matrix.Diagonal((2 / size, 2 / size, 2 / size, 1)))
+    return region, rv3d
+
+
+def _perspective_view(pixels=1000):
+    """View looking down -Z from (0, 0, 10) with 90 degree field of view."""
+
+    near, far = 0.1, 100.0
+    projection = Matrix(((1, 0, 0, 0),
+                         (0, 1, 0, 0),
+                         (0, 0, (far + near) / (near - far), 2 * far * near / (near - far)),
+                         (0, 0, -1, 0)))
+    view = Matrix.Translation((0, 0, -10))
+
+    region = SimpleNamespace(width=pixels, height=pixels)
+    rv3d = SimpleNamespace(perspective_matrix=projection @ view)
+    return region, rv3d
+
+
+def test_objects_outside_of_view_are_culled(add_cube):
+    inside = add_cube("Inside")
+    outside = add_cube("Outside", location=(20, 0, 0))
+    crossing = add_cube("Crossing", size=4.0, location=(5, 0, 0))
+
+    visible = list_visible_objects([inside, outside, crossing], [_orthographic_view()], 0)
+
+    assert visible == {inside, crossing}
+
+
+def test_small_objects_are_culled(add_cube):
+    small = add_cube("Small", size=0.05)
+    big = add_cube("Big", size=1.0)
+
+    # Orthographic view shows 100 pixels per unit.
+    assert list_visible_objects([small, big], [_orthographic_view()], 10) == {big}
+    assert list_visible_objects([small, big], [_orthographic_view()], 4) == {small, big}
+
+
+def test_perspective_projection(add_cube):
+    ahead = add_cube("Ahead")
+    behind = add_cube("Behind", location=(0, 0, 20))
+    far_aside = add_cube("Aside", location=(30, 0, 0))
+    around_camera = add_cube("Around", size=4.0, location=(0, 0, 10))
+
+    visible = list_visible_objects([ahead, behind, far_aside, around_camera], [_perspective_view()], 4)
+
+    assert visible == {ahead, around_camera}
+
+
+def test_any_view_makes_object_visible(add_cube):
+    cube = add_cube("Cube", location=(20, 0, 0))
+    views = [_orthographic_view(), _orthographic_view(size=100.0)]
+
+    assert list_visible_objects([cube], views, 0) == {cube}
+    assert list_visible_objects([cube], [], 0) == {cube}
+
+
+def test_intersect_modifiers_are_never_culled(add_cube):
+    canvas = add_cube("Canvas")
+    cutter = add_cube("Cutter", location=(50, 0, 0))
+    difference = canvas.modifiers.new("Difference", 'BOOLEAN')
+    difference.object = cutter
+    intersect = canvas.modifiers.new("Intersect", 'BOOLEAN')
+    intersect.operation = 'INTERSECT'
+    intersect.object = cutter
+
+    assert cull_boolean_modifiers([canvas], [_orthographic_view()], 0)
+    assert not difference.show_viewport
+    assert intersect.show_viewport
+
+    # Modifiers whose operation changed to Intersect while they were culled are shown again.
+    difference.operation = 'INTERSECT'
+    assert cull_boolean_modifiers([canvas], [_orthographic_view()], 0)
+    assert difference.show_viewport
+    assert len(canvas.booleans.suspended_modifiers) == 0
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import bmesh
+import bpy
+import pytest
+from mathutils import Matrix, Vector
+
+from bool_tool.functions.mesh import get_vertices_in_bounds
+from bool_tool.tools.common.base import CarverBase
+from bool_tool.tools.common.types import Cutter, Selection, Workplane
+
+
+def add_box(scene, name, min_co, max_co):
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=1.0)
+    for v in bm.verts:
+        v.co = Vector([lo + (hi - lo) * (c + 0.5) for c, lo, hi in zip(v.co, min_co, max_co)])
+    bm.to_mesh(mesh)
+    bm.free()
+
+    obj = bpy.data.objects.new(name, mesh)
+    scene.collection.objects.link(obj)
+    return obj
+
+
+def exact_depth(scene, objects):
+    """Calculates the exact depth of the 1x1 square cutter at Z=1, drawn on the XY workplane."""
+
+    mesh = bpy.data.meshes.new("Cutter")
+    mesh.from_pydata([(-0.5, -0.5, 0), (0.5, -0.5, 0), (0.5, 0.5, 0), (-0.5, 0.5, 0)], [], [(0, 1, 2, 3)])
+    cutter = bpy.data.objects.new("Cutter", mesh)
+    cutter.location.z = 1.0
+    scene.collection.objects.link(cutter)
+    bpy.context.view_layer.update()
+
+    operator = SimpleNamespace(
+        cutter=Cutter(cutter, mesh, None, [], []),
+        workplane=Workplane(Matrix.Translation((0, 0, 1)), Vector((0, 0, 1)), Vector((0, 0, 1))),
+        objects=Selection(objects, objects[0]),
+    )
+    return CarverBase._calculate_exact_depth(operator, bpy.context)
+
+
+def test_vertices_in_bounds(add_cube):
+    cube = add_cube("Cube")
+
+    vertices = get_vertices_in_bounds(cube.data, Matrix.Translation((0.5, 0.5, 0)), (0.0, 0.0), (2.0, 2.0))
+    assert len(vertices) == 8
+
+    vertices = get_vertices_in_bounds(cube.data, Matrix.Translation((1.0, 1.0, 0)), (0.0, 0.0), (1.0, 1.0))
+    assert sorted(tuple(v) for v in vertices) == [(0.5, 0.5, -0.5), (0.5, 0.5, 0.5)]
+
+
+def test_exact_depth_is_where_cutter_leaves_objects(scene):
+    plate = add_box(scene, "Plate", (-1, -1, 0.25), (1, 1, 0.75))
+
+    assert exact_depth(scene, [plate]) == pytest.approx(0.75)
+
+
+def test_exact_depth_covers_features_between_rays(scene):
+    plate = add_box(scene, "Plate", (-1, -1, 0.25), (1, 1, 0.75))
+    # Thin spike between the points that rays are cast from.
+    spike = add_box(scene, "Spike", (0.01, 0.01, -2.0), (0.02, 0.02, 0.5))
+
+    assert exact_depth(scene, [plate, spike]) == pytest.approx(3.0)
+
+
+def test_exact_depth_of_shape_that_misses_objects(scene):
+    box = add_box(scene, "Box", (3, 3, 0), (4, 4, 1))
+
+    assert exact_depth(scene, [box]) is None
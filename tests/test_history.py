@@ -0,0 +1,133 @@
+import bpy
+import bmesh
+import numpy as np
+import pytest
+
+from bool_tool.functions.history import (
+    decode_faces,
+    encode_faces,
+    face_keys,
+    read_faces,
+    record_cut,
+    revert_cut,
+    replay_cut,
+)
+
+
+@pytest.fixture
+def history(scene):
+    """Enables the cut history for the test."""
+
+    prefs = bpy.context.preferences.addons["bool_tool"].preferences
+    prefs.use_cut_history = True
+    yield
+    prefs.use_cut_history = False
+
+
+def _cut_corner(mesh):
+    """Bisects the mesh, which changes faces on one side of the plane (like a destructive cut would)."""
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    geom = bm.verts[:] + bm.edges[:] + bm.faces[:]
+    bmesh.ops.bisect_plane(bm, geom=geom, plane_co=(0.25, 0, 0), plane_no=(1, 0, 0))
+    bm.to_mesh(mesh)
+    bm.free()
+
+
+def _add_uvs(mesh):
+    layer = mesh.uv_layers.new(name="UVMap")
+    uvs = np.arange(len(mesh.loops) * 2, dtype=np.float32) / (len(mesh.loops) * 2)
+    layer.data.foreach_set("uv", uvs)
+
+
+def test_face_keys_ignore_vertex_order(add_cube):
+    cube = add_cube("Cube")
+    keys = face_keys(read_faces(cube.data))
+
+    bm = bmesh.new()
+    bm.from_mesh(cube.data)
+    bm.verts.sort(key=lambda vert: -vert.index)
+    bm.to_mesh(cube.data)
+    bm.free()
+
+    assert len(np.unique(keys)) == len(keys)
+    assert set(face_keys(read_faces(cube.data))) == set(keys)
+
+
+def test_faces_survive_encoding(add_cube):
+    cube = add_cube("Cube")
+    _add_uvs(cube.data)
+    cube.data.polygons[0].use_smooth = True
+
+    faces = read_faces(cube.data)
+    decoded = decode_faces(encode_faces(faces))
+
+    assert np.array_equal(face_keys(decoded), face_keys(faces))
+    assert np.array_equal(decoded["sharp_face"], faces["sharp_face"])
+    assert np.allclose(decoded["uv_maps"]["UVMap"], faces["uv_maps"]["UVMap"])
+
+
+def test_revert_restores_uvs_and_shading(history, add_cube):
+    cube = add_cube("Cube")
+    _add_uvs(cube.data)
+    cube.data.polygons[0].use_smooth = True
+    before = read_faces(cube.data)
+
+    with record_cut(bpy.context, cube, "Cut"):
+        _cut_corner(cube.data)
+    assert len(cube.booleans.cuts) == 1
+
+    assert revert_cut(cube, cube.booleans.cuts[0]) == 0
+    after = read_faces(cube.data)
+    order_before = np.argsort(face_keys(before))
+    order_after = np.argsort(face_keys(after))
+
+    assert np.array_equal(face_keys(before)[order_before], face_keys(after)[order_after])
+    assert np.array_equal(before["sharp_face"][order_before], after["sharp_face"][order_after])
+    assert len(cube.data.vertices) == 8
+
+    uvs_before = np.split(before["uv_maps"]["UVMap"], np.cumsum(before["loop_totals"])[:-1])
+    uvs_after = np.split(after["uv_maps"]["UVMap"], np.cumsum(after["loop_totals"])[:-1])
+    for a, b in zip(order_before, order_after):
+        assert sorted(map(tuple, uvs_before[a])) == pytest.approx(sorted(map(tuple, uvs_after[b])))
+
+
+def test_replay_after_revert(history, add_cube):
+    cube = add_cube("Cube")
+    with record_cut(bpy.context, cube, "Cut"):
+        _cut_corner(cube.data)
+    cut_keys = set(face_keys(read_faces(cube.data)))
+
+    assert revert_cut(cube, cube.booleans.cuts[0]) == 0
+    assert replay_cut(cube, cube.booleans.cuts[0]) == 0
+    assert set(face_keys(read_faces(cube.data))) == cut_keys
+
+
+def test_revert_leaves_changed_mesh_untouched(history, add_cube):
+    cube = add_cube("Cube")
+    with record_cut(bpy.context, cube, "Cut"):
+        _cut_corner(cube.data)
+
+    # Later edit changes faces that the cut added.
+    for vert in cube.data.vertices:
+        if vert.co.x > 0.2:
+            vert.co.z += 0.1
+    faces = read_faces(cube.data)
+
+    assert revert_cut(cube, cube.booleans.cuts[0]) > 0
+    assert np.array_equal(read_faces(cube.data)["corners"], faces["corners"])
+
+
+def test_revert_operator_keeps_cut_when_faces_are_missing(history, add_cube):
+    cube = add_cube("Cube")
+    bpy.context.view_layer.objects.active = cube
+    with record_cut(bpy.context, cube, "Cut"):
+        _cut_corner(cube.data)
+    cube.data.vertices[0].co.z += 0.1
+    cube.data.vertices[-1].co.z += 0.1
+
+    result = bpy.ops.object.boolean_revert_cut(index=0)
+
+    assert result == {'CANCELLED'}
+    assert not cube.booleans.cuts[0].reverted
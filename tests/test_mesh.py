@@ -0,0 +1,128 @@
+import bmesh
+import bpy
+import numpy as np
+from mathutils import Matrix, Vector
+
+from bool_tool.functions.mesh import (
+    get_triangle_buffers,
+    write_faces,
+    write_vertex_positions,
+)
+
+
+def test_triangle_buffers_are_in_world_space(add_cube):
+    cube = add_cube("Cube", size=2.0)
+    matrix = Matrix.Translation((1, 2, 3)) @ Matrix.Diagonal((2, 1, 1, 1))
+
+    vertices, indices = get_triangle_buffers(cube.data, matrix)
+
+    assert vertices.dtype == np.float32 and vertices.flags['C_CONTIGUOUS']
+    assert indices.dtype == np.int32
+    assert vertices.shape == (8, 3)
+    assert indices.shape == (12, 3)
+    assert np.allclose(vertices.min(axis=0), (-1, 1, 2))
+    assert np.allclose(vertices.max(axis=0), (3, 3, 4))
+
+
+def test_triangle_buffers_split_ngons(scene):
+    mesh = bpy.data.meshes.new("Hexagon")
+    mesh.from_pydata([(np.cos(a), np.sin(a), 0) for a in np.linspace(0, 2 * np.pi, 6, endpoint=False)],
+                     [], [range(6)])
+
+    vertices, indices = get_triangle_buffers(mesh, Matrix())
+
+    assert len(indices) == 4
+    assert set(indices.ravel()) == set(range(6))
+
+
+def test_triangle_buffers_of_mesh_without_faces(scene):
+    mesh = bpy.data.meshes.new("Edge")
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0)], [(0, 1)], [])
+
+    assert get_triangle_buffers(mesh, Matrix()) == (None, None)
+
+
+def test_write_faces_keeps_attributes_and_reuses_mesh(scene):
+    bpy.ops.mesh.primitive_uv_sphere_add()
+    mesh = bpy.context.object.data
+    mesh.polygons[0].use_smooth = False
+    mask = np.zeros(len(mesh.polygons), dtype=bool)
+    mask[:10] = True
+
+    target = bpy.data.meshes.new("Target")
+    write_faces(mesh, mask, target)
+
+    assert len(target.polygons) == 10
+    assert "UVMap" in target.uv_layers
+    assert not target.polygons[0].use_smooth
+
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers["UVMap"].data.foreach_get("uv", uvs)
+    target_uvs = np.empty(len(target.loops) * 2, dtype=np.float32)
+    target.uv_layers["UVMap"].data.foreach_get("uv", target_uvs)
+    corners = np.repeat(mask, [face.loop_total for face in mesh.polygons])
+    assert np.allclose(uvs.reshape(-1, 2)[corners], target_uvs.reshape(-1, 2))
+
+    meshes = len(bpy.data.meshes)
+    write_faces(mesh, ~mask, target)
+
+    assert len(target.polygons) == len(mesh.polygons) - 10
+    assert len(target.uv_layers) == 1
+    assert len(bpy.data.meshes) == meshes
+
+
+def _positions(mesh):
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    return positions.reshape(-1, 3)
+
+
+def test_vertex_positions_are_written_without_topology(add_cube):
+    mesh = add_cube("Cube").data
+    edges = [tuple(e.vertices) for e in mesh.edges]
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    for v in bm.verts:
+        v.co *= 2.0
+
+    assert write_vertex_positions(bm, mesh)
+    assert np.allclose(_positions(mesh), [tuple(v.co) for v in bm.verts])
+    assert [tuple(e.vertices) for e in mesh.edges] == edges
+    bm.free()
+
+
+def test_vertex_positions_are_not_written_after_topology_changes(add_cube):
+    mesh = add_cube("Cube").data
+    before = _positions(mesh)
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.extrude_face_region(bm, geom=bm.faces[:1])
+
+    assert not write_vertex_positions(bm, mesh)
+    assert np.array_equal(_positions(mesh), before)
+    bm.free()
+
+
+def test_cutter_mesh_is_converted_only_after_topology_edits(scene):
+    from types import SimpleNamespace
+    from bool_tool.tools.common.base import CarverBase
+    from bool_tool.tools.common.types import Cutter
+
+    mesh = bpy.data.meshes.new("Cutter")
+    bm = bmesh.new()
+    verts = [bm.verts.new(co) for co in ((0, 0, 0), (1, 0, 0), (1, 1, 0))]
+    face = bm.faces.new(verts)
+    bm.to_mesh(mesh)
+    carver = SimpleNamespace(cutter=Cutter(None, mesh, bm, [face], verts))
+
+    # Moving vertices only writes their positions.
+    verts[2].co = Vector((2, 2, 0))
+    CarverBase.update_cutter_mesh(carver)
+    assert tuple(mesh.vertices[2].co) == (2, 2, 0)
+
+    # Topology edits are converted in full.
+    bm.verts.new((0, 1, 0))
+    carver.cutter.synced = False
+    CarverBase.update_cutter_mesh(carver)
+    assert len(mesh.vertices) == 4 and carver.cutter.synced
+    bm.free()
@@ -0,0 +1,186 @@
+import bpy
+
+from bool_tool.constants import (
+    VIEWPORT_MODIFIER_SUFFIX,
+)
+from bool_tool.functions.modifier import (
+    apply_modifiers,
+    get_viewport_modifier,
+    is_modifier_enabled,
+    remove_viewport_fidelity,
+    reorder_misplaced_booleans,
+    set_viewport_fidelity,
+    solo_modifier,
+    sync_viewport_modifiers,
+    unsolo_modifier,
+)
+
+
+def add_boolean(canvas, cutter, solver='EXACT'):
+    mod = canvas.modifiers.new("boolean_" + cutter.name, 'BOOLEAN')
+    mod.object = cutter
+    mod.solver = solver
+    return mod
+
+
+def test_viewport_fidelity_keeps_solver_on_modifier(add_cube):
+    canvas = add_cube("Canvas")
+    cutter = add_cube("Cutter", size=0.5, location=(0.5, 0.5, 0.5))
+    mod = add_boolean(canvas, cutter)
+    canvas.modifiers.new("Bevel", 'BEVEL')
+    canvas.modifiers.move(1, 0)
+
+    set_viewport_fidelity(canvas, mod, 'FLOAT', 0)
+    copy = get_viewport_modifier(mod)
+
+    assert copy.name == mod.name + VIEWPORT_MODIFIER_SUFFIX
+    assert canvas.modifiers.find(copy.name) == canvas.modifiers.find(mod.name) + 1
+    assert mod.solver == 'EXACT' and copy.solver == 'FLOAT'
+    assert (mod.show_viewport, mod.show_render) == (False, True)
+    assert (copy.show_viewport, copy.show_render) == (True, False)
+    assert copy.object == cutter
+    assert is_modifier_enabled(canvas, mod)
+
+
+def test_disabled_modifier_gets_disabled_copy(add_cube):
+    canvas = add_cube("Canvas")
+    mod = add_boolean(canvas, add_cube("Cutter", size=0.5))
+    mod.show_viewport = False
+
+    set_viewport_fidelity(canvas, mod, 'FLOAT', 0)
+
+    assert not get_viewport_modifier(mod).show_viewport
+    assert not is_modifier_enabled(canvas, mod)
+
+
+def test_copy_follows_modifier(add_cube):
+    canvas = add_cube("Canvas")
+    mod = add_boolean(canvas, add_cube("Cutter", size=0.5))
+    set_viewport_fidelity(canvas, mod, 'FLOAT', 0)
+    copy = get_viewport_modifier(mod)
+
+    other = add_cube("Other", size=0.5)
+    mod.operation = 'UNION'
+    mod.object = other
+    mod.show_viewport = True
+    sync_viewport_modifiers(canvas)
+
+    assert copy.operation == 'UNION' and copy.object == other
+    assert not mod.show_viewport and copy.show_viewport
+
+    canvas.modifiers.remove(mod)
+    sync_viewport_modifiers(canvas)
+    assert len(canvas.modifiers) == 0
+
+
+def test_removing_fidelity_enables_modifier(add_cube):
+    canvas = add_cube("Canvas")
+    mod = add_boolean(canvas, add_cube("Cutter", size=0.5))
+    set_viewport_fidelity(canvas, mod, 'FLOAT', 0)
+
+    remove_viewport_fidelity(canvas)
+
+    assert [m.name for m in canvas.modifiers] == [mod.name]
+    assert mod.show_viewport and mod.solver == 'EXACT'
+    assert len(canvas.booleans.suspended_modifiers) == 0
+
+
+def test_apply_uses_modifier_and_removes_copy(add_cube):
+    canvas = add_cube("Canvas")
+    cutter = add_cube("Cutter", size=1.0, location=(0.5, 0.5, 0.5))
+    mod = add_boolean(canvas, cutter)
+    set_viewport_fidelity(canvas, mod, 'FLOAT', 0)
+
+    apply_modifiers(bpy.context, canvas, [mod], force_clean=True)
+
+    assert len(canvas.modifiers) == 0
+    assert len(canvas.booleans.suspended_modifiers) == 0
+    assert len(canvas.data.polygons) > 6
+
+
+def test_boolean_is_moved_directly_above_multiplying_modifiers(add_cube):
+    canvas = add_cube("Canvas")
+    canvas.modifiers.new("Mirror", 'MIRROR')
+    canvas.modifiers.new("Subdivision", 'SUBSURF')
+    canvas.modifiers.new("Bevel", 'BEVEL')
+    mod = add_boolean(canvas, add_cube("Cutter", size=0.5))
+
+    moved, skipped = reorder_misplaced_booleans(canvas)
+
+    assert moved == [mod] and skipped == []
+    assert [m.name for m in canvas.modifiers] == ["Mirror", mod.name, "Subdivision", "Bevel"]
+
+
+def test_boolean_is_not_moved_past_modifiers_that_change_its_input(add_cube):
+    canvas = add_cube("Canvas")
+    canvas.modifiers.new("Subdivision", 'SUBSURF')
+    array = canvas.modifiers.new("Array", 'ARRAY')
+    mod = add_boolean(canvas, add_cube("Cutter", size=0.5))
+
+    moved, skipped = reorder_misplaced_booleans(canvas)
+
+    assert moved == [] and skipped == [(mod, array)]
+    assert [m.name for m in canvas.modifiers] == ["Subdivision", "Array", mod.name]
+
+
+def test_apply_commits_last_evaluation(add_cube):
+    canvas = add_cube("Canvas")
+    cutter = add_cube("Cutter", size=0.5, location=(0.5, 0.5, 0.5))
+    mod = add_boolean(canvas, cutter)
+    bpy.context.view_layer.update()
+    evaluated = len(canvas.evaluated_get(bpy.context.view_layer.depsgraph).data.vertices)
+
+    # Changes made after the last evaluation aren't committed (caller guarantees that there aren't any)...
+    cutter.location.x += 10.0
+    apply_modifiers(bpy.context, canvas, [mod], force_clean=True, use_evaluated=True)
+
+    assert len(canvas.modifiers) == 0
+    assert len(canvas.data.vertices) == evaluated != 8
+
+
+def test_apply_evaluates_again_when_other_modifiers_are_hidden(add_cube):
+    canvas = add_cube("Canvas")
+    cutter = add_cube("Cutter", size=0.5, location=(0.5, 0.5, 0.5))
+    canvas.modifiers.new("Subdivision", 'SUBSURF')
+    mod = add_boolean(canvas, cutter)
+    canvas.modifiers.move(1, 0)
+    bpy.context.view_layer.update()
+    evaluated = len(canvas.evaluated_get(bpy.context.view_layer.depsgraph).data.vertices)
+
+    # ...but last evaluation includes other modifiers, so it can't be committed as it is.
+    apply_modifiers(bpy.context, canvas, [mod], force_clean=True, use_evaluated=True)
+
+    assert [m.name for m in canvas.modifiers] == ["Subdivision"]
+    assert len(canvas.data.vertices) < evaluated
+
+
+def test_unsolo_restores_previous_state(add_cube):
+    canvas = add_cube("Canvas")
+    first, second, third = [add_boolean(canvas, add_cube(name, size=0.5)) for name in ("A", "B", "C")]
+    second.show_viewport = False
+
+    solo_modifier(canvas, second)
+    assert [mod.show_viewport for mod in canvas.modifiers] == [False, True, False]
+    assert canvas.booleans.solo == second.name
+
+    unsolo_modifier(canvas)
+    assert [mod.show_viewport for mod in canvas.modifiers] == [True, False, True]
+    assert not canvas.booleans.solo and len(canvas.booleans.suspended_modifiers) == 0
+
+
+def test_solo_toggles_from_cutters_list(add_cube):
+    canvas = add_cube("Canvas")
+    first, second = [add_boolean(canvas, add_cube(name, size=0.5)) for name in ("A", "B")]
+    canvas.booleans.canvas = True
+
+    def toggle():
+        bpy.ops.object.boolean_toggle_cutter(method='SOLO', specified_canvas=canvas.name,
+                                             specified_modifier=second.name)
+
+    toggle()
+    assert (first.show_viewport, second.show_viewport) == (False, True)
+
+    # Toggling the soloed cutter again ends solo.
+    toggle()
+    assert (first.show_viewport, second.show_viewport) == (True, True)
+    assert not canvas.booleans.solo
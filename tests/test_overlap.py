@@ -0,0 +1,122 @@
+import math
+from types import SimpleNamespace
+
+import bmesh
+import bpy
+import numpy as np
+import pytest
+
+from bool_tool.functions.overlap import (
+    build_bounds_table,
+    find_intersecting_pairs,
+    get_oriented_bounds,
+    get_world_bounds,
+    overlap_oriented_bounds,
+    sweep_and_prune,
+)
+
+
+def _random_boxes(rng, count):
+    low = rng.uniform(-10, 10, (count, 3))
+    return low, low + rng.uniform(0, 3, (count, 3))
+
+
+def test_sweep_and_prune_matches_brute_force():
+    rng = np.random.default_rng(0)
+    bounds_a = _random_boxes(rng, 60)
+    bounds_b = _random_boxes(rng, 40)
+
+    expected = {(a, b) for a in range(60) for b in range(40)
+                if np.all(bounds_a[1][a] >= bounds_b[0][b]) and np.all(bounds_a[0][a] <= bounds_b[1][b])}
+
+    pairs = sweep_and_prune(bounds_a, bounds_b)
+
+    assert expected
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == expected
+
+
+def test_sweep_and_prune_counts_touching_boxes():
+    bounds_a = (np.array([[0.0, 0, 0]]), np.array([[1.0, 1, 1]]))
+    bounds_b = (np.array([[1.0, 0, 0], [1.1, 0, 0]]), np.array([[2.0, 1, 1], [2.0, 1, 1]]))
+
+    assert sweep_and_prune(bounds_a, bounds_b) == [(0, 0)]
+
+
+def test_sweep_and_prune_without_boxes():
+    empty = (np.zeros((0, 3)), np.zeros((0, 3)))
+    boxes = (np.zeros((1, 3)), np.ones((1, 3)))
+
+    assert sweep_and_prune(empty, boxes) == []
+    assert sweep_and_prune(boxes, empty) == []
+
+
+def test_intersecting_pairs(add_cube):
+    canvas = add_cube("Canvas", size=2.0)
+    touching = add_cube("Touching", location=(1.0, 0, 0))
+    inside = add_cube("Inside", size=0.5)
+    outside = add_cube("Outside", location=(5.0, 0, 0))
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    pairs = find_intersecting_pairs([canvas], [touching, inside, outside], depsgraph)
+
+    assert pairs == {(canvas, touching), (canvas, inside)}
+
+
+def test_cutter_with_many_faces_inside_canvas(add_cube):
+    canvas = add_cube("Canvas", size=0.5)
+    cutter = add_cube("Cutter", size=2.0)
+    cutter.modifiers.new("Subdivision", 'SUBSURF').levels = 2
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    assert find_intersecting_pairs([canvas], [cutter], depsgraph) == {(canvas, cutter)}
+
+
+def test_bounding_boxes_overlap_without_geometry(add_cube):
+    canvas = add_cube("Canvas")
+    cutter = add_cube("Cutter", location=(0.62, 0.62, 0))
+    cutter.rotation_euler = (0, 0, 0.785)
+    cutter.scale = (0.2, 0.2, 0.2)
+    bpy.context.view_layer.update()
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    assert sweep_and_prune(get_world_bounds([canvas]), get_world_bounds([cutter])) == [(0, 0)]
+    assert find_intersecting_pairs([canvas], [cutter], depsgraph) == set()
+
+
+def test_oriented_bounds_of_rotated_cutter(add_cube):
+    canvas = add_cube("Canvas")
+    other = add_cube("Other", location=(2.4, 2.4, 0))
+    cutter = add_cube("Cutter", location=(1.2, 1.2, 0))
+    cutter.scale = (4.0, 0.1, 0.1)
+    cutter.rotation_euler.z = -math.pi / 4
+    bpy.context.view_layer.update()
+    table = build_bounds_table([canvas, other])
+
+    # Axis-aligned box of the cutter overlaps both canvases, but the cutter only passes between them.
+    low, high = get_world_bounds([cutter])
+    assert np.all(low[0][:2] <= 0.5) and np.all(high[0][:2] >= 1.9)
+    assert list(overlap_oriented_bounds(get_oriented_bounds(cutter), table)) == [False, False]
+
+    cutter.location = (0.5, 0.5, 0)
+    bpy.context.view_layer.update()
+    assert list(overlap_oriented_bounds(get_oriented_bounds(cutter), table)) == [True, False]
+
+
+def test_cutter_extent_includes_array_duplicates(scene):
+    from bool_tool.tools.common.base import CarverBase
+
+    bm = bmesh.new()
+    for co in ((-0.5, -0.5, 0), (0.5, -0.5, 0), (0.5, 0.5, 0), (-0.5, 0.5, 0)):
+        bm.verts.new(co)
+    carver = SimpleNamespace(cutter=SimpleNamespace(bm=bm), effects=SimpleNamespace(array=None),
+                             columns=3, rows=1, gap=1.1)
+
+    low, high = CarverBase._get_cutter_extent(carver)
+    assert (tuple(low), tuple(high)) == ((-0.5, -0.5, 0), (0.5, 0.5, 0))
+
+    carver.effects.array = True
+    low, high = CarverBase._get_cutter_extent(carver)
+    assert tuple(low) == pytest.approx((-2.7, -0.5, 0))
+    assert tuple(high) == pytest.approx((2.7, 0.5, 0))
+    bm.free()